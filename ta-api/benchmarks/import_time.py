@@ -0,0 +1,60 @@
+import re
+import subprocess
+import sys
+
+TARGET_MODULES = (
+    "ta_api.routers.account",
+    "ta_api.routers.admin",
+    "ta_api.routers.auth",
+    "ta_api.routers.event",
+    "ta_api.routers.verify",
+    "main",
+    # Paid only by the first PUT /events/attend/forecast call
+    "ta_ml.forecast.attendance",
+)
+HEAVY_MODULES = ("ta_ml.forecast", "timesfm", "torch", "pandas", "statsmodels")
+REPEAT = 3
+
+_IMPORT_TIME_PATTERN = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s+)(?P<name>\S+)$"
+)
+
+
+def measure_import_time(module: str) -> tuple[float, list[str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    heavy_modules = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        total_us += int(match.group("self"))
+        name = match.group("name")
+        for heavy_module in HEAVY_MODULES:
+            if name == heavy_module or name.startswith(f"{heavy_module}."):
+                heavy_modules.add(heavy_module)
+    return total_us / 1000, sorted(heavy_modules)
+
+
+def main() -> None:
+    print(f"{'module':<28} {'import[ms]':>11}  heavy modules")
+    for module in TARGET_MODULES:
+        try:
+            measurements = [measure_import_time(module) for _ in range(REPEAT)]
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<28} {'failed':>11}  {e.stderr.strip().splitlines()[-1]}")
+            continue
+        import_time_ms = min(total for total, _ in measurements)
+        heavy_modules = measurements[0][1]
+        print(
+            f"{module:<28} {import_time_ms:>11.1f}  {', '.join(heavy_modules) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
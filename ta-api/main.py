@@ -1,13 +1,27 @@
-from typing import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
 
 from fastapi import FastAPI, Request, Response, status
 from mangum import Mangum
 from starlette.middleware.base import BaseHTTPMiddleware
+from ta_core.cryptography.hash import shutdown_password_hash_executor
 
-from ta_api.constants import ALLOWED_ORIGINS
+from ta_api.constants import ALLOWED_ORIGINS, TIMESFM_WARMUP
 from ta_api.routers import account, admin, auth, event, verify
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if TIMESFM_WARMUP:
+        # 最初の予測リクエストでチェックポイントを読み込まないよう起動時に読み込んでおく
+        from ta_ml.api.timesfm import timesfm_registry
+
+        timesfm_registry.get()
+    yield
+    shutdown_password_hash_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 class CORSMiddleware(BaseHTTPMiddleware):
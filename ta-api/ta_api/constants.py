@@ -8,6 +8,7 @@ _FRONTEND_URLS = os.getenv("FRONTEND_URLS")
 assert _FRONTEND_URLS, "FRONTEND_URLS environment variable must be set"
 ALLOWED_ORIGINS = _FRONTEND_URLS.split(",")
 COOKIE_DOMAIN = os.getenv("COOKIE_DOMAIN")
+TIMESFM_WARMUP = os.getenv("TIMESFM_WARMUP", "false").lower() == "true"
 
 ACCESS_TOKEN_NAME = "acctkn"
 REFRESH_TOKEN_NAME = "reftkn"
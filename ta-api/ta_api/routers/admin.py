@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from ta_core.dtos.admin import ResetAuroraResponse
 from ta_core.infrastructure.sqlalchemy.migrate_db import reset_aurora_db
 
-from ta_api.routers.admin_router import migration
+from ta_api.routers.admin_router import auth, db, migration
 
 router = APIRouter()
 
@@ -12,6 +12,18 @@ router.include_router(
     tags=["migration"],
 )
 
+router.include_router(
+    db.router,
+    prefix="/db",
+    tags=["db"],
+)
+
+router.include_router(
+    auth.router,
+    prefix="/auth",
+    tags=["auth"],
+)
+
 
 # TODO: JWT で認証されたユーザーのみがこのエンドポイントを呼び出せるようにする
 @router.post(
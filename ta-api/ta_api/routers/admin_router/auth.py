@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from ta_core.cryptography.hash import get_password_hash_pool_status
+from ta_core.dtos.admin_dto.auth import GetPasswordHasherResponse, PasswordHasherStatus
+
+router = APIRouter()
+
+
+# TODO: JWT で認証されたユーザーのみがこのエンドポイントを呼び出せるようにする
+@router.get(
+    path="/password-hasher",
+    name="Get Password Hasher",
+    response_model=GetPasswordHasherResponse,
+)
+def get_password_hasher() -> GetPasswordHasherResponse:
+    status = get_password_hash_pool_status()
+    return GetPasswordHasherResponse(
+        password_hasher=PasswordHasherStatus(
+            max_workers=status.max_workers,
+            queue_depth=status.queue_depth,
+            in_flight=status.in_flight,
+            submitted=status.metrics.submitted,
+            completed=status.metrics.completed,
+            max_queue_depth=status.metrics.max_queue_depth,
+            total_wait_seconds=status.metrics.total_wait_seconds,
+            max_wait_seconds=status.metrics.max_wait_seconds,
+        ),
+        error_codes=(),
+    )
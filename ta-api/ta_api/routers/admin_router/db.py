@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+from ta_core.dtos.admin_dto.db import DbPoolStatus, GetDbPoolsResponse
+from ta_core.infrastructure.sqlalchemy.db import get_pool_statuses
+
+router = APIRouter()
+
+
+# TODO: JWT で認証されたユーザーのみがこのエンドポイントを呼び出せるようにする
+@router.get(
+    path="/pools",
+    name="Get DB Pools",
+    response_model=GetDbPoolsResponse,
+)
+def get_db_pools() -> GetDbPoolsResponse:
+    pools = [
+        DbPoolStatus(
+            connection_key=connection_key,
+            size=status.size,
+            checked_in=status.checked_in,
+            checked_out=status.checked_out,
+            overflow=status.overflow,
+            connects=status.metrics.connects,
+            checkouts=status.metrics.checkouts,
+            checkins=status.metrics.checkins,
+            overflow_connects=status.metrics.overflow_connects,
+            timeouts=status.metrics.timeouts,
+            total_wait_seconds=status.metrics.total_wait_seconds,
+            max_wait_seconds=status.metrics.max_wait_seconds,
+        )
+        for connection_key, status in get_pool_statuses().items()
+    ]
+    return GetDbPoolsResponse(pools=pools, error_codes=())
@@ -1,18 +1,23 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from ta_core.constants.constants import EVENT_PAGE_DEFAULT_SIZE, EVENT_PAGE_MAX_SIZE
 from ta_core.dtos.event import (
     AttendEventRequest,
     AttendEventResponse,
+    BatchAttendEventRequest,
+    BatchAttendEventResponse,
     CreateEventRequest,
     CreateEventResponse,
     ForecastAttendanceTimeResponse,
     GetAttendanceHistoryResponse,
     GetAttendanceTimeForecastsResponse,
+    GetEventOccurrencesResponse,
     GetFollowingEventsResponse,
     GetGuestAttendanceStatusResponse,
     GetMyEventsResponse,
+    MaterializeEventOccurrencesResponse,
     UpdateAttendancesRequest,
     UpdateAttendancesResponse,
 )
@@ -72,6 +77,27 @@ async def attend_event(
     )
 
 
+@router.post(
+    path="/attend/batch",
+    name="Batch Attend Event",
+    response_model=BatchAttendEventResponse,
+)
+async def batch_attend_event(
+    req: BatchAttendEventRequest,
+    session: AsyncSession = Depends(get_db_async),
+    account: Account = Depends(AccessControl(permit={Role.HOST})),
+) -> BatchAttendEventResponse:
+    attendances = req.attendances
+
+    uow = SqlalchemyUnitOfWork(session=session)
+    use_case = EventUseCase(uow=uow)
+
+    return await use_case.batch_attend_event_async(
+        host_id=account.account_id,
+        attendances=attendances,
+    )
+
+
 @router.put(
     path="/attend/{event_id}/{start}",
     name="Update Guest Attendance History",
@@ -124,13 +150,21 @@ async def get_attendance_history(
     response_model=GetMyEventsResponse,
 )
 async def get_my_events(
+    cursor: str | None = None,
+    updated_since: datetime | None = None,
+    limit: int = Query(EVENT_PAGE_DEFAULT_SIZE, ge=1, le=EVENT_PAGE_MAX_SIZE),
     session: AsyncSession = Depends(get_db_async),
     account: Account = Depends(AccessControl(permit={Role.HOST})),
 ) -> GetMyEventsResponse:
     uow = SqlalchemyUnitOfWork(session=session)
     use_case = EventUseCase(uow=uow)
 
-    return await use_case.get_my_events_async(account_id=account.account_id)
+    return await use_case.get_my_events_async(
+        account_id=account.account_id,
+        cursor=cursor,
+        updated_since=updated_since,
+        limit=limit,
+    )
 
 
 @router.get(
@@ -139,13 +173,58 @@ async def get_my_events(
     response_model=GetFollowingEventsResponse,
 )
 async def get_following_events(
+    cursor: str | None = None,
+    updated_since: datetime | None = None,
+    limit: int = Query(EVENT_PAGE_DEFAULT_SIZE, ge=1, le=EVENT_PAGE_MAX_SIZE),
     session: AsyncSession = Depends(get_db_async),
     account: Account = Depends(AccessControl(permit={Role.GUEST})),
 ) -> GetFollowingEventsResponse:
     uow = SqlalchemyUnitOfWork(session=session)
     use_case = EventUseCase(uow=uow)
 
-    return await use_case.get_following_events_async(follower_id=account.account_id)
+    return await use_case.get_following_events_async(
+        follower_id=account.account_id,
+        cursor=cursor,
+        updated_since=updated_since,
+        limit=limit,
+    )
+
+
+@router.get(
+    path="/occurrences",
+    name="Get Event Occurrences",
+    response_model=GetEventOccurrencesResponse,
+)
+async def get_event_occurrences(
+    start_from: datetime = Query(..., alias="from"),
+    start_to: datetime = Query(..., alias="to"),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_db_async),
+    account: Account = Depends(AccessControl(permit={Role.GUEST})),
+) -> GetEventOccurrencesResponse:
+    uow = SqlalchemyUnitOfWork(session=session)
+    use_case = EventUseCase(uow=uow)
+
+    return await use_case.get_event_occurrences_async(
+        account_id=account.account_id,
+        start_from=start_from,
+        start_to=start_to,
+        cursor=cursor,
+    )
+
+
+@router.put(
+    path="/occurrences",
+    name="Materialize Event Occurrences",
+    response_model=MaterializeEventOccurrencesResponse,
+)
+async def materialize_event_occurrences(
+    session: AsyncSession = Depends(get_db_async),
+) -> MaterializeEventOccurrencesResponse:
+    uow = SqlalchemyUnitOfWork(session=session)
+    use_case = EventUseCase(uow=uow)
+
+    return await use_case.materialize_event_occurrences_async()
 
 
 @router.get(
@@ -175,12 +254,13 @@ async def get_guest_attendance_status(
     response_model=ForecastAttendanceTimeResponse,
 )
 async def forecast_attendance_time(
+    incremental: bool = False,
     session: AsyncSession = Depends(get_db_async),
 ) -> ForecastAttendanceTimeResponse:
     uow = SqlalchemyUnitOfWork(session=session)
     use_case = EventUseCase(uow=uow)
 
-    return await use_case.forecast_attendance_time_async()
+    return await use_case.forecast_attendance_time_async(incremental=incremental)
 
 
 @router.get(
@@ -0,0 +1,102 @@
+import gc
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable
+
+from ta_core.domain.entities.event import (
+    EventAttendanceActionLog as EventAttendanceActionLogEntity,
+)
+from ta_core.domain.entities.event import (
+    EventAttendanceForecast as EventAttendanceForecastEntity,
+)
+from ta_core.features.event import AttendanceAction
+from ta_core.utils.uuid import UUID, generate_uuid
+
+ENTITY_COUNT = 100_000
+
+
+class _DictEventAttendanceActionLog:
+    # The layout entities had before __slots__ was declared
+    def __init__(
+        self,
+        entity_id: UUID,
+        user_id: int,
+        event_id: UUID,
+        start: datetime,
+        action: AttendanceAction,
+        acted_at: datetime,
+    ) -> None:
+        self.id = entity_id
+        self.user_id = user_id
+        self.event_id = event_id
+        self.start = start
+        self.action = action
+        self.acted_at = acted_at
+
+
+class _DictEventAttendanceForecast:
+    def __init__(
+        self,
+        entity_id: UUID,
+        user_id: int,
+        event_id: UUID,
+        start: datetime,
+        forecasted_attended_at: datetime,
+        forecasted_duration: int,
+    ) -> None:
+        self.id = entity_id
+        self.user_id = user_id
+        self.event_id = event_id
+        self.start = start
+        self.forecasted_attended_at = forecasted_attended_at
+        self.forecasted_duration = forecasted_duration
+
+
+def _measure_bytes_per_entity(create: Callable[[], Any]) -> float:
+    # Field values are shared so only the per-instance layout is measured
+    gc.collect()
+    tracemalloc.start()
+    entities = [create() for _ in range(ENTITY_COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return size / ENTITY_COUNT
+
+
+def main() -> None:
+    entity_id = generate_uuid()
+    event_id = generate_uuid()
+    now = datetime(2024, 1, 1)
+    cases: tuple[tuple[str, Callable[[], Any], Callable[[], Any]], ...] = (
+        (
+            "EventAttendanceActionLog",
+            lambda: _DictEventAttendanceActionLog(
+                entity_id, 1, event_id, now, AttendanceAction.ATTEND, now
+            ),
+            lambda: EventAttendanceActionLogEntity(
+                entity_id, 1, event_id, now, AttendanceAction.ATTEND, now
+            ),
+        ),
+        (
+            "EventAttendanceForecast",
+            lambda: _DictEventAttendanceForecast(
+                entity_id, 1, event_id, now, now, 3600
+            ),
+            lambda: EventAttendanceForecastEntity(
+                entity_id, 1, event_id, now, now, 3600
+            ),
+        ),
+    )
+    print(f"entities={ENTITY_COUNT}")
+    print(f"{'entity':>25} {'__dict__[B]':>12} {'__slots__[B]':>13} {'saved':>6}")
+    for name, create_dict, create_slots in cases:
+        dict_size = _measure_bytes_per_entity(create_dict)
+        slots_size = _measure_bytes_per_entity(create_slots)
+        print(
+            f"{name:>25} {dict_size:>12.1f} {slots_size:>13.1f} "
+            f"{1 - slots_size / dict_size:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from ta_core.cryptography.hash import (
+    PasswordHasher,
+    get_password_hash_pool_status,
+    shutdown_password_hash_executor,
+)
+
+LOGIN_COUNTS = (8, 32)
+PROBE_INTERVAL_SECONDS = 0.01
+PASSWORD = "password"
+
+password_hasher = PasswordHasher()
+hashed_password = password_hasher.get_password_hash(PASSWORD)
+
+
+async def _sync_login_async() -> None:
+    # How AuthUseCase.auth_user_async verified passwords before
+    password_hasher.verify_password(PASSWORD, hashed_password)
+
+
+async def _async_login_async() -> None:
+    await password_hasher.verify_password_async(PASSWORD, hashed_password)
+
+
+async def _probe_async(latencies: list[float], stop: asyncio.Event) -> None:
+    # Stands in for an unrelated endpoint that only awaits I/O
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        latencies.append(time.perf_counter() - started_at - PROBE_INTERVAL_SECONDS)
+
+
+async def _measure_async(
+    login: Callable[[], Awaitable[None]], login_count: int
+) -> tuple[float, float, float]:
+    latencies: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_async(latencies, stop))
+    await asyncio.sleep(0)
+    started_at = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(login_count)))
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await probe
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else p50
+    return elapsed, p50, p99
+
+
+async def main_async() -> None:
+    print(f"probe interval={PROBE_INTERVAL_SECONDS * 1000:.0f}ms")
+    print(
+        f"{'logins':>6} {'mode':>6} {'logins/s':>9} "
+        f"{'probe p50[ms]':>14} {'probe p99[ms]':>14}"
+    )
+    for login_count in LOGIN_COUNTS:
+        for mode, login in (("sync", _sync_login_async), ("async", _async_login_async)):
+            elapsed, p50, p99 = await _measure_async(login, login_count)
+            print(
+                f"{login_count:>6} {mode:>6} {login_count / elapsed:>9.1f} "
+                f"{p50 * 1000:>14.1f} {p99 * 1000:>14.1f}"
+            )
+    status = get_password_hash_pool_status()
+    print(
+        f"workers={status.max_workers} "
+        f"max queue depth={status.metrics.max_queue_depth} "
+        f"max wait={status.metrics.max_wait_seconds * 1000:.0f}ms"
+    )
+    shutdown_password_hash_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async())
@@ -0,0 +1,118 @@
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from sqlalchemy.engine import create_engine
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql import insert, select, text
+
+from ta_core.dtos.event import AttendanceTimeForecast as AttendanceTimeForecastDto
+from ta_core.infrastructure.sqlalchemy.models.shards.event import (
+    EventAttendanceForecast,
+)
+from ta_core.utils.uuid import bin_to_uuid, generate_uuid, uuid_to_bin, uuid_to_str
+
+ROW_COUNTS = (1_000, 10_000, 100_000)
+EVENT_COUNT = 100
+REPEAT = 3
+
+
+def _populate(session: Session, row_count: int) -> None:
+    # An in-memory SQLite table keeps the comparison about per-row Python overhead
+    session.execute(
+        text(
+            "CREATE TABLE event_attendance_forecast ("
+            "id BLOB PRIMARY KEY, user_id INTEGER, event_id BLOB, start DATETIME, "
+            "forecasted_attended_at DATETIME, forecasted_duration INTEGER, "
+            "created_at DATETIME, updated_at DATETIME)"
+        )
+    )
+    event_ids = [uuid_to_bin(generate_uuid()) for _ in range(EVENT_COUNT)]
+    start = datetime(2024, 1, 1)
+    session.execute(
+        insert(EventAttendanceForecast),
+        [
+            {
+                "id": uuid_to_bin(generate_uuid()),
+                "user_id": i % 1000,
+                "event_id": random.choice(event_ids),
+                "start": start + timedelta(days=i),
+                "forecasted_attended_at": start + timedelta(days=i, minutes=5),
+                "forecasted_duration": 3600,
+                "created_at": start,
+                "updated_at": start,
+            }
+            for i in range(row_count)
+        ],
+    )
+
+
+def _read_entities(session: Session) -> list[tuple[str, int, Any]]:
+    records = session.execute(select(EventAttendanceForecast)).scalars().all()
+    forecasts = [record.to_entity() for record in records]
+    result = [
+        (
+            uuid_to_str(forecast.event_id),
+            forecast.user_id,
+            AttendanceTimeForecastDto(
+                start=forecast.start,
+                attended_at=forecast.forecasted_attended_at,
+                duration=forecast.forecasted_duration,
+            ),
+        )
+        for forecast in forecasts
+    ]
+    session.expunge_all()
+    return result
+
+
+def _read_rows(session: Session) -> list[tuple[str, int, Any]]:
+    rows = session.execute(
+        select(
+            EventAttendanceForecast.event_id,
+            EventAttendanceForecast.user_id,
+            EventAttendanceForecast.start,
+            EventAttendanceForecast.forecasted_attended_at,
+            EventAttendanceForecast.forecasted_duration,
+        )
+    ).all()
+    return [
+        (
+            uuid_to_str(bin_to_uuid(event_id)),
+            user_id,
+            AttendanceTimeForecastDto(
+                start=start, attended_at=attended_at, duration=duration
+            ),
+        )
+        for event_id, user_id, start, attended_at, duration in rows
+    ]
+
+
+def _measure(
+    session: Session, read: Callable[[Session], list[tuple[str, int, Any]]]
+) -> float:
+    elapsed = 0.0
+    for _ in range(REPEAT):
+        started_at = time.perf_counter()
+        read(session)
+        elapsed += time.perf_counter() - started_at
+    return elapsed / REPEAT
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'entity[rows/s]':>15} {'projection[rows/s]':>19} {'ratio':>6}")
+    for row_count in ROW_COUNTS:
+        with Session(create_engine("sqlite://")) as session:
+            _populate(session, row_count)
+            assert _read_entities(session) == _read_rows(session)
+            entity = _measure(session, _read_entities)
+            projection = _measure(session, _read_rows)
+        print(
+            f"{row_count:>8} {row_count / entity:>15,.0f} "
+            f"{row_count / projection:>19,.0f} {entity / projection:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
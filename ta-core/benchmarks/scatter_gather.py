@@ -0,0 +1,117 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+
+from ta_core.infrastructure.db.sharding import merge_sorted_shard_results
+
+SHARD_COUNTS = (1, 2, 4, 8, 16)
+SHARD_LATENCY_SECONDS = 0.02
+ROWS_PER_SHARD = 10_000
+LIMIT = 100
+REPEAT = 5
+
+
+@dataclass(frozen=True)
+class Record:
+    user_id: int
+    acted_at: float
+
+
+def _build_shard_rows(shard_id: int, shard_count: int) -> list[Record]:
+    rows = [
+        Record(user_id=shard_id + shard_count * i, acted_at=random.random())
+        for i in range(ROWS_PER_SHARD)
+    ]
+    rows.sort(key=attrgetter("acted_at"), reverse=True)
+    return rows
+
+
+async def _query_shard_async(rows: list[Record], limit: int | None) -> list[Record]:
+    # Emulates one round trip to a shard database
+    await asyncio.sleep(SHARD_LATENCY_SECONDS)
+    return rows[:limit]
+
+
+async def _sequential_async(
+    shard_rows: list[list[Record]], limit: int | None
+) -> list[list[Record]]:
+    return [await _query_shard_async(rows, limit) for rows in shard_rows]
+
+
+async def _concurrent_async(
+    shard_rows: list[list[Record]], limit: int | None
+) -> list[list[Record]]:
+    return list(
+        await asyncio.gather(*(_query_shard_async(rows, limit) for rows in shard_rows))
+    )
+
+
+def _sort_all(shard_results: list[list[Record]]) -> list[Record]:
+    records = [record for result in shard_results for record in result]
+    records.sort(key=attrgetter("acted_at"), reverse=True)
+    return records[:LIMIT]
+
+
+def _k_way_merge(shard_results: list[list[Record]]) -> list[Record]:
+    return merge_sorted_shard_results(
+        shard_results, key=attrgetter("acted_at"), descending=True, limit=LIMIT
+    )
+
+
+async def _measure_async(shard_count: int) -> tuple[float, float, float, float]:
+    shard_rows = [
+        _build_shard_rows(shard_id, shard_count) for shard_id in range(shard_count)
+    ]
+    sequential = concurrent = sort_all = k_way_merge = 0.0
+    for _ in range(REPEAT):
+        started_at = time.perf_counter()
+        shard_results = await _sequential_async(shard_rows, None)
+        _sort_all(shard_results)
+        sequential += time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        shard_results = await _concurrent_async(shard_rows, LIMIT)
+        _k_way_merge(shard_results)
+        concurrent += time.perf_counter() - started_at
+
+        shard_results = await _concurrent_async(shard_rows, None)
+        started_at = time.perf_counter()
+        expected = _sort_all(shard_results)
+        sort_all += time.perf_counter() - started_at
+
+        shard_results = await _concurrent_async(shard_rows, LIMIT)
+        started_at = time.perf_counter()
+        actual = _k_way_merge(shard_results)
+        k_way_merge += time.perf_counter() - started_at
+        assert actual == expected
+    return (
+        sequential / REPEAT,
+        concurrent / REPEAT,
+        sort_all / REPEAT,
+        k_way_merge / REPEAT,
+    )
+
+
+async def main_async() -> None:
+    print(
+        f"latency/shard={SHARD_LATENCY_SECONDS * 1000:.0f}ms "
+        f"rows/shard={ROWS_PER_SHARD} limit={LIMIT}"
+    )
+    print(
+        f"{'shards':>6} {'sequential[ms]':>15} {'scatter[ms]':>12} "
+        f"{'sort all[ms]':>13} {'k-way merge[ms]':>16}"
+    )
+    for shard_count in SHARD_COUNTS:
+        sequential, concurrent, sort_all, k_way_merge = await _measure_async(
+            shard_count
+        )
+        print(
+            f"{shard_count:>6} {sequential * 1000:>15.2f} {concurrent * 1000:>12.2f} "
+            f"{sort_all * 1000:>13.2f} {k_way_merge * 1000:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async())
@@ -19,3 +19,39 @@ AURORA_COMMON_DBNAME = os.getenv("AURORA_COMMON_DBNAME")
 AURORA_SEQUENCE_DBNAME = os.getenv("AURORA_SEQUENCE_DBNAME")
 AURORA_SHARD_DBNAME_PREFIX = os.getenv("AURORA_SHARD_DBNAME_PREFIX")
 CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH")
+AUTH_PRINCIPAL_CACHE_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "10000"))
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS = float(
+    os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "60")
+)
+# Accepts signed access-token claims for their whole lifetime without checking
+# that the account still exists
+AUTH_TRUST_ACCESS_TOKEN_CLAIMS = os.getenv(
+    "AUTH_TRUST_ACCESS_TOKEN_CLAIMS", "false"
+).lower() in ("1", "true", "yes", "on")
+# 0 uses min(4, CPU count) threads
+PASSWORD_HASH_MAX_WORKERS = int(os.getenv("PASSWORD_HASH_MAX_WORKERS", "0"))
+# IDs reserved from a sequence table per round trip. Unused IDs of a block are
+# skipped when the process exits
+SEQUENCE_ID_BLOCK_SIZE = int(os.getenv("SEQUENCE_ID_BLOCK_SIZE", "100"))
+ATTEND_EVENT_BATCH_MAX_SIZE = int(os.getenv("ATTEND_EVENT_BATCH_MAX_SIZE", "1000"))
+# Occurrences of events are materialized this far ahead of the current time
+EVENT_OCCURRENCE_HORIZON_DAYS = int(os.getenv("EVENT_OCCURRENCE_HORIZON_DAYS", "365"))
+# Caps the occurrences materialized per event in one pass, so that sub-daily rules
+# catch up over several passes
+EVENT_OCCURRENCE_MAX_COUNT = int(os.getenv("EVENT_OCCURRENCE_MAX_COUNT", "10000"))
+# Occurrences materialized by the request that creates an event. The materialize
+# job extends them up to the horizon
+EVENT_OCCURRENCE_CREATE_MAX_COUNT = int(
+    os.getenv("EVENT_OCCURRENCE_CREATE_MAX_COUNT", "100")
+)
+EVENT_OCCURRENCE_QUERY_MAX_COUNT = int(
+    os.getenv("EVENT_OCCURRENCE_QUERY_MAX_COUNT", "10000")
+)
+RECURRENCE_CACHE_SIZE = int(os.getenv("RECURRENCE_CACHE_SIZE", "10000"))
+EVENT_PAGE_DEFAULT_SIZE = int(os.getenv("EVENT_PAGE_DEFAULT_SIZE", "100"))
+EVENT_PAGE_MAX_SIZE = int(os.getenv("EVENT_PAGE_MAX_SIZE", "1000"))
+FOLLOW_GRAPH_CACHE_SIZE = int(os.getenv("FOLLOW_GRAPH_CACHE_SIZE", "100000"))
+# Bounds how long other processes can serve follows changed by this one
+FOLLOW_GRAPH_CACHE_TTL_SECONDS = float(
+    os.getenv("FOLLOW_GRAPH_CACHE_TTL_SECONDS", "60")
+)
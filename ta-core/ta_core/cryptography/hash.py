@@ -1,11 +1,102 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import ERROR, getLogger
+from typing import Callable, TypeVar
 
 from passlib.context import CryptContext
 
+from ta_core.constants.constants import PASSWORD_HASH_MAX_WORKERS
+
 # https://github.com/pyca/bcrypt/issues/684 への対応
 getLogger("passlib").setLevel(ERROR)
 
+_T = TypeVar("_T")
+
+
+@dataclass
+class PasswordHashMetrics:
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class PasswordHashPoolStatus:
+    max_workers: int
+    queue_depth: int
+    in_flight: int
+    metrics: PasswordHashMetrics
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_metrics = PasswordHashMetrics()
+_metrics_lock = threading.Lock()
+
+
+def _get_max_workers() -> int:
+    return PASSWORD_HASH_MAX_WORKERS or min(4, os.cpu_count() or 1)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # bcrypt releases the GIL, so threads hash in parallel off the event loop
+            _executor = ThreadPoolExecutor(
+                max_workers=_get_max_workers(), thread_name_prefix="password-hash"
+            )
+        return _executor
+
+
+def shutdown_password_hash_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def get_password_hash_pool_status() -> PasswordHashPoolStatus:
+    with _metrics_lock:
+        metrics = PasswordHashMetrics(**vars(_metrics))
+    return PasswordHashPoolStatus(
+        max_workers=_get_max_workers(),
+        queue_depth=metrics.submitted - metrics.started,
+        in_flight=metrics.started - metrics.completed,
+        metrics=metrics,
+    )
+
+
+async def _run_in_executor_async(func: Callable[..., _T], *args: str) -> _T:
+    submitted_at = time.perf_counter()
+    with _metrics_lock:
+        _metrics.submitted += 1
+        _metrics.max_queue_depth = max(
+            _metrics.max_queue_depth, _metrics.submitted - _metrics.started
+        )
+
+    def run() -> _T:
+        wait_seconds = time.perf_counter() - submitted_at
+        with _metrics_lock:
+            _metrics.started += 1
+            _metrics.total_wait_seconds += wait_seconds
+            _metrics.max_wait_seconds = max(_metrics.max_wait_seconds, wait_seconds)
+        try:
+            return func(*args)
+        finally:
+            with _metrics_lock:
+                _metrics.completed += 1
+
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), run)
+
 
 @dataclass(frozen=True)
 class PasswordHasher:
@@ -16,3 +107,13 @@ class PasswordHasher:
 
     def get_password_hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await _run_in_executor_async(
+            self.verify_password, plain_password, hashed_password
+        )
+
+    async def get_password_hash_async(self, password: str) -> str:
+        return await _run_in_executor_async(self.get_password_hash, password)
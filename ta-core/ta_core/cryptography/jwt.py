@@ -10,6 +10,17 @@ from ta_core.features.auth import TokenType
 from ta_core.utils.uuid import UUID, generate_uuid, str_to_uuid, uuid_to_str
 
 
+@dataclass(frozen=True)
+class TokenClaims:
+    subject: UUID
+    group: Group
+    # None for tokens issued before jti was added, which are never cached
+    jti: str | None
+    # POSIX timestamps
+    issued_at: float
+    expires_at: float
+
+
 @dataclass(frozen=True)
 class JWTCryptography:
     secret_key: str
@@ -59,9 +70,9 @@ class JWTCryptography:
             token_type="bearer",
         )
 
-    def get_subject_and_group_from_token(
+    def get_claims_from_token(
         self, token: str, token_type: TokenType
-    ) -> tuple[UUID, Group] | None:
+    ) -> TokenClaims | None:
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             if payload.get("type") != token_type:
@@ -72,4 +83,18 @@ class JWTCryptography:
                 return None
         except JWTError:
             return None
-        return subject, group
+        return TokenClaims(
+            subject=subject,
+            group=group,
+            jti=payload.get("jti") or None,
+            issued_at=float(payload.get("iat", 0)),
+            expires_at=float(payload.get("exp", 0)),
+        )
+
+    def get_subject_and_group_from_token(
+        self, token: str, token_type: TokenType
+    ) -> tuple[UUID, Group] | None:
+        claims = self.get_claims_from_token(token, token_type)
+        if claims is None:
+            return None
+        return claims.subject, claims.group
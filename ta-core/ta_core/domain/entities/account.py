@@ -8,6 +8,22 @@ from ta_core.utils.uuid import UUID
 
 
 class UserAccount(IEntity):
+    __slots__ = (
+        "user_id",
+        "username",
+        "hashed_password",
+        "refresh_token",
+        "nickname",
+        "birth_date",
+        "gender",
+        "email",
+        "email_verified",
+        "followee_ids",
+        "followees",
+        "follower_ids",
+        "followers",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
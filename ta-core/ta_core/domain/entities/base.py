@@ -4,6 +4,10 @@ from ta_core.utils.uuid import UUID
 
 
 class IEntity(metaclass=ABCMeta):
+    # Entities are created per row, so subclasses declare __slots__ instead of
+    # carrying a per-instance __dict__
+    __slots__ = ("id",)
+
     def __init__(self, entity_id: UUID):
         self.id = entity_id
 
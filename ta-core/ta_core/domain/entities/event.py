@@ -1,12 +1,37 @@
-from datetime import datetime
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Iterator
+from zoneinfo import ZoneInfo
 
 from ta_core.domain.entities.base import IEntity
-from ta_core.features.event import AttendanceAction, AttendanceState, Frequency, Weekday
-from ta_core.utils.datetime import apply_timezone
+from ta_core.features.event import AttendanceAction, AttendanceState, Frequency
+from ta_core.features.event import Recurrence as RecurrenceFeature
+from ta_core.features.event import RecurrenceRule as RecurrenceRuleFeature
+from ta_core.features.event import Weekday
+from ta_core.utils.datetime import apply_timezone, to_utc
+from ta_core.utils.rrule import RecurrenceExpander
 from ta_core.utils.uuid import UUID
 
 
 class RecurrenceRule(IEntity):
+    __slots__ = (
+        "user_id",
+        "freq",
+        "until",
+        "count",
+        "interval",
+        "bysecond",
+        "byminute",
+        "byhour",
+        "byday",
+        "bymonthday",
+        "byyearday",
+        "byweekno",
+        "bymonth",
+        "bysetpos",
+        "wkst",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -43,8 +68,38 @@ class RecurrenceRule(IEntity):
         self.bysetpos = bysetpos
         self.wkst = wkst
 
+    def to_feature(self) -> RecurrenceRuleFeature:
+        return RecurrenceRuleFeature(
+            freq=self.freq,
+            until=self.until,
+            count=self.count,
+            interval=self.interval,
+            bysecond=tuple(self.bysecond) if self.bysecond else None,
+            byminute=tuple(self.byminute) if self.byminute else None,
+            byhour=tuple(self.byhour) if self.byhour else None,
+            byday=(
+                tuple((int(n), Weekday(str(weekday))) for n, weekday in self.byday)
+                if self.byday
+                else None
+            ),
+            bymonthday=tuple(self.bymonthday) if self.bymonthday else None,
+            byyearday=tuple(self.byyearday) if self.byyearday else None,
+            byweekno=tuple(self.byweekno) if self.byweekno else None,
+            bymonth=tuple(self.bymonth) if self.bymonth else None,
+            bysetpos=tuple(self.bysetpos) if self.bysetpos else None,
+            wkst=self.wkst,
+        )
+
 
 class Recurrence(IEntity):
+    __slots__ = (
+        "user_id",
+        "rrule_id",
+        "rrule",
+        "rdate",
+        "exdate",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -61,8 +116,27 @@ class Recurrence(IEntity):
         self.rdate = rdate
         self.exdate = exdate
 
+    def to_feature(self) -> RecurrenceFeature:
+        return RecurrenceFeature(
+            rrule=self.rrule.to_feature(),
+            rdate=tuple(date.fromisoformat(rdate) for rdate in self.rdate),
+            exdate=tuple(date.fromisoformat(exdate) for exdate in self.exdate),
+        )
+
 
 class Event(IEntity):
+    __slots__ = (
+        "user_id",
+        "summary",
+        "location",
+        "start",
+        "end",
+        "is_all_day",
+        "recurrence_id",
+        "timezone",
+        "recurrence",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -87,7 +161,78 @@ class Event(IEntity):
         self.timezone = timezone
         self.recurrence = recurrence
 
+    def get_recurrence_expander(self) -> RecurrenceExpander | None:
+        # Occurrences are expanded on the wall clock of the event's timezone, so
+        # they keep their local time across DST changes
+        if self.recurrence is None:
+            return None
+        recurrence = self.recurrence.to_feature()
+        until = recurrence.rrule.until
+        if until is not None and not self.is_all_day:
+            # UNTIL of a timed event is stored in UTC, while that of an all-day
+            # event is a local date
+            recurrence = RecurrenceFeature(
+                rrule=replace(recurrence.rrule, until=to_utc(until)),
+                rdate=recurrence.rdate,
+                exdate=recurrence.exdate,
+            )
+        dtstart = to_utc(self.start).astimezone(ZoneInfo(self.timezone))
+        return RecurrenceExpander(recurrence, dtstart)
+
+    def _from_local(self, value: datetime) -> datetime:
+        # Occurrences come back in UTC, naive when the start is naive
+        value = value.astimezone(ZoneInfo("UTC"))
+        return value.replace(tzinfo=None) if self.start.tzinfo is None else value
+
+    def iter_starts(
+        self,
+        after: datetime | None = None,
+        expander: RecurrenceExpander | None = None,
+    ) -> Iterator[datetime]:
+        expander = expander or self.get_recurrence_expander()
+        if expander is None:
+            if after is None or to_utc(self.start) >= to_utc(after):
+                yield self.start
+            return
+        local_after = (
+            to_utc(after).astimezone(ZoneInfo(self.timezone))
+            if after is not None
+            else None
+        )
+        for start in expander.iter_after(local_after):
+            yield self._from_local(start)
+
+    def get_recent_starts(
+        self,
+        now: datetime,
+        count: int,
+        expander: RecurrenceExpander | None = None,
+    ) -> list[datetime]:
+        expander = expander or self.get_recurrence_expander()
+        if expander is None:
+            return [self.start] if to_utc(self.start) <= to_utc(now) else []
+        local_now = to_utc(now).astimezone(ZoneInfo(self.timezone))
+        return [self._from_local(start) for start in expander.recent(local_now, count)]
+
+    def get_next_starts(
+        self,
+        after: datetime,
+        count: int,
+        expander: RecurrenceExpander | None = None,
+    ) -> list[datetime]:
+        expander = expander or self.get_recurrence_expander()
+        if expander is None:
+            return [self.start] if to_utc(self.start) > to_utc(after) else []
+        local_after = to_utc(after).astimezone(ZoneInfo(self.timezone))
+        return [self._from_local(start) for start in expander.next(local_after, count)]
+
+    def is_occurrence(self, start: datetime) -> bool:
+        next_start = next(self.iter_starts(start), None)
+        return next_start is not None and to_utc(next_start) == to_utc(start)
+
     def is_attendable(self, start: datetime, current_time: datetime) -> bool:
+        if not self.is_occurrence(start):
+            return False
         zoned_current = apply_timezone(current_time, self.timezone)
         zoned_start = apply_timezone(start, self.timezone)
         duration = self.end - self.start
@@ -103,6 +248,8 @@ class Event(IEntity):
         return zoned_open <= zoned_current <= zoned_end
 
     def is_leaveable(self, start: datetime, current_time: datetime) -> bool:
+        if not self.is_occurrence(start):
+            return False
         zoned_current = apply_timezone(current_time, self.timezone)
         zoned_start = apply_timezone(start, self.timezone)
         duration = self.end - self.start
@@ -119,6 +266,13 @@ class Event(IEntity):
 
 
 class EventAttendance(IEntity):
+    __slots__ = (
+        "user_id",
+        "event_id",
+        "start",
+        "state",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -144,6 +298,14 @@ class EventAttendance(IEntity):
 
 
 class EventAttendanceActionLog(IEntity):
+    __slots__ = (
+        "user_id",
+        "event_id",
+        "start",
+        "action",
+        "acted_at",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -162,6 +324,14 @@ class EventAttendanceActionLog(IEntity):
 
 
 class EventAttendanceForecast(IEntity):
+    __slots__ = (
+        "user_id",
+        "event_id",
+        "start",
+        "forecasted_attended_at",
+        "forecasted_duration",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -177,3 +347,49 @@ class EventAttendanceForecast(IEntity):
         self.start = start
         self.forecasted_attended_at = forecasted_attended_at
         self.forecasted_duration = forecasted_duration
+
+
+class EventAttendanceForecastWatermark(IEntity):
+    __slots__ = (
+        "user_id",
+        "event_id",
+        "last_acted_at",
+        "last_start",
+    )
+
+    def __init__(
+        self,
+        entity_id: UUID,
+        user_id: int,
+        event_id: UUID,
+        last_acted_at: datetime,
+        last_start: datetime,
+    ) -> None:
+        super().__init__(entity_id)
+        self.user_id = user_id
+        self.event_id = event_id
+        self.last_acted_at = last_acted_at
+        self.last_start = last_start
+
+
+class EventOccurrence(IEntity):
+    __slots__ = (
+        "user_id",
+        "event_id",
+        "start",
+        "end",
+    )
+
+    def __init__(
+        self,
+        entity_id: UUID,
+        user_id: int,
+        event_id: UUID,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        super().__init__(entity_id)
+        self.user_id = user_id
+        self.event_id = event_id
+        self.start = start
+        self.end = end
@@ -7,6 +7,12 @@ from ta_core.utils.uuid import UUID
 
 
 class EmailVerification(IEntity):
+    __slots__ = (
+        "email",
+        "verification_token",
+        "token_expires_at",
+    )
+
     def __init__(
         self,
         entity_id: UUID,
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from pydantic.fields import Field
+
+from ta_core.dtos.base import BaseModelWithErrorCodes
+
+
+class PasswordHasherStatus(BaseModel):
+    max_workers: int = Field(..., title="Max Workers")
+    queue_depth: int = Field(..., title="Queued Hashes")
+    in_flight: int = Field(..., title="Running Hashes")
+    submitted: int = Field(..., title="Submitted Hashes")
+    completed: int = Field(..., title="Completed Hashes")
+    max_queue_depth: int = Field(..., title="Max Queued Hashes")
+    total_wait_seconds: float = Field(..., title="Total Queue Wait Seconds")
+    max_wait_seconds: float = Field(..., title="Max Queue Wait Seconds")
+
+
+class GetPasswordHasherResponse(BaseModelWithErrorCodes):
+    password_hasher: PasswordHasherStatus = Field(..., title="Password Hasher")
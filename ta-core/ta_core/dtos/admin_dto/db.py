@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from pydantic.fields import Field
+
+from ta_core.dtos.base import BaseModelWithErrorCodes
+
+
+class DbPoolStatus(BaseModel):
+    connection_key: str = Field(..., title="Connection Key")
+    size: int = Field(..., title="Pool Size")
+    checked_in: int = Field(..., title="Checked In Connections")
+    checked_out: int = Field(..., title="Checked Out Connections")
+    overflow: int = Field(..., title="Overflow Connections")
+    connects: int = Field(..., title="Connects")
+    checkouts: int = Field(..., title="Checkouts")
+    checkins: int = Field(..., title="Checkins")
+    overflow_connects: int = Field(..., title="Overflow Connects")
+    timeouts: int = Field(..., title="Checkout Timeouts")
+    total_wait_seconds: float = Field(..., title="Total Checkout Wait Seconds")
+    max_wait_seconds: float = Field(..., title="Max Checkout Wait Seconds")
+
+
+class GetDbPoolsResponse(BaseModelWithErrorCodes):
+    pools: list[DbPoolStatus] = Field(..., title="Pools")
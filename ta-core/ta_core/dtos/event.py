@@ -3,6 +3,7 @@ from datetime import datetime
 from pydantic import BaseModel
 from pydantic.fields import Field
 
+from ta_core.constants.constants import ATTEND_EVENT_BATCH_MAX_SIZE
 from ta_core.dtos.base import BaseModelWithErrorCodes
 from ta_core.features.event import AttendanceAction
 
@@ -21,11 +22,24 @@ class EventWithId(Event):
     id: str = Field(..., title="Event ID")
 
 
+class EventOccurrence(BaseModel):
+    event_id: str = Field(..., title="Event ID")
+    start: datetime = Field(..., title="Start")
+    end: datetime = Field(..., title="End")
+
+
 class Attendance(BaseModel):
     action: AttendanceAction = Field(..., title="Attendance Action")
     acted_at: datetime = Field(..., title="Acted At")
 
 
+class BatchAttendance(BaseModel):
+    username: str = Field(..., title="Guest Username")
+    event_id: str = Field(..., title="Event ID")
+    start: datetime = Field(..., title="Event Started At")
+    action: AttendanceAction = Field(..., title="Attendance Action")
+
+
 class AttendancesWithUsername(BaseModel):
     username: str = Field(..., title="Username")
     attendances: list[Attendance] = Field(..., title="Attendances")
@@ -60,6 +74,16 @@ class AttendEventResponse(BaseModelWithErrorCodes):
     pass
 
 
+class BatchAttendEventRequest(BaseModel):
+    attendances: list[BatchAttendance] = Field(
+        ..., title="Attendances", max_length=ATTEND_EVENT_BATCH_MAX_SIZE
+    )
+
+
+class BatchAttendEventResponse(BaseModelWithErrorCodes):
+    results: list[AttendEventResponse] = Field(..., title="Results per Attendance")
+
+
 class UpdateAttendancesRequest(BaseModel):
     attendances: list[Attendance] = Field(..., title="Attendances")
 
@@ -76,10 +100,21 @@ class GetAttendanceHistoryResponse(BaseModelWithErrorCodes):
 
 class GetMyEventsResponse(BaseModelWithErrorCodes):
     events: list[EventWithId] = Field(..., title="My Events")
+    next_cursor: str | None = Field(None, title="Next Cursor")
 
 
 class GetFollowingEventsResponse(BaseModelWithErrorCodes):
     events: list[EventWithId] = Field(..., title="Following Events")
+    next_cursor: str | None = Field(None, title="Next Cursor")
+
+
+class GetEventOccurrencesResponse(BaseModelWithErrorCodes):
+    occurrences: list[EventOccurrence] = Field(..., title="Event Occurrences")
+    next_cursor: str | None = Field(None, title="Next Cursor")
+
+
+class MaterializeEventOccurrencesResponse(BaseModelWithErrorCodes):
+    occurrence_count: int = Field(..., title="Materialized Occurrence Count")
 
 
 class GetGuestAttendanceStatusResponse(BaseModelWithErrorCodes):
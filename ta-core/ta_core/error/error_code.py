@@ -22,3 +22,6 @@ class ErrorCode(IntEnum):
     EVENT_NOT_FOUND = 4001
     EVENT_NOT_ATTENDABLE = 4002
     EVENT_NOT_LEAVEABLE = 4003
+    EVENT_OCCURRENCE_RANGE_INVALID = 4004
+    EVENT_CURSOR_INVALID = 4005
+    EVENT_ATTENDANCE_NOT_RECORDED = 4006
@@ -76,3 +76,75 @@ CONNECTIONS = {
         for connection_key, url in zip(SHARD_DB_CONNECTION_KEYS, _SHARD_DB_URLS)
     },
 }
+
+
+class DBPoolConfig(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_timeout: float
+    pool_pre_ping: bool
+    echo: bool
+
+
+_DEFAULT_DB_POOL_CONFIG: DBPoolConfig = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_timeout": 30.0,
+    "pool_pre_ping": True,
+    "echo": False,
+}
+
+
+def _getenv_for_connection(name: str, connection_key: str) -> str | None:
+    # e.g. DB_POOL_SIZE_SHARD0 takes precedence over DB_POOL_SIZE
+    return os.environ.get(f"{name}_{connection_key.upper()}", os.environ.get(name))
+
+
+def _getenv_bool(name: str, connection_key: str, default: bool) -> bool:
+    value = _getenv_for_connection(name, connection_key)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _get_db_pool_config(connection_key: str) -> DBPoolConfig:
+    pool_size = _getenv_for_connection("DB_POOL_SIZE", connection_key)
+    max_overflow = _getenv_for_connection("DB_MAX_OVERFLOW", connection_key)
+    pool_recycle = _getenv_for_connection("DB_POOL_RECYCLE", connection_key)
+    pool_timeout = _getenv_for_connection("DB_POOL_TIMEOUT", connection_key)
+    return {
+        "pool_size": (
+            int(pool_size)
+            if pool_size is not None
+            else _DEFAULT_DB_POOL_CONFIG["pool_size"]
+        ),
+        "max_overflow": (
+            int(max_overflow)
+            if max_overflow is not None
+            else _DEFAULT_DB_POOL_CONFIG["max_overflow"]
+        ),
+        "pool_recycle": (
+            int(pool_recycle)
+            if pool_recycle is not None
+            else _DEFAULT_DB_POOL_CONFIG["pool_recycle"]
+        ),
+        "pool_timeout": (
+            float(pool_timeout)
+            if pool_timeout is not None
+            else _DEFAULT_DB_POOL_CONFIG["pool_timeout"]
+        ),
+        "pool_pre_ping": _getenv_bool(
+            "DB_POOL_PRE_PING", connection_key, _DEFAULT_DB_POOL_CONFIG["pool_pre_ping"]
+        ),
+        "echo": _getenv_bool(
+            "DB_ECHO", connection_key, _DEFAULT_DB_POOL_CONFIG["echo"]
+        ),
+    }
+
+
+DB_POOL_CONFIGS = {
+    connection_key: _get_db_pool_config(connection_key)
+    for connection_key in CONNECTIONS.keys()
+}
@@ -1,10 +1,29 @@
+import heapq
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Tuple, TypeVar, Union
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.session import ORMExecuteState
 from sqlalchemy.orm.state import InstanceState
-from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BindParameter,
+    BooleanClauseList,
+    ClauseElement,
+    ColumnElement,
+)
 
 from ta_core.constants.constants import DB_SHARD_COUNT
 from ta_core.infrastructure.db.settings import (
@@ -13,9 +32,13 @@ from ta_core.infrastructure.db.settings import (
     SEQUENCE_DB_CONNECTION_KEY,
     SHARD_DB_CONNECTION_KEYS,
 )
+from ta_core.utils.uuid import UUID, bin_to_uuid, extract_shard_id, generate_uuid
 
 _T = TypeVar("_T", bound=Any)
 
+SHARD_KEY_COLUMN_NAME = "user_id"
+PRIMARY_KEY_COLUMN_NAME = "id"
+
 
 def shard_chooser(
     mapper: Optional[Mapper[_T]], instance: Any, clause: Optional[ClauseElement] = None
@@ -40,8 +63,152 @@ def identity_chooser(
 ) -> Any:
     if lazy_loaded_from:
         return [lazy_loaded_from.identity_token]
-    else:
+    shard_ids: tuple[str, ...] | None = mapper.local_table.info.get("shard_ids")  # type: ignore[attr-defined]
+    if shard_ids is None:
         return list(CONNECTIONS.keys())
+    if shard_ids == SHARD_DB_CONNECTION_KEYS:
+        primary_key_value = (
+            primary_key[0] if isinstance(primary_key, (tuple, list)) else primary_key
+        )
+        connection_key = resolve_shard_connection_key_by_primary_key(
+            primary_key_value, SHARD_DB_CONNECTION_KEYS
+        )
+        if connection_key is not None:
+            # The remaining shards are only visited on a miss
+            return [connection_key] + [
+                shard_id for shard_id in shard_ids if shard_id != connection_key
+            ]
+    return list(shard_ids)
+
+
+def _iter_conjuncts(clause: ClauseElement) -> Iterator[ClauseElement]:
+    # Only AND-ed criteria can narrow down the shards, so OR clauses are not traversed
+    if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        for sub_clause in clause.clauses:
+            yield from _iter_conjuncts(sub_clause)
+    else:
+        yield clause
+
+
+def _is_shard_table_column(
+    element: ColumnElement[Any],
+    column_name: str,
+    shard_connection_keys: tuple[str, ...],
+) -> bool:
+    table = getattr(element, "table", None)
+    return (
+        getattr(element, "key", None) == column_name
+        and table is not None
+        and table.info.get("shard_ids") == shard_connection_keys
+    )
+
+
+def _extract_column_values(
+    statement: Any, column_name: str, shard_connection_keys: tuple[str, ...]
+) -> set[Any] | None:
+    # Returns None when the WHERE clause does not narrow down the column
+    whereclause = getattr(statement, "whereclause", None)
+    if whereclause is None:
+        return None
+
+    column_values: set[Any] | None = None
+    for clause in _iter_conjuncts(whereclause):
+        if not isinstance(clause, BinaryExpression):
+            continue
+        if clause.operator not in (operators.eq, operators.in_op):
+            continue
+        if not _is_shard_table_column(clause.left, column_name, shard_connection_keys):
+            continue
+        if not isinstance(clause.right, BindParameter):
+            continue
+        value = clause.right.effective_value
+        if value is None:
+            continue
+        values = set(value) if clause.operator is operators.in_op else {value}
+        column_values = values if column_values is None else column_values & values
+    return column_values
+
+
+def extract_shard_key_values(
+    statement: Any, shard_connection_keys: tuple[str, ...]
+) -> set[int] | None:
+    shard_key_values = _extract_column_values(
+        statement, SHARD_KEY_COLUMN_NAME, shard_connection_keys
+    )
+    if shard_key_values is None:
+        return None
+    return {int(shard_key_value) for shard_key_value in shard_key_values}
+
+
+def extract_primary_key_values(
+    statement: Any, shard_connection_keys: tuple[str, ...]
+) -> set[bytes] | None:
+    return _extract_column_values(
+        statement, PRIMARY_KEY_COLUMN_NAME, shard_connection_keys
+    )
+
+
+def resolve_shard_connection_keys(
+    shard_key_values: Iterable[int],
+    shard_connection_keys: tuple[str, ...],
+    resolve_shard_id: Callable[[int], int],
+) -> list[str]:
+    resolved_keys = {
+        resolve_shard_connection_key(
+            shard_key_value, shard_connection_keys, resolve_shard_id
+        )
+        for shard_key_value in shard_key_values
+    }
+    # ShardedSession requires at least one shard even if no rows can match
+    return sorted(resolved_keys) if resolved_keys else [shard_connection_keys[0]]
+
+
+def resolve_shard_connection_key(
+    shard_key_value: int,
+    shard_connection_keys: tuple[str, ...],
+    resolve_shard_id: Callable[[int], int],
+) -> str:
+    return shard_connection_keys[resolve_shard_id(shard_key_value)]
+
+
+def resolve_shard_connection_key_by_primary_key(
+    primary_key: Any, shard_connection_keys: tuple[str, ...]
+) -> str | None:
+    if isinstance(primary_key, bytes):
+        if len(primary_key) != 16:
+            return None
+        primary_key = bin_to_uuid(primary_key)
+    if not isinstance(primary_key, UUID):
+        return None
+    shard_id = extract_shard_id(primary_key)
+    if shard_id is None or shard_id >= len(shard_connection_keys):
+        return None
+    return shard_connection_keys[shard_id]
+
+
+def resolve_shard_connection_keys_by_primary_keys(
+    primary_keys: Iterable[Any], shard_connection_keys: tuple[str, ...]
+) -> list[str] | None:
+    resolved_keys = set()
+    for primary_key in primary_keys:
+        connection_key = resolve_shard_connection_key_by_primary_key(
+            primary_key, shard_connection_keys
+        )
+        if connection_key is None:
+            return None
+        resolved_keys.add(connection_key)
+    return sorted(resolved_keys) if resolved_keys else [shard_connection_keys[0]]
+
+
+def merge_sorted_shard_results(
+    shard_results: Iterable[Sequence[_T]],
+    key: Callable[[_T], Any],
+    descending: bool,
+    limit: int | None = None,
+) -> list[_T]:
+    # Each shard result must already be sorted by the same key
+    merged = heapq.merge(*shard_results, key=key, reverse=descending)
+    return list(islice(merged, limit))
 
 
 def execute_chooser(context: ORMExecuteState) -> Iterable[Any]:
@@ -52,8 +219,28 @@ def execute_chooser(context: ORMExecuteState) -> Iterable[Any]:
             shard_ids.update(ids)
     if len(shard_ids) == 0:
         return list(CONNECTIONS.keys())
-    else:
-        return list(shard_ids)
+    if shard_ids == set(SHARD_DB_CONNECTION_KEYS):
+        shard_key_values = extract_shard_key_values(
+            context.statement, SHARD_DB_CONNECTION_KEYS
+        )
+        if shard_key_values is not None:
+            return resolve_shard_connection_keys(
+                shard_key_values,
+                SHARD_DB_CONNECTION_KEYS,
+                db_shard_resolver.resolve_shard_id,
+            )
+        # Writes are never routed by a primary key alone, since a miss cannot be retried
+        if context.is_select:
+            primary_key_values = extract_primary_key_values(
+                context.statement, SHARD_DB_CONNECTION_KEYS
+            )
+            if primary_key_values is not None:
+                connection_keys = resolve_shard_connection_keys_by_primary_keys(
+                    primary_key_values, SHARD_DB_CONNECTION_KEYS
+                )
+                if connection_keys is not None:
+                    return connection_keys
+    return list(shard_ids)
 
 
 @dataclass(frozen=True)
@@ -65,3 +252,7 @@ class DbShardResolver:
 
 
 db_shard_resolver = DbShardResolver(shard_count=DB_SHARD_COUNT)
+
+
+def generate_shard_uuid(user_id: int) -> UUID:
+    return generate_uuid(db_shard_resolver.resolve_shard_id(user_id))
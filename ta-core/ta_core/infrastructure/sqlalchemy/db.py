@@ -1,18 +1,40 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio.engine import create_async_engine
+from sqlalchemy.ext.asyncio.engine import AsyncEngine, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession, async_sessionmaker
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 
-from ta_core.infrastructure.db.settings import CONNECTIONS
+from ta_core.infrastructure.db.settings import (
+    CONNECTIONS,
+    DB_POOL_CONFIGS,
+    DBPoolConfig,
+)
 from ta_core.infrastructure.db.sharding import (
     execute_chooser,
     identity_chooser,
     shard_chooser,
 )
+from ta_core.infrastructure.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolStatus,
+)
+
+
+def create_pooled_async_engine(url: str, pool_config: DBPoolConfig) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=pool_config["echo"],
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=pool_config["pool_size"],
+        max_overflow=pool_config["max_overflow"],
+        pool_recycle=pool_config["pool_recycle"],
+        pool_timeout=pool_config["pool_timeout"],
+        pool_pre_ping=pool_config["pool_pre_ping"],
+    )
+
 
 async_engines = {
-    connection_key: create_async_engine(url, echo=True)
+    connection_key: create_pooled_async_engine(url, DB_POOL_CONFIGS[connection_key])
     for connection_key, url in CONNECTIONS.items()
 }
 
@@ -37,3 +59,11 @@ async_session.configure(
 async def get_db_async() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+def get_pool_statuses() -> dict[str, PoolStatus]:
+    return {
+        connection_key: engine.pool.snapshot()
+        for connection_key, engine in async_engines.items()
+        if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool)
+    }
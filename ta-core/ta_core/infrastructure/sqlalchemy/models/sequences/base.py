@@ -1,15 +1,33 @@
+import asyncio
 from typing import Any
 
 from sqlalchemy.dialects.mysql import BIGINT
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm.base import Mapped
 from sqlalchemy.orm.decl_api import declared_attr
-from sqlalchemy.sql import select
+from sqlalchemy.sql import insert, select, update
+from sqlalchemy.sql.functions import func
 
+from ta_core.constants.constants import SEQUENCE_ID_BLOCK_SIZE
 from ta_core.infrastructure.db.settings import SEQUENCE_DB_CONNECTION_KEY
 from ta_core.infrastructure.sqlalchemy.models.base import AbstractBase
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
 
+# Reserved IDs not handed out yet, as [next ID, last ID] per sequence model
+_id_blocks: dict[str, list[int]] = {}
+_id_block_locks: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+
+
+def _get_id_block_lock(sequence_name: str) -> asyncio.Lock:
+    # asyncio.Lock is bound to the loop it first waits on
+    loop = asyncio.get_running_loop()
+    entry = _id_block_locks.get(sequence_name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Lock())
+        _id_block_locks[sequence_name] = entry
+    return entry[1]
+
 
 class AbstractSequenceBase(AbstractBase):
     __abstract__ = True
@@ -29,16 +47,43 @@ class AbstractSequenceId(AbstractSequenceBase):
         BIGINT(unsigned=True), primary_key=True, autoincrement=False
     )
 
+    @classmethod
+    async def _reserve_id_block_async(
+        cls, uow: IUnitOfWork, block_size: int
+    ) -> tuple[int, int]:
+        # The single row holds the last reserved ID. LAST_INSERT_ID(expr) stores the
+        # new value for this connection, so one UPDATE both reserves and reports it
+        while True:
+            try:
+                async with uow.begin_autonomous(
+                    SEQUENCE_DB_CONNECTION_KEY
+                ) as connection:
+                    result = await connection.execute(
+                        update(cls).values(id=func.last_insert_id(cls.id + block_size))
+                    )
+                    if result.rowcount == 0:
+                        await connection.execute(insert(cls).values(id=block_size - 1))
+                        return 0, block_size - 1
+                    last_id = (
+                        await connection.execute(select(func.last_insert_id()))
+                    ).scalar_one()
+                    return last_id - block_size + 1, last_id
+            except IntegrityError:
+                # Another process created the row first
+                continue
+
     @classmethod
     async def id_generator(cls, uow: IUnitOfWork) -> int:
-        stmt = select(cls)
-        result = await uow.execute_async(stmt)
-        record = result.scalar_one_or_none()
-        if record is None:
-            new_id = 0
-        else:
-            new_id = record.id + 1
-            await uow.delete_async(record)
-        model = cls(id=new_id)
-        uow.add(model)
+        sequence_name = cls.__name__
+        block = _id_blocks.get(sequence_name)
+        if block is None or block[0] > block[1]:
+            async with _get_id_block_lock(sequence_name):
+                block = _id_blocks.get(sequence_name)
+                if block is None or block[0] > block[1]:
+                    block = list(
+                        await cls._reserve_id_block_async(uow, SEQUENCE_ID_BLOCK_SIZE)
+                    )
+                    _id_blocks[sequence_name] = block
+        new_id = block[0]
+        block[0] += 1
         return new_id
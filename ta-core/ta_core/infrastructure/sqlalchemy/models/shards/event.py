@@ -10,7 +10,6 @@ from sqlalchemy.dialects.mysql import (
     SMALLINT,
     VARCHAR,
 )
-from sqlalchemy.exc import StatementError
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy.orm.base import Mapped
 from sqlalchemy.sql.schema import ForeignKey, Index, UniqueConstraint
@@ -23,6 +22,10 @@ from ta_core.domain.entities.event import (
 from ta_core.domain.entities.event import (
     EventAttendanceForecast as EventAttendanceForecastEntity,
 )
+from ta_core.domain.entities.event import (
+    EventAttendanceForecastWatermark as EventAttendanceForecastWatermarkEntity,
+)
+from ta_core.domain.entities.event import EventOccurrence as EventOccurrenceEntity
 from ta_core.domain.entities.event import Recurrence as RecurrenceEntity
 from ta_core.domain.entities.event import RecurrenceRule as RecurrenceRuleEntity
 from ta_core.features.event import AttendanceAction, AttendanceState, Frequency, Weekday
@@ -177,10 +180,7 @@ class Event(AbstractShardDynamicBase):
     recurrence: Mapped[Recurrence | None] = relationship(uselist=False)
 
     def to_entity(self) -> EventEntity:
-        try:
-            recurrence = self.recurrence.to_entity() if self.recurrence else None
-        except StatementError:
-            recurrence = None
+        recurrence = self.recurrence.to_entity() if self.recurrence else None
 
         return EventEntity(
             entity_id=bin_to_uuid(self.id),
@@ -215,6 +215,8 @@ class Event(AbstractShardDynamicBase):
 
 
 Index(None, Event.user_id)
+# Keyset pagination of the events of a set of hosts
+Index("ix_event_user_id_start_id", Event.user_id, Event.start, Event.id)
 
 
 class EventAttendance(AbstractShardDynamicBase):
@@ -301,6 +303,13 @@ Index(
     EventAttendanceActionLog.event_id,
     EventAttendanceActionLog.start,
 )
+# Lets MAX(acted_at) per (user_id, event_id) be answered by a loose index scan
+Index(
+    "ix_event_attendance_action_log_user_id_event_id_acted_at",
+    EventAttendanceActionLog.user_id,
+    EventAttendanceActionLog.event_id,
+    EventAttendanceActionLog.acted_at,
+)
 
 
 class EventAttendanceForecast(AbstractShardDynamicBase):
@@ -348,3 +357,88 @@ UniqueConstraint(
     EventAttendanceForecast.event_id,
     EventAttendanceForecast.start,
 )
+
+
+class EventAttendanceForecastWatermark(AbstractShardDynamicBase):
+    event_id: Mapped[bytes] = mapped_column(
+        BINARY(16),
+        nullable=False,
+        comment="Event ID",
+    )
+    last_acted_at: Mapped[datetime] = mapped_column(
+        DATETIME(timezone=True), nullable=False, comment="Last Consumed Acted At"
+    )
+    last_start: Mapped[datetime] = mapped_column(
+        DATETIME(timezone=True), nullable=False, comment="Last Consumed Event Start"
+    )
+
+    def to_entity(self) -> "EventAttendanceForecastWatermarkEntity":
+        return EventAttendanceForecastWatermarkEntity(
+            entity_id=bin_to_uuid(self.id),
+            user_id=self.user_id,
+            event_id=bin_to_uuid(self.event_id),
+            last_acted_at=self.last_acted_at,
+            last_start=self.last_start,
+        )
+
+    @classmethod
+    def from_entity(
+        cls, entity: "EventAttendanceForecastWatermarkEntity"
+    ) -> "EventAttendanceForecastWatermark":
+        return cls(
+            id=uuid_to_bin(entity.id),
+            user_id=entity.user_id,
+            event_id=uuid_to_bin(entity.event_id),
+            last_acted_at=entity.last_acted_at,
+            last_start=entity.last_start,
+        )
+
+
+UniqueConstraint(
+    EventAttendanceForecastWatermark.user_id,
+    EventAttendanceForecastWatermark.event_id,
+)
+
+
+class EventOccurrence(AbstractShardDynamicBase):
+    event_id: Mapped[bytes] = mapped_column(
+        BINARY(16),
+        nullable=False,
+        comment="Event ID",
+    )
+    start: Mapped[datetime] = mapped_column(
+        DATETIME(timezone=True), nullable=False, comment="Start"
+    )
+    end: Mapped[datetime] = mapped_column(
+        DATETIME(timezone=True), nullable=False, comment="End"
+    )
+
+    def to_entity(self) -> EventOccurrenceEntity:
+        return EventOccurrenceEntity(
+            entity_id=bin_to_uuid(self.id),
+            user_id=self.user_id,
+            event_id=bin_to_uuid(self.event_id),
+            start=self.start,
+            end=self.end,
+        )
+
+    @classmethod
+    def from_entity(cls, entity: EventOccurrenceEntity) -> "EventOccurrence":
+        return cls(
+            id=uuid_to_bin(entity.id),
+            user_id=entity.user_id,
+            event_id=uuid_to_bin(entity.event_id),
+            start=entity.start,
+            end=entity.end,
+        )
+
+
+UniqueConstraint(
+    EventOccurrence.user_id, EventOccurrence.event_id, EventOccurrence.start
+)
+# Calendar queries scan the occurrences of a set of hosts by start
+Index(
+    "ix_event_occurrence_user_id_start",
+    EventOccurrence.user_id,
+    EventOccurrence.start,
+)
@@ -0,0 +1,65 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolMetrics:
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    overflow_connects: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    metrics: PoolMetrics
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        self.metrics.connects += 1
+        # QueuePool increments the overflow counter before opening a new connection
+        if self.overflow() > 0:
+            self.metrics.overflow_connects += 1
+        return super()._create_connection()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        wait_seconds = time.perf_counter() - started_at
+        self.metrics.checkouts += 1
+        self.metrics.total_wait_seconds += wait_seconds
+        self.metrics.max_wait_seconds = max(self.metrics.max_wait_seconds, wait_seconds)
+        return entry
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        self.metrics.checkins += 1
+        super()._do_return_conn(record)
+
+    def snapshot(self) -> PoolStatus:
+        return PoolStatus(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            metrics=PoolMetrics(**vars(self.metrics)),
+        )
@@ -2,12 +2,16 @@ from datetime import datetime
 
 from pydantic.networks import EmailStr
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.strategy_options import joinedload
 from sqlalchemy.sql import select
 
 from ta_core.domain.entities.account import UserAccount as UserAccountEntity
 from ta_core.features.account import Gender
-from ta_core.infrastructure.sqlalchemy.models.commons.account import UserAccount
+from ta_core.infrastructure.sqlalchemy.models.commons.account import (
+    FollowAssociation,
+    UserAccount,
+)
 from ta_core.infrastructure.sqlalchemy.repositories.base import AbstractRepository
 from ta_core.utils.uuid import UUID, uuid_to_bin
 
@@ -78,6 +82,20 @@ class UserAccountRepository(AbstractRepository[UserAccountEntity, UserAccount]):
     ) -> tuple[UserAccountEntity, ...]:
         return await self.read_all_async(where=(self._model.username.in_(usernames),))
 
+    async def read_by_user_ids_async(
+        self, user_ids: set[int]
+    ) -> tuple[UserAccountEntity, ...]:
+        return await self.read_all_async(where=(self._model.user_id.in_(user_ids),))
+
+    async def read_usernames_by_user_ids_async(
+        self, user_ids: set[int]
+    ) -> dict[int, str]:
+        rows = await self.read_columns_async(
+            (self._model.user_id, self._model.username),
+            where=(self._model.user_id.in_(user_ids),),
+        )
+        return {user_id: username for user_id, username in rows}
+
     async def read_by_email_or_none_async(
         self, email: EmailStr
     ) -> UserAccountEntity | None:
@@ -106,3 +124,25 @@ class UserAccountRepository(AbstractRepository[UserAccountEntity, UserAccount]):
         result = await self._uow.execute_async(stmt)
         record = result.unique().scalar_one_or_none()
         return record.to_entity() if record is not None else None
+
+    async def read_followee_user_ids_by_id_or_none_async(
+        self, record_id: UUID
+    ) -> tuple[int, set[int]] | None:
+        # Follows only need user IDs, so the followee accounts are not loaded
+        followee = aliased(UserAccount)
+        stmt = (
+            select(self._model.user_id, followee.user_id)
+            .outerjoin(
+                FollowAssociation, FollowAssociation.follower_id == self._model.id
+            )
+            .outerjoin(followee, followee.id == FollowAssociation.followee_id)
+            .where(self._model.id == uuid_to_bin(record_id))
+        )
+        rows = await self._read_rows_async(stmt)
+        if not rows:
+            return None
+        return rows[0][0], {
+            followee_user_id
+            for _, followee_user_id in rows
+            if followee_user_id is not None
+        }
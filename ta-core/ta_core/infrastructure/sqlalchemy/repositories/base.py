@@ -1,14 +1,54 @@
+import asyncio
 from abc import abstractmethod
-from typing import Any
+from collections import defaultdict
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.sql import delete, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.engine.row import Row
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.sql import delete, operators, select, update
+from sqlalchemy.sql.base import Executable
 from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.selectable import Select
 
 from ta_core.domain.repositories.base import IRepository, TEntity, TModel
+from ta_core.infrastructure.db.sharding import (
+    SHARD_KEY_COLUMN_NAME,
+    db_shard_resolver,
+    extract_primary_key_values,
+    extract_shard_key_values,
+    merge_sorted_shard_results,
+    resolve_shard_connection_key,
+    resolve_shard_connection_keys,
+    resolve_shard_connection_keys_by_primary_keys,
+)
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
 from ta_core.utils.uuid import UUID, uuid_to_bin
 
+BULK_WRITE_CHUNK_SIZE = 1000
+STREAM_BATCH_SIZE = 1000
+
+_T = TypeVar("_T")
+
+
+async def _aiter(items: Iterable[_T] | AsyncIterable[_T]) -> AsyncIterator[_T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
 
 class AbstractRepository(IRepository[TEntity, TModel]):
     def __init__(self, uow: IUnitOfWork) -> None:
@@ -19,6 +59,121 @@ class AbstractRepository(IRepository[TEntity, TModel]):
     def _model(self) -> type[TModel]:
         raise NotImplementedError()
 
+    @property
+    def _shard_ids(self) -> tuple[str, ...]:
+        shard_ids: tuple[str, ...] = self._model.__table__.info.get("shard_ids", ())  # type: ignore[attr-defined]
+        return shard_ids
+
+    def _is_routed_by_primary_key(self, stmt: Select[Any]) -> bool:
+        shard_ids = self._shard_ids
+        if len(shard_ids) <= 1:
+            return False
+        primary_key_values = extract_primary_key_values(stmt, shard_ids)
+        if primary_key_values is None:
+            return False
+        return (
+            resolve_shard_connection_keys_by_primary_keys(primary_key_values, shard_ids)
+            is not None
+        )
+
+    def _scatter_shard_ids(self, stmt: Select[Any]) -> tuple[str, ...] | None:
+        shard_ids = self._shard_ids
+        if len(shard_ids) <= 1:
+            return None
+        shard_key_values = extract_shard_key_values(stmt, shard_ids)
+        if shard_key_values is not None:
+            # Shards are queried separately so that ordered reads can be merged
+            resolved_shard_ids = resolve_shard_connection_keys(
+                shard_key_values, shard_ids, db_shard_resolver.resolve_shard_id
+            )
+            return tuple(resolved_shard_ids) if len(resolved_shard_ids) > 1 else None
+        if self._is_routed_by_primary_key(stmt):
+            return None
+        return shard_ids
+
+    async def _read_by_ids_async(
+        self, record_ids: set[UUID], options: tuple[Any, ...] = ()
+    ) -> list[TModel]:
+        # Primary-key reads stay on this session instead of being scattered, so the
+        # returned models remain attached and their lazy relationships can load
+        stmt = (
+            select(self._model)
+            .where(
+                self._model.id.in_(uuid_to_bin(record_id) for record_id in record_ids)
+            )
+            .options(*options)
+        )
+        result = await self._uow.execute_async(stmt)
+        records = list(result.unique().scalars().all())
+        if len(records) == len(record_ids) or not self._is_routed_by_primary_key(stmt):
+            return records
+        # IDs issued before shard IDs were embedded may still look like tagged ones
+        found_ids = {record.id for record in records}
+        missing_ids = {uuid_to_bin(record_id) for record_id in record_ids} - found_ids
+        routed_shard_ids = set(
+            resolve_shard_connection_keys_by_primary_keys(missing_ids, self._shard_ids)
+            or ()
+        )
+        stmt = (
+            select(self._model).where(self._model.id.in_(missing_ids)).options(*options)
+        )
+        for shard_id in self._shard_ids:
+            if shard_id in routed_shard_ids:
+                continue
+            result = await self._uow.execute_async(stmt, shard_id=shard_id)
+            records.extend(result.unique().scalars().all())
+        return records
+
+    async def _read_scalars_async(self, stmt: Select[Any]) -> list[TModel]:
+        shard_ids = self._scatter_shard_ids(stmt)
+        if shard_ids is None:
+            result = await self._uow.execute_async(stmt)
+            return list(result.unique().scalars().all())
+        results = await self._uow.scatter_execute_async(stmt, shard_ids)
+        return [
+            record for result in results for record in result.unique().scalars().all()
+        ]
+
+    async def _read_ordered_scalars_async(
+        self,
+        stmt: Select[Any],
+        key: Callable[[TModel], Any],
+        descending: bool,
+        limit: int,
+    ) -> list[TModel]:
+        # The statement must be ordered by `key` and limited to `limit` rows
+        shard_ids = self._scatter_shard_ids(stmt)
+        if shard_ids is None:
+            result = await self._uow.execute_async(stmt)
+            return list(result.unique().scalars().all())
+        # Each shard returns at most `limit` sorted rows, so a k-way merge suffices
+        results = await self._uow.scatter_execute_async(stmt, shard_ids)
+        return merge_sorted_shard_results(
+            (result.unique().scalars().all() for result in results),
+            key=key,
+            descending=descending,
+            limit=limit,
+        )
+
+    async def _read_rows_async(self, stmt: Select[Any]) -> list[Row[Any]]:
+        shard_ids = self._scatter_shard_ids(stmt)
+        if shard_ids is None:
+            result = await self._uow.execute_async(stmt)
+            return list(result.all())
+        results = await self._uow.scatter_execute_async(stmt, shard_ids)
+        return [row for result in results for row in result.all()]
+
+    async def _stream_scalars_async(
+        self, stmt: Select[Any], batch_size: int
+    ) -> AsyncIterator[Sequence[TModel]]:
+        stmt = stmt.execution_options(yield_per=batch_size)
+        # Shards are streamed one after another so only one cursor is open at a time
+        shard_ids: tuple[str | None, ...] = self._scatter_shard_ids(stmt) or (None,)
+        for shard_id in shard_ids:
+            result = await self._uow.stream_async(stmt, shard_id=shard_id)
+            async for partition in result.scalars().partitions():
+                yield partition
+
     async def create_async(self, entity: TEntity) -> TEntity | None:
         model = self._model.from_entity(entity)
         async with self._uow.begin_nested() as savepoint:
@@ -41,23 +196,108 @@ class AbstractRepository(IRepository[TEntity, TModel]):
                 await savepoint.rollback()
                 return None
 
+    def _to_row(self, entity: TEntity) -> dict[str, Any]:
+        model = self._model.from_entity(entity)
+        return {
+            key: value
+            for key, value in model.__dict__.items()
+            if key != "_sa_instance_state"
+        }
+
+    def _resolve_row_shard_id(self, row: Mapping[str, Any]) -> str | None:
+        shard_ids = self._shard_ids
+        if len(shard_ids) <= 1:
+            return shard_ids[0] if shard_ids else None
+        return resolve_shard_connection_key(
+            row[SHARD_KEY_COLUMN_NAME], shard_ids, db_shard_resolver.resolve_shard_id
+        )
+
+    async def _write_rows_async(
+        self,
+        stmt: Executable,
+        rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        chunk_size: int,
+        concurrent: bool,
+    ) -> int:
+        buffers: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
+        in_flight: dict[str | None, asyncio.Task[Any]] = {}
+
+        async def flush_async(shard_id: str | None) -> None:
+            chunk = buffers.pop(shard_id)
+            if not concurrent or shard_id is None:
+                await self._uow.execute_async(stmt, chunk, shard_id=shard_id)
+                return
+            # At most one chunk per shard is in flight, each on its own connection
+            previous = in_flight.get(shard_id)
+            if previous is not None:
+                await previous
+            in_flight[shard_id] = asyncio.create_task(
+                self._uow.execute_autonomous_async(stmt, shard_id, chunk)
+            )
+
+        row_count = 0
+        try:
+            async for row in _aiter(rows):
+                shard_id = self._resolve_row_shard_id(row)
+                buffers[shard_id].append(row)
+                row_count += 1
+                if len(buffers[shard_id]) >= chunk_size:
+                    await flush_async(shard_id)
+            for shard_id in list(buffers):
+                await flush_async(shard_id)
+        finally:
+            await asyncio.gather(*in_flight.values())
+        return row_count
+
+    async def bulk_insert_stream_async(
+        self,
+        entities: Iterable[TEntity] | AsyncIterable[TEntity],
+        chunk_size: int = BULK_WRITE_CHUNK_SIZE,
+        concurrent: bool = False,
+    ) -> int:
+        # A Core insert keeps the rows out of the session's identity map
+        stmt = insert(self._model.__table__)  # type: ignore[attr-defined]
+        return await self._write_rows_async(
+            stmt,
+            (self._to_row(entity) async for entity in _aiter(entities)),
+            chunk_size,
+            concurrent,
+        )
+
+    async def bulk_upsert_async(
+        self,
+        entities: Iterable[TEntity] | AsyncIterable[TEntity],
+        update_columns: tuple[str, ...],
+        values: Mapping[str, Any] | None = None,
+        chunk_size: int = BULK_WRITE_CHUNK_SIZE,
+    ) -> int:
+        stmt = insert(self._model.__table__)  # type: ignore[attr-defined]
+        stmt = stmt.on_duplicate_key_update(
+            {column: stmt.inserted[column] for column in update_columns}
+        )
+        return await self._write_rows_async(
+            stmt,
+            (
+                {**self._to_row(entity), **(values or {})}
+                async for entity in _aiter(entities)
+            ),
+            chunk_size,
+            concurrent=False,
+        )
+
     async def read_by_id_async(self, record_id: UUID) -> TEntity:
-        stmt = select(self._model).where(self._model.id == uuid_to_bin(record_id))
-        result = await self._uow.execute_async(stmt)
-        return result.scalar_one().to_entity()
+        records = await self._read_by_ids_async({record_id})
+        if not records:
+            raise NoResultFound("No row was found when one was required")
+        return records[0].to_entity()
 
     async def read_by_id_or_none_async(self, record_id: UUID) -> TEntity | None:
-        stmt = select(self._model).where(self._model.id == uuid_to_bin(record_id))
-        result = await self._uow.execute_async(stmt)
-        record = result.scalar_one_or_none()
-        return record.to_entity() if record is not None else None
+        records = await self._read_by_ids_async({record_id})
+        return records[0].to_entity() if records else None
 
     async def read_by_ids_async(self, record_ids: set[UUID]) -> tuple[TEntity, ...]:
-        stmt = select(self._model).where(
-            self._model.id.in_(uuid_to_bin(record_id) for record_id in record_ids)
-        )
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.scalars().all())
+        records = await self._read_by_ids_async(record_ids)
+        return tuple(record.to_entity() for record in records)
 
     async def read_one_async(self, where: tuple[Any, ...]) -> TEntity:
         stmt = select(self._model).where(*where)
@@ -72,8 +312,23 @@ class AbstractRepository(IRepository[TEntity, TModel]):
 
     async def read_all_async(self, where: tuple[Any, ...]) -> tuple[TEntity, ...]:
         stmt = select(self._model).where(*where)
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.scalars().all())
+        records = await self._read_scalars_async(stmt)
+        return tuple(record.to_entity() for record in records)
+
+    async def stream_all_async(
+        self, where: tuple[Any, ...], batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[tuple[TEntity, ...]]:
+        stmt = select(self._model).where(*where)
+        async for records in self._stream_scalars_async(stmt, batch_size):
+            yield tuple(record.to_entity() for record in records)
+
+    async def read_columns_async(
+        self, columns: tuple[Any, ...], where: tuple[Any, ...]
+    ) -> tuple[Row[Any], ...]:
+        # Rows are named tuples of the selected columns, so no model instances are
+        # built, tracked in the identity map or converted to entities
+        stmt = select(*columns).where(*where)
+        return tuple(await self._read_rows_async(stmt))
 
     async def read_order_by_limit_async(
         self,
@@ -82,8 +337,13 @@ class AbstractRepository(IRepository[TEntity, TModel]):
         limit: int,
     ) -> tuple[TEntity, ...]:
         stmt = select(self._model).where(*where).order_by(order_by).limit(limit)
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.scalars().all())
+        records = await self._read_ordered_scalars_async(
+            stmt,
+            key=attrgetter(order_by.element.key),  # type: ignore[arg-type]
+            descending=order_by.modifier is operators.desc_op,
+            limit=limit,
+        )
+        return tuple(record.to_entity() for record in records)
 
     async def update_async(self, entity: TEntity) -> TEntity:
         model = self._model.from_entity(entity)
@@ -93,7 +353,10 @@ class AbstractRepository(IRepository[TEntity, TModel]):
         # Remove SQLAlchemy internal state
         if "_sa_instance_state" in update_dict:
             del update_dict["_sa_instance_state"]
-        stmt = update(self._model).where(self._model.id == model.id).values(update_dict)
+        stmt = update(self._model).where(self._model.id == model.id)
+        if len(self._shard_ids) > 1:
+            stmt = stmt.where(self._model.user_id == model.user_id)  # type: ignore[attr-defined]
+        stmt = stmt.values(update_dict)
         await self._uow.execute_async(stmt)
         return entity
 
@@ -104,3 +367,33 @@ class AbstractRepository(IRepository[TEntity, TModel]):
     async def delete_all_async(self, where: tuple[Any, ...]) -> None:
         stmt = delete(self._model).where(*where)
         await self._uow.execute_async(stmt)
+
+    async def delete_all_in_chunks_async(
+        self, where: tuple[Any, ...], chunk_size: int = BULK_WRITE_CHUNK_SIZE
+    ) -> int:
+        # DELETE ... LIMIT only bounds the size of each statement. The chunks run in
+        # the caller's transaction, so their row locks are held until it commits
+        stmt = (
+            delete(self._model)
+            .where(*where)
+            .with_dialect_options(mysql_limit=chunk_size)
+        )
+        shard_ids: tuple[str | None, ...] = self._shard_ids or (None,)
+        if len(shard_ids) > 1:
+            shard_key_values = extract_shard_key_values(stmt, self._shard_ids)
+            if shard_key_values is not None:
+                shard_ids = tuple(
+                    resolve_shard_connection_keys(
+                        shard_key_values,
+                        self._shard_ids,
+                        db_shard_resolver.resolve_shard_id,
+                    )
+                )
+        deleted_count = 0
+        for shard_id in shard_ids:
+            while True:
+                result = await self._uow.execute_async(stmt, shard_id=shard_id)
+                deleted_count += result.rowcount
+                if result.rowcount < chunk_size:
+                    break
+        return deleted_count
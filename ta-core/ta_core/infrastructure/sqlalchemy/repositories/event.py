@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Any
+from operator import attrgetter
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
 
+from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.strategy_options import joinedload
-from sqlalchemy.sql import select
+from sqlalchemy.sql import select, tuple_
 from sqlalchemy.sql.functions import func
+from sqlalchemy.sql.selectable import Select
 
 from ta_core.domain.entities.event import Event as EventEntity
 from ta_core.domain.entities.event import EventAttendance as EventAttendanceEntity
@@ -13,6 +16,10 @@ from ta_core.domain.entities.event import (
 from ta_core.domain.entities.event import (
     EventAttendanceForecast as EventAttendanceForecastEntity,
 )
+from ta_core.domain.entities.event import (
+    EventAttendanceForecastWatermark as EventAttendanceForecastWatermarkEntity,
+)
+from ta_core.domain.entities.event import EventOccurrence as EventOccurrenceEntity
 from ta_core.domain.entities.event import Recurrence as RecurrenceEntity
 from ta_core.domain.entities.event import RecurrenceRule as RecurrenceRuleEntity
 from ta_core.features.event import AttendanceAction, AttendanceState, Frequency, Weekday
@@ -21,11 +28,35 @@ from ta_core.infrastructure.sqlalchemy.models.shards.event import (
     EventAttendance,
     EventAttendanceActionLog,
     EventAttendanceForecast,
+    EventAttendanceForecastWatermark,
+    EventOccurrence,
     Recurrence,
     RecurrenceRule,
 )
-from ta_core.infrastructure.sqlalchemy.repositories.base import AbstractRepository
-from ta_core.utils.uuid import UUID, uuid_to_bin
+from ta_core.infrastructure.sqlalchemy.repositories.base import (
+    STREAM_BATCH_SIZE,
+    AbstractRepository,
+)
+from ta_core.utils.uuid import UUID, bin_to_uuid, uuid_to_bin
+
+Series = tuple[int, UUID]
+
+
+def _series_where(
+    model: (
+        type[EventAttendanceActionLog]
+        | type[EventAttendanceForecast]
+        | type[EventAttendanceForecastWatermark]
+    ),
+    series: set[Series],
+) -> tuple[Any, ...]:
+    return (
+        # The user_id condition on its own lets the query be routed to shards
+        model.user_id.in_({user_id for user_id, _ in series}),
+        tuple_(model.user_id, model.event_id).in_(
+            [(user_id, uuid_to_bin(event_id)) for user_id, event_id in series]
+        ),
+    )
 
 
 class RecurrenceRuleRepository(
@@ -132,6 +163,24 @@ class EventRepository(AbstractRepository[EventEntity, Event]):
         )
         return await self.create_async(event)
 
+    async def read_with_recurrence_by_id_or_none_async(
+        self, record_id: UUID
+    ) -> EventEntity | None:
+        records = await self._read_by_ids_async(
+            {record_id},
+            options=(joinedload(Event.recurrence).joinedload(Recurrence.rrule),),
+        )
+        return records[0].to_entity() if records else None
+
+    async def read_with_recurrence_by_ids_async(
+        self, record_ids: set[UUID]
+    ) -> tuple[EventEntity, ...]:
+        records = await self._read_by_ids_async(
+            record_ids,
+            options=(joinedload(Event.recurrence).joinedload(Recurrence.rrule),),
+        )
+        return tuple(record.to_entity() for record in records)
+
     async def read_with_recurrence_by_user_ids_async(
         self, user_ids: set[int]
     ) -> tuple[EventEntity, ...]:
@@ -143,6 +192,41 @@ class EventRepository(AbstractRepository[EventEntity, Event]):
         result = await self._uow.execute_async(stmt)
         return tuple(record.to_entity() for record in result.unique().scalars().all())
 
+    async def read_page_with_recurrence_by_user_ids_async(
+        self,
+        user_ids: set[int],
+        after: tuple[datetime, UUID] | None,
+        updated_since: datetime | None,
+        limit: int,
+    ) -> tuple[EventEntity, ...]:
+        # Keyset pagination on (start, id), which is unique and never changes
+        where: list[Any] = [self._model.user_id.in_(user_ids)]
+        if after is not None:
+            after_start, after_id = after
+            where.append(
+                tuple_(self._model.start, self._model.id)
+                > (after_start, uuid_to_bin(after_id))
+            )
+        if updated_since is not None:
+            where.append(self._model.updated_at >= updated_since)
+        stmt = (
+            select(self._model)
+            .where(*where)
+            .order_by(self._model.start.asc(), self._model.id.asc())
+            .limit(limit)
+            .options(joinedload(Event.recurrence).joinedload(Recurrence.rrule))
+        )
+        records = await self._read_ordered_scalars_async(
+            stmt, key=attrgetter("start", "id"), descending=False, limit=limit
+        )
+        return tuple(record.to_entity() for record in records)
+
+    async def read_ids_by_user_ids_async(self, user_ids: set[int]) -> set[UUID]:
+        rows = await self.read_columns_async(
+            (self._model.id,), where=(self._model.user_id.in_(user_ids),)
+        )
+        return {bin_to_uuid(event_id) for event_id, in rows}
+
     async def read_all_with_recurrence_async(
         self, where: tuple[Any, ...]
     ) -> tuple[EventEntity, ...]:
@@ -151,8 +235,20 @@ class EventRepository(AbstractRepository[EventEntity, Event]):
             .where(*where)
             .options(joinedload(Event.recurrence).joinedload(Recurrence.rrule))
         )
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.unique().scalars().all())
+        records = await self._read_scalars_async(stmt)
+        return tuple(record.to_entity() for record in records)
+
+    async def stream_all_with_recurrence_async(
+        self, where: tuple[Any, ...], batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[tuple[EventEntity, ...]]:
+        # Many-to-one joined loads don't need unique(), so they can be yielded in batches
+        stmt = (
+            select(self._model)
+            .where(*where)
+            .options(joinedload(Event.recurrence).joinedload(Recurrence.rrule))
+        )
+        async for records in self._stream_scalars_async(stmt, batch_size):
+            yield tuple(record.to_entity() for record in records)
 
 
 class EventAttendanceRepository(
@@ -198,6 +294,15 @@ class EventAttendanceRepository(
         )
         return await self.create_async(event_attendance)
 
+    async def bulk_upsert_event_attendances_async(
+        self, event_attendances: Iterable[EventAttendanceEntity]
+    ) -> int:
+        # Rows are matched on (user_id, event_id, start), so an existing row keeps
+        # its ID and only the state is replaced
+        return await self.bulk_upsert_async(
+            event_attendances, update_columns=("state",)
+        )
+
 
 class EventAttendanceActionLogRepository(
     AbstractRepository[EventAttendanceActionLogEntity, EventAttendanceActionLog],
@@ -256,9 +361,13 @@ class EventAttendanceActionLogRepository(
         )
         return event_attendance_action_logs[0] if event_attendance_action_logs else None
 
-    async def read_all_earliest_attend_async(
-        self,
-    ) -> tuple[EventAttendanceActionLogEntity, ...]:
+    def _select_first_actions(
+        self, action: str, descending: bool, series: set[Series] | None
+    ) -> Select[tuple[EventAttendanceActionLog]]:
+        # Conditions are built twice since bound parameters can't be shared
+        # between the subquery and the outer query
+        where = () if series is None else _series_where(self._model, series)
+        outer_where = () if series is None else _series_where(self._model, series)
         sub_query = (
             select(
                 self._model.user_id,
@@ -272,14 +381,18 @@ class EventAttendanceActionLogRepository(
                         self._model.event_id,
                         self._model.start,
                     ],
-                    order_by=self._model.acted_at.asc(),
+                    order_by=(
+                        self._model.acted_at.desc()
+                        if descending
+                        else self._model.acted_at.asc()
+                    ),
                 )
                 .label("rn"),
             )
-            .where(self._model.action == "attend")
+            .where(self._model.action == action, *where)
             .subquery()
         )
-        stmt = (
+        return (
             select(self._model)
             .join(
                 sub_query,
@@ -288,47 +401,54 @@ class EventAttendanceActionLogRepository(
                 & (self._model.start == sub_query.c.start)
                 & (self._model.acted_at == sub_query.c.acted_at),
             )
-            .where(sub_query.c.rn == 1)
+            .where(sub_query.c.rn == 1, *outer_where)
         )
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.scalars().all())
 
-    async def read_all_latest_leave_async(
+    async def read_all_earliest_attend_async(
+        self, series: set[Series] | None = None
+    ) -> tuple[EventAttendanceActionLogEntity, ...]:
+        stmt = self._select_first_actions("attend", False, series)
+        records = await self._read_scalars_async(stmt)
+        return tuple(record.to_entity() for record in records)
+
+    async def stream_all_earliest_attend_async(
         self,
+        series: set[Series] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[tuple[EventAttendanceActionLogEntity, ...]]:
+        stmt = self._select_first_actions("attend", False, series)
+        async for records in self._stream_scalars_async(stmt, batch_size):
+            yield tuple(record.to_entity() for record in records)
+
+    async def read_all_latest_leave_async(
+        self, series: set[Series] | None = None
     ) -> tuple[EventAttendanceActionLogEntity, ...]:
-        sub_query = (
-            select(
-                self._model.user_id,
-                self._model.event_id,
-                self._model.start,
-                self._model.acted_at,
-                func.row_number()
-                .over(
-                    partition_by=[
-                        self._model.user_id,
-                        self._model.event_id,
-                        self._model.start,
-                    ],
-                    order_by=self._model.acted_at.desc(),
-                )
-                .label("rn"),
-            )
-            .where(self._model.action == "leave")
-            .subquery()
-        )
-        stmt = (
-            select(self._model)
-            .join(
-                sub_query,
-                (self._model.user_id == sub_query.c.user_id)
-                & (self._model.event_id == sub_query.c.event_id)
-                & (self._model.start == sub_query.c.start)
-                & (self._model.acted_at == sub_query.c.acted_at),
-            )
-            .where(sub_query.c.rn == 1)
-        )
-        result = await self._uow.execute_async(stmt)
-        return tuple(record.to_entity() for record in result.scalars().all())
+        stmt = self._select_first_actions("leave", True, series)
+        records = await self._read_scalars_async(stmt)
+        return tuple(record.to_entity() for record in records)
+
+    async def stream_all_latest_leave_async(
+        self,
+        series: set[Series] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[tuple[EventAttendanceActionLogEntity, ...]]:
+        stmt = self._select_first_actions("leave", True, series)
+        async for records in self._stream_scalars_async(stmt, batch_size):
+            yield tuple(record.to_entity() for record in records)
+
+    async def read_all_latest_acted_at_by_series_async(
+        self,
+    ) -> dict[Series, datetime]:
+        stmt = select(
+            self._model.user_id,
+            self._model.event_id,
+            func.max(self._model.acted_at),
+        ).group_by(self._model.user_id, self._model.event_id)
+        rows = await self._read_rows_async(stmt)
+        return {
+            (user_id, bin_to_uuid(event_id)): acted_at
+            for user_id, event_id, acted_at in rows
+        }
 
     async def delete_by_user_id_and_event_id_and_start_async(
         self, user_id: int, event_id: UUID, start: datetime
@@ -357,6 +477,31 @@ class EventAttendanceForecastRepository(
 
         return await self.bulk_create_async(event_attendance_forecasts)
 
+    async def bulk_upsert_event_attendance_forecasts_async(
+        self,
+        event_attendance_forecasts: Iterable[EventAttendanceForecastEntity],
+        refreshed_at: datetime,
+    ) -> int:
+        return await self.bulk_upsert_async(
+            event_attendance_forecasts,
+            update_columns=(
+                "forecasted_attended_at",
+                "forecasted_duration",
+                "updated_at",
+            ),
+            values={"updated_at": refreshed_at},
+        )
+
+    async def delete_stale_event_attendance_forecasts_async(
+        self, refreshed_at: datetime, series: set[Series] | None = None
+    ) -> int:
+        if series is not None and not series:
+            return 0
+        where: tuple[Any, ...] = (self._model.updated_at < refreshed_at,)
+        if series is not None:
+            where += _series_where(self._model, series)
+        return await self.delete_all_in_chunks_async(where=where)
+
     async def read_all_by_event_ids_async(
         self, event_ids: set[UUID]
     ) -> tuple[EventAttendanceForecastEntity, ...]:
@@ -367,3 +512,107 @@ class EventAttendanceForecastRepository(
                 ),
             )
         )
+
+    async def read_rows_by_event_ids_async(
+        self, event_ids: set[UUID]
+    ) -> tuple[Row[tuple[bytes, int, datetime, datetime, int]], ...]:
+        return await self.read_columns_async(
+            (
+                self._model.event_id,
+                self._model.user_id,
+                self._model.start,
+                self._model.forecasted_attended_at,
+                self._model.forecasted_duration,
+            ),
+            where=(
+                self._model.event_id.in_(
+                    uuid_to_bin(event_id) for event_id in event_ids
+                ),
+            ),
+        )
+
+
+class EventAttendanceForecastWatermarkRepository(
+    AbstractRepository[
+        EventAttendanceForecastWatermarkEntity, EventAttendanceForecastWatermark
+    ],
+):
+    @property
+    def _model(self) -> type[EventAttendanceForecastWatermark]:
+        return EventAttendanceForecastWatermark
+
+    async def bulk_upsert_watermarks_async(
+        self,
+        watermarks: Iterable[EventAttendanceForecastWatermarkEntity],
+        refreshed_at: datetime,
+    ) -> int:
+        return await self.bulk_upsert_async(
+            watermarks,
+            update_columns=("last_acted_at", "last_start", "updated_at"),
+            values={"updated_at": refreshed_at},
+        )
+
+    async def delete_stale_watermarks_async(self, refreshed_at: datetime) -> int:
+        return await self.delete_all_in_chunks_async(
+            where=(self._model.updated_at < refreshed_at,)
+        )
+
+
+class EventOccurrenceRepository(
+    AbstractRepository[EventOccurrenceEntity, EventOccurrence],
+):
+    @property
+    def _model(self) -> type[EventOccurrence]:
+        return EventOccurrence
+
+    async def bulk_upsert_event_occurrences_async(
+        self,
+        event_occurrences: (
+            Iterable[EventOccurrenceEntity] | AsyncIterable[EventOccurrenceEntity]
+        ),
+    ) -> int:
+        # Occurrences that already exist keep their id and only get their end rewritten
+        return await self.bulk_upsert_async(event_occurrences, update_columns=("end",))
+
+    async def read_latest_starts_async(self) -> dict[UUID, datetime]:
+        stmt = select(
+            self._model.user_id,
+            self._model.event_id,
+            func.max(self._model.start),
+        ).group_by(self._model.user_id, self._model.event_id)
+        rows = await self._read_rows_async(stmt)
+        return {bin_to_uuid(event_id): start for _, event_id, start in rows}
+
+    async def read_by_user_ids_and_start_range_async(
+        self,
+        user_ids: set[int],
+        start_from: datetime,
+        start_to: datetime,
+        after: tuple[datetime, UUID] | None,
+        limit: int,
+    ) -> tuple[EventOccurrenceEntity, ...]:
+        if not user_ids:
+            return ()
+        # Keyset pagination on (start, id). InnoDB appends the primary key to
+        # secondary indexes, so the (user_id, start) index covers the order
+        where: list[Any] = [
+            self._model.user_id.in_(user_ids),
+            self._model.start >= start_from,
+            self._model.start < start_to,
+        ]
+        if after is not None:
+            after_start, after_id = after
+            where.append(
+                tuple_(self._model.start, self._model.id)
+                > (after_start, uuid_to_bin(after_id))
+            )
+        stmt = (
+            select(self._model)
+            .where(*where)
+            .order_by(self._model.start.asc(), self._model.id.asc())
+            .limit(limit)
+        )
+        records = await self._read_ordered_scalars_async(
+            stmt, key=attrgetter("start", "id"), descending=False, limit=limit
+        )
+        return tuple(record.to_entity() for record in records)
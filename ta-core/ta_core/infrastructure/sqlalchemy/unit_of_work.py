@@ -1,7 +1,13 @@
-from typing import Any, Iterable, Mapping, Sequence
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Mapping, Sequence, cast
 
+from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.result import Result
+from sqlalchemy.ext.asyncio.engine import AsyncConnection, AsyncEngine
+from sqlalchemy.ext.asyncio.result import AsyncResult
 from sqlalchemy.ext.asyncio.session import AsyncSession, AsyncSessionTransaction
+from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.sql.base import Executable
 
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
@@ -10,14 +16,17 @@ from ta_core.use_case.unit_of_work_base import IUnitOfWork
 class SqlalchemyUnitOfWork(IUnitOfWork):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._has_pending_writes = False
 
     def begin_nested(self) -> AsyncSessionTransaction:
         return self._session.begin_nested()
 
     def add(self, model: object) -> None:
+        self._has_pending_writes = True
         self._session.add(model)
 
     def add_all(self, models: Iterable[object]) -> None:
+        self._has_pending_writes = True
         self._session.add_all(models)
 
     async def flush_async(self) -> None:
@@ -25,16 +34,96 @@ class SqlalchemyUnitOfWork(IUnitOfWork):
 
     async def commit_async(self) -> None:
         await self._session.commit()
+        self._has_pending_writes = False
 
     async def rollback_async(self) -> None:
         await self._session.rollback()
+        self._has_pending_writes = False
 
     async def delete_async(self, record: object) -> None:
+        self._has_pending_writes = True
         await self._session.delete(record)
 
     async def execute_async(
         self,
         stmt: Executable,
         params: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None = None,
+        shard_id: str | None = None,
     ) -> Result[Any]:
+        if stmt.is_dml:
+            self._has_pending_writes = True
+        if shard_id is not None:
+            return await self._session.execute(
+                stmt, params, bind_arguments={"shard_id": shard_id}
+            )
         return await self._session.execute(stmt, params)
+
+    async def stream_async(
+        self,
+        stmt: Executable,
+        params: Mapping[str, Any] | None = None,
+        shard_id: str | None = None,
+    ) -> AsyncResult[Any]:
+        # Rows are fetched through a server-side cursor, which holds the shard's
+        # connection until the result is exhausted or closed
+        if shard_id is not None:
+            return await self._session.stream(
+                stmt, params, bind_arguments={"shard_id": shard_id}
+            )
+        return await self._session.stream(stmt, params)
+
+    async def scatter_execute_async(
+        self,
+        stmt: Executable,
+        shard_ids: Iterable[str],
+        params: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None = None,
+    ) -> list[Result[Any]]:
+        if self._has_pending_writes:
+            # Uncommitted changes are only visible on this session's own connections
+            return [
+                await self._session.execute(
+                    stmt, params, bind_arguments={"shard_id": shard_id}
+                )
+                for shard_id in shard_ids
+            ]
+        return list(
+            await asyncio.gather(
+                *(
+                    self._execute_on_shard_async(stmt, shard_id, params)
+                    for shard_id in shard_ids
+                )
+            )
+        )
+
+    @asynccontextmanager
+    async def begin_autonomous(self, shard_id: str) -> AsyncIterator[AsyncConnection]:
+        # A dedicated connection whose transaction commits on its own, outside this
+        # session
+        sharded_session = cast(ShardedSession, self._session.sync_session)
+        engine = AsyncEngine(cast(Engine, sharded_session.get_bind(shard_id=shard_id)))
+        async with engine.begin() as connection:
+            yield connection
+
+    async def execute_autonomous_async(
+        self,
+        stmt: Executable,
+        shard_id: str,
+        params: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None = None,
+    ) -> Result[Any]:
+        async with self.begin_autonomous(shard_id) as connection:
+            result = await connection.execute(stmt, params)
+            return result
+
+    async def _execute_on_shard_async(
+        self,
+        stmt: Executable,
+        shard_id: str,
+        params: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None,
+    ) -> Result[Any]:
+        sharded_session = cast(ShardedSession, self._session.sync_session)
+        engine = AsyncEngine(cast(Engine, sharded_session.get_bind(shard_id=shard_id)))
+        async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+            result = await session.execute(stmt, params)
+            # Buffer the rows before the connection is returned to the pool. ORM
+            # instances come back detached, so relationships must be eager-loaded
+            return result.freeze()()
@@ -12,6 +12,7 @@ from ta_core.features.account import Gender
 from ta_core.infrastructure.db.transaction import rollbackable
 from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
 from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
+from ta_core.use_case.follow_graph import FollowGraph
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
 from ta_core.utils.uuid import UUID, generate_uuid, uuid_to_str
 
@@ -35,6 +36,9 @@ class AccountUseCase:
     ) -> CreateUserAccountResponse:
         user_account_repository = UserAccountRepository(self.uow)
 
+        # Hashed before any query so the transaction isn't held open meanwhile
+        hashed_password = await self._password_hasher.get_password_hash_async(password)
+
         user_id = await SequenceUserId.id_generator(self.uow)
 
         followees = await user_account_repository.read_by_usernames_async(
@@ -46,7 +50,7 @@ class AccountUseCase:
             entity_id=user_account_id,
             user_id=user_id,
             username=username,
-            hashed_password=self._password_hasher.get_password_hash(password),
+            hashed_password=hashed_password,
             birth_date=birth_date,
             gender=gender,
             email=email,
@@ -59,6 +63,10 @@ class AccountUseCase:
                 error_codes=(ErrorCode.USERNAME_OR_EMAIL_ALREADY_REGISTERED,)
             )
 
+        # Only dropped here, since the account is not committed yet. Its followee
+        # set is loaded on first use
+        FollowGraph.invalidate([user_account_id])
+
         return CreateUserAccountResponse(error_codes=())
 
     @rollbackable
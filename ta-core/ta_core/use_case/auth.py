@@ -1,6 +1,13 @@
+import time
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import ClassVar
 
+from ta_core.constants.constants import (
+    AUTH_PRINCIPAL_CACHE_SIZE,
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    AUTH_TRUST_ACCESS_TOKEN_CLAIMS,
+)
 from ta_core.constants.secrets import JWT_SECRET_KEY
 from ta_core.cryptography.hash import PasswordHasher
 from ta_core.cryptography.jwt import JWTCryptography
@@ -11,6 +18,7 @@ from ta_core.features.auth import TokenType
 from ta_core.infrastructure.db.transaction import rollbackable
 from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
+from ta_core.utils.cache import TTLCache
 
 
 @dataclass(frozen=True)
@@ -31,29 +39,46 @@ class AuthUseCase:
         refresh_token_expires=_REFRESH_TOKEN_EXPIRES,
     )
 
+    # Validated access-token principals keyed by jti. There is no account
+    # disable or logout path, so the TTL alone bounds how stale an entry can be
+    _principal_cache: ClassVar[TTLCache[str, Account]] = TTLCache(
+        max_size=AUTH_PRINCIPAL_CACHE_SIZE, ttl=AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+    )
+
     async def get_account_by_token(
         self, token: str, token_type: TokenType
     ) -> Account | None:
         user_account_repository = UserAccountRepository(self.uow)
 
-        token_info = self._jwt_cryptography.get_subject_and_group_from_token(
-            token, token_type
-        )
-        if token_info is None:
+        claims = self._jwt_cryptography.get_claims_from_token(token, token_type)
+        if claims is None:
             return None
-        account_id, group = token_info
+        account_id = claims.subject
 
-        user_account = await user_account_repository.read_by_id_or_none_async(
-            account_id
-        )
-        if user_account is None:
-            raise ValueError("User account not found")
+        is_access_token = token_type == TokenType.ACCESS
+        # Tokens without a jti have no key of their own, so they bypass the cache
+        jti = claims.jti if is_access_token else None
+        if jti is not None:
+            cached_account = self._principal_cache.get(jti)
+            if cached_account is not None and cached_account.account_id == account_id:
+                return cached_account
 
-        return Account(
+        account = Account(
             account_id=account_id,
-            group=group,
+            group=claims.group,
             disabled=False,
         )
+        if not (is_access_token and AUTH_TRUST_ACCESS_TOKEN_CLAIMS):
+            user_account = await user_account_repository.read_by_id_or_none_async(
+                account_id
+            )
+            if user_account is None:
+                raise ValueError("User account not found")
+
+        if jti is not None:
+            # Never outlives the token, and bounds how stale a validation can be
+            self._principal_cache.set(jti, account, ttl=claims.expires_at - time.time())
+        return account
 
     @rollbackable
     async def auth_user_async(self, username: str, password: str) -> AuthTokenResponse:
@@ -70,7 +95,7 @@ class AuthUseCase:
                 refresh_token_max_age=None,
             )
 
-        if not self._password_hasher.verify_password(
+        if not await self._password_hasher.verify_password_async(
             password, user_account.hashed_password
         ):
             return AuthTokenResponse(
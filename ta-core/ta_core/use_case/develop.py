@@ -1,6 +1,7 @@
 import random
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Iterator
 from zoneinfo import ZoneInfo
 
 from ta_ml.constants import timesfm
@@ -11,6 +12,7 @@ from ta_core.domain.entities.event import (
 from ta_core.dtos.base import BaseModelWithErrorCodes
 from ta_core.features.account import Gender
 from ta_core.features.event import AttendanceAction, Frequency, Weekday
+from ta_core.infrastructure.db.sharding import generate_shard_uuid
 from ta_core.infrastructure.db.transaction import rollbackable
 from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
 from ta_core.infrastructure.sqlalchemy.repositories.event import (
@@ -50,7 +52,7 @@ class DevelopUseCase:
         )
         assert host is not None
 
-        recurrence_rule_id = generate_uuid()
+        recurrence_rule_id = generate_shard_uuid(0)
         recurrence_rule = await recurrence_rule_repository.create_recurrence_rule_async(
             entity_id=recurrence_rule_id,
             user_id=0,
@@ -71,7 +73,7 @@ class DevelopUseCase:
         )
         assert recurrence_rule is not None
 
-        recurrence_id = generate_uuid()
+        recurrence_id = generate_shard_uuid(0)
         await recurrence_repository.create_recurrence_async(
             entity_id=recurrence_id,
             user_id=0,
@@ -81,7 +83,7 @@ class DevelopUseCase:
             exdate=[],
         )
 
-        event_id = generate_uuid()
+        event_id = generate_shard_uuid(0)
         await event_repository.create_event_async(
             entity_id=event_id,
             user_id=0,
@@ -114,30 +116,34 @@ class DevelopUseCase:
                 follower_ids=set(),
             )
 
-            for i in range(timesfm.CONTEXT_LEN):
-                start = today - timedelta(days=i)
-                attend_log = EventAttendanceActionLogEntity(
-                    entity_id=generate_uuid(),
-                    user_id=user_id,
-                    event_id=event_id,
-                    start=start,
-                    action=AttendanceAction.ATTEND,
-                    acted_at=(
-                        start + timedelta(hours=random.uniform(5, 7))
-                        if start.weekday() != 5 and start.weekday() != 6
-                        else start + timedelta(hours=random.uniform(11, 13))
-                    ),
-                )
-                leave_log = EventAttendanceActionLogEntity(
-                    entity_id=generate_uuid(),
-                    user_id=user_id,
-                    event_id=event_id,
-                    start=start,
-                    action=AttendanceAction.LEAVE,
-                    acted_at=(start + timedelta(hours=random.uniform(17, 19))),
-                )
-                await event_attendance_action_log_repository.bulk_create_event_attendance_action_logs_async(
-                    [attend_log, leave_log]
-                )
+        def generate_action_logs() -> Iterator[EventAttendanceActionLogEntity]:
+            for user_id in user_ids:
+                for i in range(timesfm.CONTEXT_LEN):
+                    start = today - timedelta(days=i)
+                    yield EventAttendanceActionLogEntity(
+                        entity_id=generate_shard_uuid(user_id),
+                        user_id=user_id,
+                        event_id=event_id,
+                        start=start,
+                        action=AttendanceAction.ATTEND,
+                        acted_at=(
+                            start + timedelta(hours=random.uniform(5, 7))
+                            if start.weekday() != 5 and start.weekday() != 6
+                            else start + timedelta(hours=random.uniform(11, 13))
+                        ),
+                    )
+                    yield EventAttendanceActionLogEntity(
+                        entity_id=generate_shard_uuid(user_id),
+                        user_id=user_id,
+                        event_id=event_id,
+                        start=start,
+                        action=AttendanceAction.LEAVE,
+                        acted_at=(start + timedelta(hours=random.uniform(17, 19))),
+                    )
+
+        # Mock logs are written straight to each shard, outside the session
+        await event_attendance_action_log_repository.bulk_insert_stream_async(
+            generate_action_logs(), concurrent=True
+        )
 
         return BaseModelWithErrorCodes(error_codes=())
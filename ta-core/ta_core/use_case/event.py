@@ -1,34 +1,55 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import TypeVar
+from datetime import date, datetime, timedelta
+from itertools import dropwhile, islice, takewhile
+from typing import Iterator, TypeVar
 from zoneinfo import ZoneInfo
 
-from ta_ml.forecast.attendance import forecast_attendance_time
+from sqlalchemy.exc import SQLAlchemyError
 
+from ta_core.constants.constants import (
+    EVENT_OCCURRENCE_CREATE_MAX_COUNT,
+    EVENT_OCCURRENCE_HORIZON_DAYS,
+    EVENT_OCCURRENCE_MAX_COUNT,
+    EVENT_OCCURRENCE_QUERY_MAX_COUNT,
+    EVENT_PAGE_DEFAULT_SIZE,
+    RECURRENCE_CACHE_SIZE,
+)
 from ta_core.domain.entities.event import Event as EventEntity
+from ta_core.domain.entities.event import EventAttendance as EventAttendanceEntity
 from ta_core.domain.entities.event import (
     EventAttendanceActionLog as EventAttendanceActionLogEntity,
 )
 from ta_core.domain.entities.event import (
     EventAttendanceForecast as EventAttendanceForecastEntity,
 )
+from ta_core.domain.entities.event import (
+    EventAttendanceForecastWatermark as EventAttendanceForecastWatermarkEntity,
+)
+from ta_core.domain.entities.event import EventOccurrence as EventOccurrenceEntity
+from ta_core.domain.entities.event import Recurrence as RecurrenceEntity
 from ta_core.dtos.event import Attendance as AttendanceDto
 from ta_core.dtos.event import AttendancesWithUsername as AttendancesWithUsernameDto
 from ta_core.dtos.event import AttendanceTimeForecast as AttendanceTimeForecastDto
 from ta_core.dtos.event import (
     AttendanceTimeForecastsWithUsername as AttendanceTimeForecastsWithUsernameDto,
 )
-from ta_core.dtos.event import AttendEventResponse, CreateEventResponse
+from ta_core.dtos.event import AttendEventResponse
+from ta_core.dtos.event import BatchAttendance as BatchAttendanceDto
+from ta_core.dtos.event import BatchAttendEventResponse, CreateEventResponse
 from ta_core.dtos.event import Event as EventDto
+from ta_core.dtos.event import EventOccurrence as EventOccurrenceDto
 from ta_core.dtos.event import EventWithId as EventWithIdDto
 from ta_core.dtos.event import (
     ForecastAttendanceTimeResponse,
     GetAttendanceHistoryResponse,
     GetAttendanceTimeForecastsResponse,
+    GetEventOccurrencesResponse,
     GetFollowingEventsResponse,
     GetGuestAttendanceStatusResponse,
     GetMyEventsResponse,
+    MaterializeEventOccurrencesResponse,
     UpdateAttendancesResponse,
 )
 from ta_core.error.error_code import ErrorCode
@@ -40,22 +61,28 @@ from ta_core.features.event import (
     RecurrenceRule,
     Weekday,
 )
+from ta_core.infrastructure.db.sharding import db_shard_resolver, generate_shard_uuid
 from ta_core.infrastructure.db.transaction import rollbackable
 from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
 from ta_core.infrastructure.sqlalchemy.repositories.event import (
     EventAttendanceActionLogRepository,
     EventAttendanceForecastRepository,
+    EventAttendanceForecastWatermarkRepository,
     EventAttendanceRepository,
+    EventOccurrenceRepository,
     EventRepository,
     RecurrenceRepository,
     RecurrenceRuleRepository,
 )
+from ta_core.use_case.follow_graph import FollowGraph
 from ta_core.use_case.unit_of_work_base import IUnitOfWork
-from ta_core.utils.datetime import validate_date
+from ta_core.utils.cache import LRUCache
+from ta_core.utils.datetime import to_utc, validate_date
 from ta_core.utils.rfc5545 import parse_recurrence, serialize_recurrence
-from ta_core.utils.uuid import UUID, generate_uuid, str_to_uuid, uuid_to_str
+from ta_core.utils.uuid import UUID, bin_to_uuid, str_to_uuid, uuid_to_str
 
 T = TypeVar("T")
+TEventPageItem = TypeVar("TEventPageItem", EventEntity, EventOccurrenceEntity)
 
 
 def convert_tuple_to_list(tpl: tuple[T, ...] | None) -> list[T] | None:
@@ -88,40 +115,70 @@ def convert_str_list_to_date_tuple(dates: list[str]) -> tuple[date, ...]:
     return tuple(date.fromisoformat(d) for d in dates)
 
 
+@dataclass(frozen=True)
+class CompiledRecurrence:
+    recurrence: Recurrence
+    recurrence_list: tuple[str, ...]
+
+
+# Recurrence rows are never updated, so a compiled recurrence stays valid for
+# its recurrence_id. RDATE and EXDATE are only serialized for all-day events
+_compiled_recurrence_cache: LRUCache[tuple[UUID, bool], CompiledRecurrence] = LRUCache(
+    max_size=RECURRENCE_CACHE_SIZE
+)
+
+
+def compile_recurrence(
+    recurrence: RecurrenceEntity, is_all_day: bool
+) -> CompiledRecurrence:
+    feature = Recurrence(
+        rrule=RecurrenceRule(
+            freq=recurrence.rrule.freq,
+            until=recurrence.rrule.until,
+            count=recurrence.rrule.count,
+            interval=recurrence.rrule.interval,
+            bysecond=convert_list_to_tuple(recurrence.rrule.bysecond),
+            byminute=convert_list_to_tuple(recurrence.rrule.byminute),
+            byhour=convert_list_to_tuple(recurrence.rrule.byhour),
+            byday=convert_byday_list_to_byday_tuple(recurrence.rrule.byday),
+            bymonthday=convert_list_to_tuple(recurrence.rrule.bymonthday),
+            byyearday=convert_list_to_tuple(recurrence.rrule.byyearday),
+            byweekno=convert_list_to_tuple(recurrence.rrule.byweekno),
+            bymonth=convert_list_to_tuple(recurrence.rrule.bymonth),
+            bysetpos=convert_list_to_tuple(recurrence.rrule.bysetpos),
+            wkst=recurrence.rrule.wkst,
+        ),
+        rdate=(
+            convert_str_list_to_date_tuple(recurrence.rdate) if is_all_day else tuple()
+        ),
+        exdate=(
+            convert_str_list_to_date_tuple(recurrence.exdate) if is_all_day else tuple()
+        ),
+    )
+    return CompiledRecurrence(
+        recurrence=feature,
+        recurrence_list=tuple(serialize_recurrence(feature, is_all_day)),
+    )
+
+
+def get_compiled_recurrence(
+    recurrence: RecurrenceEntity, is_all_day: bool
+) -> CompiledRecurrence:
+    return _compiled_recurrence_cache.get_or_set(
+        (recurrence.id, is_all_day),
+        lambda: compile_recurrence(recurrence, is_all_day),
+    )
+
+
 def serialize_events(events: tuple[EventEntity, ...]) -> list[EventWithIdDto]:
     event_dto_list = []
     for event in events:
-        recurrence: Recurrence | None = None
+        recurrence_list: list[str] = []
         if event.recurrence is not None:
-            recurrence = Recurrence(
-                rrule=RecurrenceRule(
-                    freq=event.recurrence.rrule.freq,
-                    until=event.recurrence.rrule.until,
-                    count=event.recurrence.rrule.count,
-                    interval=event.recurrence.rrule.interval,
-                    bysecond=convert_list_to_tuple(event.recurrence.rrule.bysecond),
-                    byminute=convert_list_to_tuple(event.recurrence.rrule.byminute),
-                    byhour=convert_list_to_tuple(event.recurrence.rrule.byhour),
-                    byday=convert_byday_list_to_byday_tuple(
-                        event.recurrence.rrule.byday
-                    ),
-                    bymonthday=convert_list_to_tuple(event.recurrence.rrule.bymonthday),
-                    byyearday=convert_list_to_tuple(event.recurrence.rrule.byyearday),
-                    byweekno=convert_list_to_tuple(event.recurrence.rrule.byweekno),
-                    bymonth=convert_list_to_tuple(event.recurrence.rrule.bymonth),
-                    bysetpos=convert_list_to_tuple(event.recurrence.rrule.bysetpos),
-                    wkst=event.recurrence.rrule.wkst,
-                ),
-                rdate=(
-                    convert_str_list_to_date_tuple(event.recurrence.rdate)
-                    if event.is_all_day
-                    else tuple()
-                ),
-                exdate=(
-                    convert_str_list_to_date_tuple(event.recurrence.exdate)
-                    if event.is_all_day
-                    else tuple()
-                ),
+            recurrence_list = list(
+                get_compiled_recurrence(
+                    event.recurrence, event.is_all_day
+                ).recurrence_list
             )
         event_dto_list.append(
             EventWithIdDto(
@@ -131,13 +188,62 @@ def serialize_events(events: tuple[EventEntity, ...]) -> list[EventWithIdDto]:
                 start=event.start,
                 end=event.end,
                 is_all_day=event.is_all_day,
-                recurrence_list=serialize_recurrence(recurrence, event.is_all_day),
+                recurrence_list=recurrence_list,
                 timezone=event.timezone,
             )
         )
     return event_dto_list
 
 
+def encode_event_cursor(event: EventEntity | EventOccurrenceEntity) -> str:
+    value = f"{event.start.isoformat()}_{uuid_to_str(event.id)}"
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_event_cursor(cursor: str) -> tuple[datetime, UUID] | None:
+    try:
+        start, event_id = urlsafe_b64decode(cursor.encode()).decode().split("_")
+        return datetime.fromisoformat(start), str_to_uuid(event_id)
+    except ValueError:
+        return None
+
+
+def split_event_page(
+    events: tuple[TEventPageItem, ...], limit: int
+) -> tuple[tuple[TEventPageItem, ...], str | None]:
+    # One extra event is read to tell whether a next page exists
+    if len(events) <= limit:
+        return events, None
+    page = events[:limit]
+    return page, encode_event_cursor(page[-1])
+
+
+def generate_event_occurrences(
+    event: EventEntity,
+    after: datetime | None,
+    before: datetime,
+    limit: int = EVENT_OCCURRENCE_MAX_COUNT,
+) -> Iterator[EventOccurrenceEntity]:
+    # Occurrences starting in (after, before), at most `limit`. `after` is the
+    # latest occurrence already materialized, so it is not generated again
+    duration = event.end - event.start
+    before_utc = to_utc(before)
+    starts: Iterator[datetime] = takewhile(
+        lambda start: to_utc(start) < before_utc, event.iter_starts(after)
+    )
+    if after is not None:
+        after_utc = to_utc(after)
+        starts = dropwhile(lambda start: to_utc(start) <= after_utc, starts)
+    for start in islice(starts, limit):
+        yield EventOccurrenceEntity(
+            entity_id=generate_shard_uuid(event.user_id),
+            user_id=event.user_id,
+            event_id=event.id,
+            start=start,
+            end=start + duration,
+        )
+
+
 @dataclass(frozen=True)
 class EventUseCase:
     uow: IUnitOfWork
@@ -152,6 +258,7 @@ class EventUseCase:
         recurrence_rule_repository = RecurrenceRuleRepository(self.uow)
         recurrence_repository = RecurrenceRepository(self.uow)
         event_repository = EventRepository(self.uow)
+        event_occurrence_repository = EventOccurrenceRepository(self.uow)
 
         assert event_dto.start.tzname() == "UTC"
         assert event_dto.end.tzname() == "UTC"
@@ -189,7 +296,7 @@ class EventUseCase:
         else:
             recurrence_rule = (
                 await recurrence_rule_repository.create_recurrence_rule_async(
-                    entity_id=generate_uuid(),
+                    entity_id=generate_shard_uuid(user_id),
                     user_id=user_id,
                     freq=event.recurrence.rrule.freq,
                     until=event.recurrence.rrule.until,
@@ -213,7 +320,7 @@ class EventUseCase:
                 raise ValueError("Failed to create recurrence rule")
 
             recurrence_entity = await recurrence_repository.create_recurrence_async(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 rrule_id=recurrence_rule.id,
                 rrule=recurrence_rule,
@@ -226,7 +333,7 @@ class EventUseCase:
             recurrence_id = recurrence_entity.id
 
         event_entity = await event_repository.create_event_async(
-            entity_id=generate_uuid(),
+            entity_id=generate_shard_uuid(user_id),
             user_id=user_id,
             summary=event.summary,
             location=event.location,
@@ -239,6 +346,17 @@ class EventUseCase:
         if event_entity is None:
             raise ValueError("Failed to create event")
 
+        if event.recurrence is not None:
+            event_entity.recurrence = recurrence_entity
+        horizon = datetime.now(ZoneInfo("UTC")) + timedelta(
+            days=EVENT_OCCURRENCE_HORIZON_DAYS
+        )
+        await event_occurrence_repository.bulk_upsert_event_occurrences_async(
+            generate_event_occurrences(
+                event_entity, None, horizon, limit=EVENT_OCCURRENCE_CREATE_MAX_COUNT
+            )
+        )
+
         return CreateEventResponse(error_codes=())
 
     @rollbackable
@@ -264,7 +382,9 @@ class EventUseCase:
 
         user_id = guest.user_id
 
-        event = await event_repository.read_by_id_or_none_async(event_id)
+        event = await event_repository.read_with_recurrence_by_id_or_none_async(
+            event_id
+        )
         if event is None:
             return AttendEventResponse(error_codes=(ErrorCode.EVENT_NOT_FOUND,))
 
@@ -275,7 +395,7 @@ class EventUseCase:
                 )
 
             await event_attendance_repository.create_or_update_event_attendance_async(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=event.id,
                 start=start,
@@ -286,7 +406,7 @@ class EventUseCase:
                 return AttendEventResponse(error_codes=(ErrorCode.EVENT_NOT_LEAVEABLE,))
 
             await event_attendance_repository.create_or_update_event_attendance_async(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=event.id,
                 start=start,
@@ -294,7 +414,7 @@ class EventUseCase:
             )
 
         await event_attendance_action_log_repository.create_event_attendance_action_log_async(
-            entity_id=generate_uuid(),
+            entity_id=generate_shard_uuid(user_id),
             user_id=user_id,
             event_id=event.id,
             start=start,
@@ -304,6 +424,128 @@ class EventUseCase:
 
         return AttendEventResponse(error_codes=())
 
+    @rollbackable
+    async def batch_attend_event_async(
+        self, host_id: UUID, attendances: list[BatchAttendanceDto]
+    ) -> BatchAttendEventResponse:
+        user_account_repository = UserAccountRepository(self.uow)
+        event_repository = EventRepository(self.uow)
+        event_attendance_repository = EventAttendanceRepository(self.uow)
+        event_attendance_action_log_repository = EventAttendanceActionLogRepository(
+            self.uow
+        )
+
+        host = await user_account_repository.read_by_id_or_none_async(host_id)
+        if host is None:
+            return BatchAttendEventResponse(
+                results=[], error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,)
+            )
+
+        event_ids: list[UUID | None] = []
+        for attendance in attendances:
+            try:
+                event_ids.append(str_to_uuid(attendance.event_id))
+            except ValueError:
+                event_ids.append(None)
+
+        guests = await user_account_repository.read_by_usernames_async(
+            {attendance.username for attendance in attendances}
+        )
+        user_ids = {guest.username: guest.user_id for guest in guests}
+        # Only events hosted by the caller can be recorded
+        events = {
+            event.id: event
+            for event in await event_repository.read_with_recurrence_by_ids_async(
+                {event_id for event_id in event_ids if event_id is not None}
+            )
+            if event.user_id == host.user_id
+        }
+
+        now = datetime.now(ZoneInfo("UTC"))
+        results: list[AttendEventResponse] = []
+        shard_attendances: dict[
+            int, dict[tuple[int, UUID, datetime], EventAttendanceEntity]
+        ] = defaultdict(dict)
+        shard_logs: dict[int, list[EventAttendanceActionLogEntity]] = defaultdict(list)
+        shard_result_indices: dict[int, list[int]] = defaultdict(list)
+        for attendance, event_id in zip(attendances, event_ids):
+            user_id = user_ids.get(attendance.username)
+            if user_id is None:
+                results.append(
+                    AttendEventResponse(error_codes=(ErrorCode.USERNAME_NOT_EXIST,))
+                )
+                continue
+            event = events.get(event_id) if event_id is not None else None
+            if event is None:
+                results.append(
+                    AttendEventResponse(error_codes=(ErrorCode.EVENT_NOT_FOUND,))
+                )
+                continue
+
+            if attendance.action == AttendanceAction.ATTEND:
+                if not event.is_attendable(attendance.start, now):
+                    results.append(
+                        AttendEventResponse(
+                            error_codes=(ErrorCode.EVENT_NOT_ATTENDABLE,)
+                        )
+                    )
+                    continue
+                state = AttendanceState.PRESENT
+            else:
+                if not event.is_leaveable(attendance.start, now):
+                    results.append(
+                        AttendEventResponse(
+                            error_codes=(ErrorCode.EVENT_NOT_LEAVEABLE,)
+                        )
+                    )
+                    continue
+                state = AttendanceState.EXCUSED_ABSENCE
+
+            shard_id = db_shard_resolver.resolve_shard_id(user_id)
+            # A later action for the same occurrence overrides an earlier one
+            shard_attendances[shard_id][(user_id, event.id, attendance.start)] = (
+                EventAttendanceEntity(
+                    entity_id=generate_shard_uuid(user_id),
+                    user_id=user_id,
+                    event_id=event.id,
+                    start=attendance.start,
+                    state=state,
+                )
+            )
+            shard_logs[shard_id].append(
+                EventAttendanceActionLogEntity(
+                    entity_id=generate_shard_uuid(user_id),
+                    user_id=user_id,
+                    event_id=event.id,
+                    start=attendance.start,
+                    action=attendance.action,
+                    acted_at=now,
+                )
+            )
+            shard_result_indices[shard_id].append(len(results))
+            results.append(AttendEventResponse(error_codes=()))
+
+        # Each shard is committed on its own so its row locks are released before
+        # the next shard is written. A shard that fails is rolled back and only
+        # its items are reported as not recorded
+        for shard_id in sorted(shard_logs):
+            try:
+                await event_attendance_repository.bulk_upsert_event_attendances_async(
+                    shard_attendances[shard_id].values()
+                )
+                await event_attendance_action_log_repository.bulk_insert_stream_async(
+                    shard_logs[shard_id]
+                )
+                await self.uow.commit_async()
+            except SQLAlchemyError:
+                await self.uow.rollback_async()
+                for index in shard_result_indices[shard_id]:
+                    results[index] = AttendEventResponse(
+                        error_codes=(ErrorCode.EVENT_ATTENDANCE_NOT_RECORDED,)
+                    )
+
+        return BatchAttendEventResponse(results=results, error_codes=())
+
     @rollbackable
     async def update_attendances_async(
         self,
@@ -327,7 +569,9 @@ class EventUseCase:
 
         user_id = guest.user_id
 
-        event = await event_repository.read_by_id_or_none_async(event_id)
+        event = await event_repository.read_with_recurrence_by_id_or_none_async(
+            event_id
+        )
         if event is None:
             return UpdateAttendancesResponse(error_codes=(ErrorCode.EVENT_NOT_FOUND,))
 
@@ -337,7 +581,7 @@ class EventUseCase:
 
         event_attendance_action_logs = [
             EventAttendanceActionLogEntity(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=event.id,
                 start=start,
@@ -353,7 +597,7 @@ class EventUseCase:
         latest_log = max(event_attendance_action_logs, key=lambda log: log.acted_at)
         if latest_log.action == AttendanceAction.ATTEND:
             await event_attendance_repository.create_or_update_event_attendance_async(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=event.id,
                 start=start,
@@ -361,7 +605,7 @@ class EventUseCase:
             )
         elif latest_log.action == AttendanceAction.LEAVE:
             await event_attendance_repository.create_or_update_event_attendance_async(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=event.id,
                 start=start,
@@ -393,7 +637,9 @@ class EventUseCase:
 
         user_id = guest.user_id
 
-        event = await event_repository.read_by_id_or_none_async(event_id)
+        event = await event_repository.read_with_recurrence_by_id_or_none_async(
+            event_id
+        )
         if event is None:
             return GetAttendanceHistoryResponse(
                 attendances_with_username=AttendancesWithUsernameDto(
@@ -418,51 +664,173 @@ class EventUseCase:
         )
 
     @rollbackable
-    async def get_my_events_async(self, account_id: UUID) -> GetMyEventsResponse:
+    async def get_my_events_async(
+        self,
+        account_id: UUID,
+        cursor: str | None = None,
+        updated_since: datetime | None = None,
+        limit: int = EVENT_PAGE_DEFAULT_SIZE,
+    ) -> GetMyEventsResponse:
         user_account_repository = UserAccountRepository(self.uow)
         event_repository = EventRepository(self.uow)
 
+        after = decode_event_cursor(cursor) if cursor is not None else None
+        if cursor is not None and after is None:
+            return GetMyEventsResponse(
+                events=[],
+                next_cursor=None,
+                error_codes=(ErrorCode.EVENT_CURSOR_INVALID,),
+            )
+
         user_account = await user_account_repository.read_by_id_or_none_async(
             account_id
         )
         if user_account is None:
             return GetMyEventsResponse(
-                events=[], error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,)
+                events=[], next_cursor=None, error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,)
             )
 
         user_id = user_account.user_id
 
-        events = await event_repository.read_with_recurrence_by_user_ids_async(
-            {user_id}
+        events = await event_repository.read_page_with_recurrence_by_user_ids_async(
+            {user_id}, after, updated_since, limit + 1
         )
+        page, next_cursor = split_event_page(events, limit)
 
-        return GetMyEventsResponse(events=serialize_events(events), error_codes=())
+        return GetMyEventsResponse(
+            events=serialize_events(page), next_cursor=next_cursor, error_codes=()
+        )
 
     @rollbackable
     async def get_following_events_async(
-        self, follower_id: UUID
+        self,
+        follower_id: UUID,
+        cursor: str | None = None,
+        updated_since: datetime | None = None,
+        limit: int = EVENT_PAGE_DEFAULT_SIZE,
     ) -> GetFollowingEventsResponse:
-        user_account_repository = UserAccountRepository(self.uow)
+        follow_graph = FollowGraph(self.uow)
         event_repository = EventRepository(self.uow)
 
-        follower = (
-            await user_account_repository.read_with_followees_by_id_or_none_async(
-                follower_id
+        after = decode_event_cursor(cursor) if cursor is not None else None
+        if cursor is not None and after is None:
+            return GetFollowingEventsResponse(
+                events=[],
+                next_cursor=None,
+                error_codes=(ErrorCode.EVENT_CURSOR_INVALID,),
             )
-        )
-        if follower is None:
+
+        follows = await follow_graph.read_followee_user_ids_or_none_async(follower_id)
+        if follows is None:
             return GetFollowingEventsResponse(
-                events=[], error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,)
+                events=[], next_cursor=None, error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,)
             )
 
-        user_ids = {followee.user_id for followee in follower.followees} | {
-            follower.user_id
-        }
+        follower_user_id, followee_user_ids = follows
+        user_ids = {follower_user_id, *followee_user_ids}
 
-        events = await event_repository.read_with_recurrence_by_user_ids_async(user_ids)
+        # Each shard returns at most one page, which is merged by (start, id)
+        events = await event_repository.read_page_with_recurrence_by_user_ids_async(
+            user_ids, after, updated_since, limit + 1
+        )
+        page, next_cursor = split_event_page(events, limit)
 
         return GetFollowingEventsResponse(
-            events=serialize_events(events), error_codes=()
+            events=serialize_events(page), next_cursor=next_cursor, error_codes=()
+        )
+
+    @rollbackable
+    async def get_event_occurrences_async(
+        self,
+        account_id: UUID,
+        start_from: datetime,
+        start_to: datetime,
+        cursor: str | None = None,
+    ) -> GetEventOccurrencesResponse:
+        follow_graph = FollowGraph(self.uow)
+        event_occurrence_repository = EventOccurrenceRepository(self.uow)
+
+        if to_utc(start_from) >= to_utc(start_to):
+            return GetEventOccurrencesResponse(
+                occurrences=[],
+                next_cursor=None,
+                error_codes=(ErrorCode.EVENT_OCCURRENCE_RANGE_INVALID,),
+            )
+
+        after = decode_event_cursor(cursor) if cursor is not None else None
+        if cursor is not None and after is None:
+            return GetEventOccurrencesResponse(
+                occurrences=[],
+                next_cursor=None,
+                error_codes=(ErrorCode.EVENT_CURSOR_INVALID,),
+            )
+
+        follows = await follow_graph.read_followee_user_ids_or_none_async(account_id)
+        if follows is None:
+            return GetEventOccurrencesResponse(
+                occurrences=[],
+                next_cursor=None,
+                error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,),
+            )
+
+        user_id, followee_user_ids = follows
+
+        # One range scan of (user_id, start) per shard instead of expanding the
+        # recurrence of every followed event
+        occurrences = (
+            await event_occurrence_repository.read_by_user_ids_and_start_range_async(
+                {user_id, *followee_user_ids},
+                to_utc(start_from),
+                to_utc(start_to),
+                after,
+                EVENT_OCCURRENCE_QUERY_MAX_COUNT + 1,
+            )
+        )
+        page, next_cursor = split_event_page(
+            occurrences, EVENT_OCCURRENCE_QUERY_MAX_COUNT
+        )
+
+        return GetEventOccurrencesResponse(
+            occurrences=[
+                EventOccurrenceDto(
+                    event_id=uuid_to_str(occurrence.event_id),
+                    start=occurrence.start,
+                    end=occurrence.end,
+                )
+                for occurrence in page
+            ],
+            next_cursor=next_cursor,
+            error_codes=(),
+        )
+
+    @rollbackable
+    async def materialize_event_occurrences_async(
+        self,
+    ) -> MaterializeEventOccurrencesResponse:
+        event_repository = EventRepository(self.uow)
+        event_occurrence_repository = EventOccurrenceRepository(self.uow)
+
+        # Extends every event from its latest materialized occurrence up to the
+        # rolling horizon
+        horizon = datetime.now(ZoneInfo("UTC")) + timedelta(
+            days=EVENT_OCCURRENCE_HORIZON_DAYS
+        )
+        latest_starts = await event_occurrence_repository.read_latest_starts_async()
+        # Events are read in full rather than streamed, since writing on a shard
+        # connection discards the unread rows of its server-side cursor
+        events = await event_repository.read_all_with_recurrence_async(where=())
+        occurrence_count = (
+            await event_occurrence_repository.bulk_upsert_event_occurrences_async(
+                occurrence
+                for event in events
+                for occurrence in generate_event_occurrences(
+                    event, latest_starts.get(event.id), horizon
+                )
+            )
+        )
+
+        return MaterializeEventOccurrencesResponse(
+            occurrence_count=occurrence_count, error_codes=()
         )
 
     @rollbackable
@@ -485,7 +853,9 @@ class EventUseCase:
 
         user_id = guest.user_id
 
-        event = await event_repository.read_by_id_or_none_async(event_id)
+        event = await event_repository.read_with_recurrence_by_id_or_none_async(
+            event_id
+        )
         if event is None:
             return GetGuestAttendanceStatusResponse(
                 attend=False, error_codes=(ErrorCode.EVENT_NOT_FOUND,)
@@ -504,7 +874,7 @@ class EventUseCase:
 
     @rollbackable
     async def forecast_attendance_time_async(
-        self,
+        self, incremental: bool = False
     ) -> ForecastAttendanceTimeResponse:
         event_attendance_action_log_repository = EventAttendanceActionLogRepository(
             self.uow
@@ -514,23 +884,89 @@ class EventUseCase:
         event_attendance_forecast_repository = EventAttendanceForecastRepository(
             self.uow
         )
-
-        earliest_attend_data = (
-            await event_attendance_action_log_repository.read_all_earliest_attend_async()
+        event_attendance_forecast_watermark_repository = (
+            EventAttendanceForecastWatermarkRepository(self.uow)
         )
-        latest_leave_data = (
-            await event_attendance_action_log_repository.read_all_latest_leave_async()
+
+        # Loading the forecasting stack (timesfm, torch, pandas, statsmodels) is
+        # deferred to this endpoint so that cold starts of other endpoints stay cheap
+        from ta_ml.forecast.attendance import forecast_formatted_attendance_time
+        from ta_ml.formatters.attendance import (
+            AttendanceLogAccumulator,
+            get_recent_event_starts,
         )
+
+        now = datetime.now(ZoneInfo("UTC"))
+        # DATETIME columns drop fractions, so compare at second precision
+        refreshed_at = now.replace(microsecond=0)
         event_data = await event_repository.read_all_with_recurrence_async(where=())
-        user_data = await user_account_repository.read_all_async(where=())
+        latest_event_starts = {
+            event.id: event_starts[-1]
+            for event in event_data
+            if event.recurrence is not None
+            and (event_starts := get_recent_event_starts(event, now, 1))
+        }
+        latest_acted_ats = {
+            series: acted_at
+            for series, acted_at in (
+                await event_attendance_action_log_repository.read_all_latest_acted_at_by_series_async()
+            ).items()
+            if series[1] in latest_event_starts
+        }
 
-        forecast_result = forecast_attendance_time(
-            earliest_attend_data, latest_leave_data, event_data, user_data
+        if incremental:
+            watermarks = {
+                (watermark.user_id, watermark.event_id): watermark
+                for watermark in await event_attendance_forecast_watermark_repository.read_all_async(
+                    where=()
+                )
+            }
+            # A series is stale when new logs arrived or another occurrence passed
+            stale_series = {
+                (user_id, event_id)
+                for (user_id, event_id), acted_at in latest_acted_ats.items()
+                if (user_id, event_id) not in watermarks
+                or acted_at > watermarks[(user_id, event_id)].last_acted_at
+                or latest_event_starts[event_id]
+                > watermarks[(user_id, event_id)].last_start
+            }
+            if not stale_series:
+                return ForecastAttendanceTimeResponse(
+                    attendance_time_forecasts={}, error_codes=()
+                )
+            stale_event_ids = {event_id for _, event_id in stale_series}
+            event_data = tuple(
+                event for event in event_data if event.id in stale_event_ids
+            )
+            user_data = await user_account_repository.read_by_user_ids_async(
+                {user_id for user_id, _ in stale_series}
+            )
+        else:
+            stale_series = set(latest_acted_ats)
+            user_data = await user_account_repository.read_all_async(where=())
+
+        # Logs are streamed in batches and only the recent context is kept in memory
+        accumulator = AttendanceLogAccumulator(event_data, now)
+        series_filter = stale_series if incremental else None
+        async for (
+            attends
+        ) in event_attendance_action_log_repository.stream_all_earliest_attend_async(
+            series_filter
+        ):
+            accumulator.add_earliest_attends(attends)
+        async for (
+            leaves
+        ) in event_attendance_action_log_repository.stream_all_latest_leave_async(
+            series_filter
+        ):
+            accumulator.add_latest_leaves(leaves)
+        forecast_result = forecast_formatted_attendance_time(
+            accumulator.format(user_data), event_data
         )
 
-        forecasts = [
+        forecasts = (
             EventAttendanceForecastEntity(
-                entity_id=generate_uuid(),
+                entity_id=generate_shard_uuid(user_id),
                 user_id=user_id,
                 event_id=str_to_uuid(event_id),
                 start=forecast.start,
@@ -538,12 +974,33 @@ class EventUseCase:
                 forecasted_duration=forecast.duration,
             )
             for user_id, events in forecast_result.attendance_time_forecasts.items()
-            for event_id, forecasts in events.items()
-            for forecast in forecasts
-        ]
-        await event_attendance_forecast_repository.bulk_delete_insert_event_attendance_forecasts_async(
-            forecasts
+            for event_id, event_forecasts in events.items()
+            for forecast in event_forecasts
+        )
+        watermarks_to_save = (
+            EventAttendanceForecastWatermarkEntity(
+                entity_id=generate_shard_uuid(user_id),
+                user_id=user_id,
+                event_id=event_id,
+                last_acted_at=latest_acted_ats[(user_id, event_id)],
+                last_start=latest_event_starts[event_id],
+            )
+            for user_id, event_id in stale_series
+        )
+        await event_attendance_forecast_repository.bulk_upsert_event_attendance_forecasts_async(
+            forecasts, refreshed_at
+        )
+        # Rows not touched by this run's upserts belong to horizons that moved on
+        await event_attendance_forecast_repository.delete_stale_event_attendance_forecasts_async(
+            refreshed_at, stale_series if incremental else None
+        )
+        await event_attendance_forecast_watermark_repository.bulk_upsert_watermarks_async(
+            watermarks_to_save, refreshed_at
         )
+        if not incremental:
+            await event_attendance_forecast_watermark_repository.delete_stale_watermarks_async(
+                refreshed_at
+            )
 
         return forecast_result
 
@@ -552,59 +1009,51 @@ class EventUseCase:
         self, account_id: UUID
     ) -> GetAttendanceTimeForecastsResponse:
         user_account_repository = UserAccountRepository(self.uow)
+        follow_graph = FollowGraph(self.uow)
         event_repository = EventRepository(self.uow)
         event_attendance_forecast_repository = EventAttendanceForecastRepository(
             self.uow
         )
 
-        user_account = (
-            await user_account_repository.read_with_followees_by_id_or_none_async(
-                account_id
-            )
-        )
-        if user_account is None:
+        follows = await follow_graph.read_followee_user_ids_or_none_async(account_id)
+        if follows is None:
             return GetAttendanceTimeForecastsResponse(
                 attendance_time_forecasts_with_username={},
                 error_codes=(ErrorCode.ACCOUNT_NOT_FOUND,),
             )
 
-        user_ids = {followee.user_id for followee in user_account.followees} | {
-            user_account.user_id
-        }
-        events = await event_repository.read_with_recurrence_by_user_ids_async(user_ids)
-        forecasts = (
-            await event_attendance_forecast_repository.read_all_by_event_ids_async(
-                {event.id for event in events}
+        user_account_user_id, followee_user_ids = follows
+        user_ids = {user_account_user_id, *followee_user_ids}
+        event_ids = await event_repository.read_ids_by_user_ids_async(user_ids)
+        forecast_rows = (
+            await event_attendance_forecast_repository.read_rows_by_event_ids_async(
+                event_ids
             )
         )
 
         attendance_time_forecasts: defaultdict[
             str, defaultdict[int, list[AttendanceTimeForecastDto]]
         ] = defaultdict(lambda: defaultdict(list))
-        for forecast in forecasts:
-            attendance_time_forecasts[uuid_to_str(forecast.event_id)][
-                forecast.user_id
+        for event_id, user_id, start, attended_at, duration in forecast_rows:
+            attendance_time_forecasts[uuid_to_str(bin_to_uuid(event_id))][
+                user_id
             ].append(
                 AttendanceTimeForecastDto(
-                    start=forecast.start,
-                    attended_at=forecast.forecasted_attended_at,
-                    duration=forecast.forecasted_duration,
+                    start=start, attended_at=attended_at, duration=duration
                 )
             )
 
-        username_dict = {
-            ua.user_id: ua.username
-            for ua in await user_account_repository.read_all_async(
-                where=()
-            )  # TODO: user_account テーブルに対する read_all_async はまずそう
-        }
+        username_dict = await user_account_repository.read_usernames_by_user_ids_async(
+            {user_id for _, user_id, _, _, _ in forecast_rows}
+        )
+        # Forecasts of users whose account is gone are skipped
         attendance_time_forecasts_with_username = {
             event_id: {
                 user_id: AttendanceTimeForecastsWithUsernameDto(
-                    username=username_dict[user_id],
-                    attendance_time_forecasts=forecasts,
+                    username=username, attendance_time_forecasts=forecasts
                 )
                 for user_id, forecasts in user_forecasts.items()
+                if (username := username_dict.get(user_id)) is not None
             }
             for event_id, user_forecasts in attendance_time_forecasts.items()
         }
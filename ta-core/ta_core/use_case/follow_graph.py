@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import ClassVar, Iterable
+
+from ta_core.constants.constants import (
+    FOLLOW_GRAPH_CACHE_SIZE,
+    FOLLOW_GRAPH_CACHE_TTL_SECONDS,
+)
+from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
+from ta_core.use_case.unit_of_work_base import IUnitOfWork
+from ta_core.utils.cache import TTLCache
+from ta_core.utils.uuid import UUID
+
+
+@dataclass(frozen=True)
+class FollowGraph:
+    uow: IUnitOfWork
+
+    # Adjacency list of the follow graph: account ID -> (user ID, followee user IDs)
+    _followees: ClassVar[TTLCache[UUID, tuple[int, frozenset[int]]]] = TTLCache(
+        max_size=FOLLOW_GRAPH_CACHE_SIZE, ttl=FOLLOW_GRAPH_CACHE_TTL_SECONDS
+    )
+
+    @classmethod
+    def put(
+        cls, account_id: UUID, user_id: int, followee_user_ids: Iterable[int]
+    ) -> None:
+        cls._followees.set(account_id, (user_id, frozenset(followee_user_ids)))
+
+    @classmethod
+    def invalidate(cls, account_ids: Iterable[UUID]) -> None:
+        # Call with the followers whenever follows are added or removed
+        for account_id in account_ids:
+            cls._followees.pop(account_id)
+
+    async def read_followee_user_ids_or_none_async(
+        self, account_id: UUID
+    ) -> tuple[int, frozenset[int]] | None:
+        cached = self._followees.get(account_id)
+        if cached is not None:
+            return cached
+
+        user_account_repository = UserAccountRepository(self.uow)
+
+        follows = (
+            await user_account_repository.read_followee_user_ids_by_id_or_none_async(
+                account_id
+            )
+        )
+        if follows is None:
+            return None
+        user_id, followee_user_ids = follows
+        self.put(account_id, user_id, followee_user_ids)
+        return user_id, frozenset(followee_user_ids)
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 
 class IUnitOfWork(metaclass=ABCMeta):
@@ -32,5 +32,29 @@ class IUnitOfWork(metaclass=ABCMeta):
         raise NotImplementedError()
 
     @abstractmethod
-    async def execute_async(self, stmt: Any, params: Any = None) -> Any:
+    async def execute_async(
+        self, stmt: Any, params: Any = None, shard_id: str | None = None
+    ) -> Any:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def scatter_execute_async(
+        self, stmt: Any, shard_ids: Iterable[str], params: Any = None
+    ) -> Sequence[Any]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def execute_autonomous_async(
+        self, stmt: Any, shard_id: str, params: Any = None
+    ) -> Any:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def stream_async(
+        self, stmt: Any, params: Any = None, shard_id: str | None = None
+    ) -> Any:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def begin_autonomous(self, shard_id: str) -> Any:
         raise NotImplementedError()
@@ -6,6 +6,13 @@ def apply_timezone(date_value: datetime, timezone: str) -> datetime:
     return date_value.astimezone(ZoneInfo(timezone))
 
 
+def to_utc(date_value: datetime) -> datetime:
+    # Naive values read from DATETIME columns are in UTC
+    if date_value.tzinfo is None:
+        return date_value.replace(tzinfo=ZoneInfo("UTC"))
+    return date_value.astimezone(ZoneInfo("UTC"))
+
+
 def validate_date(
     is_all_day: bool, date_value: datetime | str, timezone: str | None = None
 ) -> None:
@@ -0,0 +1,540 @@
+import calendar
+import heapq
+from datetime import date, datetime, timedelta, tzinfo
+from itertools import islice
+from typing import Iterable, Iterator
+
+from ta_core.features.event import Frequency, Recurrence, RecurrenceRule, Weekday
+
+WEEKDAY_INDEXES = {weekday: index for index, weekday in enumerate(Weekday)}
+
+# Coarser frequencies come first, as in RFC 5545
+_FREQUENCY_ORDER = {
+    Frequency.YEARLY: 0,
+    Frequency.MONTHLY: 1,
+    Frequency.WEEKLY: 2,
+    Frequency.DAILY: 3,
+    Frequency.HOURLY: 4,
+    Frequency.MINUTELY: 5,
+    Frequency.SECONDLY: 6,
+}
+
+FIXED_FREQUENCY_STEPS = {
+    Frequency.SECONDLY: timedelta(seconds=1),
+    Frequency.MINUTELY: timedelta(minutes=1),
+    Frequency.HOURLY: timedelta(hours=1),
+    Frequency.DAILY: timedelta(days=1),
+    Frequency.WEEKLY: timedelta(weeks=1),
+}
+
+MONTHLY_FREQUENCY_STEPS = {Frequency.MONTHLY: 1, Frequency.YEARLY: 12}
+
+# The Gregorian calendar repeats every 400 years (146097 days, a whole number of
+# weeks), so a rule with no occurrence in that many periods never has one
+_PERIODS_PER_CALENDAR_CYCLE = {
+    Frequency.YEARLY: 400,
+    Frequency.MONTHLY: 400 * 12,
+    Frequency.WEEKLY: 146097 // 7,
+    Frequency.DAILY: 146097,
+    Frequency.HOURLY: 146097 * 24,
+    Frequency.MINUTELY: 146097 * 24 * 60,
+    Frequency.SECONDLY: 146097 * 24 * 60 * 60,
+}
+
+# Rough period lengths used to look back from a point in time
+APPROXIMATE_FREQUENCY_STEPS = {
+    **FIXED_FREQUENCY_STEPS,
+    Frequency.MONTHLY: timedelta(days=31),
+    Frequency.YEARLY: timedelta(days=366),
+}
+
+
+def is_simple_rrule(rrule: RecurrenceRule) -> bool:
+    # Every period of a simple rule holds exactly one candidate taken from DTSTART
+    return not (
+        rrule.bysecond
+        or rrule.byminute
+        or rrule.byhour
+        or rrule.byday
+        or rrule.bymonthday
+        or rrule.byyearday
+        or rrule.byweekno
+        or rrule.bymonth
+        or rrule.bysetpos
+    )
+
+
+def _add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    years, month_index = divmod(month - 1 + months, 12)
+    return year + years, month_index + 1
+
+
+def _ceil_div(numerator: timedelta, denominator: timedelta) -> int:
+    return -(-numerator // denominator)
+
+
+class RRuleExpander:
+    """Lazily expands an RRULE, jumping straight to the period that holds `after`
+
+    Expansion runs on the wall clock of DTSTART. An aware DTSTART keeps its tzinfo
+    on the occurrences, and a naive UNTIL is read on the same wall clock.
+    """
+
+    def __init__(self, rrule: RecurrenceRule, dtstart: datetime) -> None:
+        if rrule.interval <= 0:
+            raise ValueError(f"INTERVAL must be positive: {rrule.interval}")
+        self._tzinfo = dtstart.tzinfo
+        self._dtstart = dtstart.replace(tzinfo=None)
+        self._freq = rrule.freq
+        self._interval = rrule.interval
+        self._count = rrule.count
+        self._until = (
+            self._to_wall_clock(rrule.until) if rrule.until is not None else None
+        )
+        self._is_simple = is_simple_rrule(rrule)
+
+        start = self._dtstart
+        order = _FREQUENCY_ORDER[rrule.freq]
+        self._bymonth = set(rrule.bymonth) if rrule.bymonth else None
+        self._bymonthday = set(rrule.bymonthday) if rrule.bymonthday else None
+        self._byyearday = set(rrule.byyearday) if rrule.byyearday else None
+        self._byweekno = set(rrule.byweekno) if rrule.byweekno else None
+        self._wkst = WEEKDAY_INDEXES[rrule.wkst]
+        self._byweekday: set[int] | None = None
+        self._bynweekday: set[tuple[int, int]] | None = None
+        for n, weekday in rrule.byday or ():
+            # Ordinals only mean something within a month or a year
+            if n == 0 or rrule.freq not in MONTHLY_FREQUENCY_STEPS:
+                self._byweekday = (self._byweekday or set()) | {
+                    WEEKDAY_INDEXES[weekday]
+                }
+            else:
+                self._bynweekday = (self._bynweekday or set()) | {
+                    (n, WEEKDAY_INDEXES[weekday])
+                }
+        if not (rrule.byweekno or rrule.byyearday or rrule.bymonthday or rrule.byday):
+            if rrule.freq == Frequency.YEARLY:
+                self._bymonth = self._bymonth or {start.month}
+                self._bymonthday = {start.day}
+            elif rrule.freq == Frequency.MONTHLY:
+                self._bymonthday = {start.day}
+            elif rrule.freq == Frequency.WEEKLY:
+                self._byweekday = {start.weekday()}
+        self._nth_in_year = rrule.freq == Frequency.YEARLY and not rrule.bymonth
+
+        self._byhour = sorted(set(rrule.byhour)) if rrule.byhour else None
+        self._byminute = sorted(set(rrule.byminute)) if rrule.byminute else None
+        self._bysecond = sorted(set(rrule.bysecond)) if rrule.bysecond else None
+        self._hours = self._byhour or [start.hour]
+        self._minutes = self._byminute or [start.minute]
+        self._seconds = self._bysecond or [start.second]
+        self._times = [
+            (hour, minute, second)
+            for hour in (self._hours if order < 4 else [0])
+            for minute in (self._minutes if order < 5 else [0])
+            for second in (self._seconds if order < 6 else [0])
+        ]
+        self._bysetpos = tuple(rrule.bysetpos) if rrule.bysetpos else None
+
+    @property
+    def freq(self) -> Frequency:
+        return self._freq
+
+    @property
+    def dtstart(self) -> datetime:
+        # Naive, on the wall clock of the expansion
+        return self._dtstart
+
+    @property
+    def until(self) -> datetime | None:
+        # Naive, on the wall clock of the expansion
+        return self._until
+
+    @property
+    def count(self) -> int | None:
+        return self._count
+
+    @property
+    def is_simple(self) -> bool:
+        return self._is_simple
+
+    @property
+    def interval(self) -> int:
+        return self._interval
+
+    @property
+    def tzinfo(self) -> tzinfo | None:
+        return self._tzinfo
+
+    def _to_wall_clock(self, value: datetime) -> datetime:
+        if value.tzinfo is None or self._tzinfo is None:
+            return value.replace(tzinfo=None)
+        return value.astimezone(self._tzinfo).replace(tzinfo=None)
+
+    def _from_wall_clock(self, value: datetime) -> datetime:
+        return value if self._tzinfo is None else value.replace(tzinfo=self._tzinfo)
+
+    def iter_after(self, after: datetime | None = None) -> Iterator[datetime]:
+        # Occurrences at or after `after`, in order
+        wall_after = self._to_wall_clock(after) if after is not None else None
+        if self._is_simple and self._freq in FIXED_FREQUENCY_STEPS:
+            occurrences = self._iter_fixed_steps(wall_after)
+        else:
+            occurrences = self._iter_periods(wall_after)
+        for occurrence in occurrences:
+            yield self._from_wall_clock(occurrence)
+
+    def between(self, after: datetime, before: datetime) -> list[datetime]:
+        # Occurrences in [after, before)
+        result = []
+        for occurrence in self.iter_after(after):
+            if occurrence >= before:
+                break
+            result.append(occurrence)
+        return result
+
+    def _iter_fixed_steps(self, after: datetime | None) -> Iterator[datetime]:
+        step = FIXED_FREQUENCY_STEPS[self._freq] * self._interval
+        index = 0
+        if after is not None and after > self._dtstart:
+            index = _ceil_div(after - self._dtstart, step)
+        while self._count is None or index < self._count:
+            try:
+                occurrence = self._dtstart + step * index
+            except OverflowError:
+                return
+            if self._until is not None and occurrence > self._until:
+                return
+            yield occurrence
+            index += 1
+
+    def _iter_periods(self, after: datetime | None) -> Iterator[datetime]:
+        emitted = 0
+        lower = self._dtstart
+        if after is not None and after > lower:
+            # With COUNT the earlier occurrences still have to be counted
+            if self._count is None:
+                periods = self._iter_period_occurrences(after)
+            else:
+                periods = self._iter_period_occurrences(None)
+        else:
+            after = None
+            periods = self._iter_period_occurrences(None)
+        empty_periods = 0
+        for occurrences in periods:
+            if not occurrences:
+                empty_periods += 1
+                if empty_periods >= _PERIODS_PER_CALENDAR_CYCLE[self._freq]:
+                    return
+                continue
+            empty_periods = 0
+            for occurrence in occurrences:
+                if occurrence < lower:
+                    continue
+                if self._until is not None and occurrence > self._until:
+                    return
+                emitted += 1
+                if after is None or occurrence >= after:
+                    yield occurrence
+                if self._count is not None and emitted >= self._count:
+                    return
+
+    def _iter_period_occurrences(
+        self, after: datetime | None
+    ) -> Iterator[list[datetime]]:
+        freq = self._freq
+        if freq in (Frequency.HOURLY, Frequency.MINUTELY, Frequency.SECONDLY):
+            yield from self._iter_sub_daily_periods(after)
+            return
+        for days in self._iter_period_days(after):
+            occurrences = [
+                datetime(day.year, day.month, day.day, hour, minute, second)
+                for day in days
+                if self._matches_day(day)
+                for hour, minute, second in self._times
+            ]
+            yield self._apply_setpos(occurrences)
+
+    def _iter_period_days(self, after: datetime | None) -> Iterator[Iterable[date]]:
+        start = self._dtstart.date()
+        interval = self._interval
+        # Periods past UNTIL cannot hold occurrences even when none matched so far
+        last_day = self._until.date() if self._until is not None else date.max
+        try:
+            if self._freq == Frequency.YEARLY:
+                index = (
+                    max(0, (after.year - start.year) // interval)
+                    if after is not None
+                    else 0
+                )
+                year = start.year + index * interval
+                while year <= last_day.year:
+                    months = sorted(self._bymonth) if self._bymonth else range(1, 13)
+                    yield [
+                        day
+                        for month in months
+                        for day in self._get_candidate_days(year, month)
+                    ]
+                    year += interval
+            elif self._freq == Frequency.MONTHLY:
+                index = 0
+                if after is not None:
+                    elapsed = (after.year - start.year) * 12 + after.month - start.month
+                    index = max(0, elapsed // interval)
+                year, month = _add_months(start.year, start.month, index * interval)
+                while (year, month) <= (last_day.year, last_day.month):
+                    if self._bymonth is None or month in self._bymonth:
+                        yield self._get_candidate_days(year, month)
+                    year, month = _add_months(year, month, interval)
+            elif self._freq == Frequency.WEEKLY:
+                week_start = start - timedelta(days=(start.weekday() - self._wkst) % 7)
+                step = timedelta(weeks=interval)
+                if after is not None and after.date() > week_start:
+                    week_start += step * ((after.date() - week_start) // step)
+                while week_start <= last_day:
+                    yield [week_start + timedelta(days=i) for i in range(7)]
+                    week_start += step
+            else:
+                day = start
+                step = timedelta(days=interval)
+                if after is not None and after.date() > day:
+                    day += step * ((after.date() - day) // step)
+                while day <= last_day:
+                    yield (day,)
+                    day += step
+        except OverflowError:
+            return
+
+    def _get_candidate_days(self, year: int, month: int) -> list[date]:
+        # Narrows the days of a month down from BYMONTHDAY or BYDAY so that sparse
+        # rules don't test every day. _matches_day still applies every rule part
+        month_length = calendar.monthrange(year, month)[1]
+        days: Iterable[int]
+        if self._bymonthday is not None:
+            days = sorted(
+                {
+                    month_day if month_day > 0 else month_length + month_day + 1
+                    for month_day in self._bymonthday
+                }
+                & set(range(1, month_length + 1))
+            )
+        elif self._byweekday is not None or self._bynweekday is not None:
+            first_weekday = calendar.weekday(year, month, 1)
+            weekdays = set(self._byweekday or ()) | {
+                weekday for _, weekday in self._bynweekday or ()
+            }
+            days = sorted(
+                day
+                for weekday in weekdays
+                for day in range(1 + (weekday - first_weekday) % 7, month_length + 1, 7)
+            )
+        else:
+            days = range(1, month_length + 1)
+        return [date(year, month, day) for day in days]
+
+    def _iter_sub_daily_periods(
+        self, after: datetime | None
+    ) -> Iterator[list[datetime]]:
+        start = self._dtstart
+        if self._freq == Frequency.HOURLY:
+            base = start.replace(minute=0, second=0, microsecond=0)
+            unit = timedelta(hours=1)
+        elif self._freq == Frequency.MINUTELY:
+            base = start.replace(second=0, microsecond=0)
+            unit = timedelta(minutes=1)
+        else:
+            base = start
+            unit = timedelta(seconds=1)
+        step = unit * self._interval
+        day = start.date()
+        if after is not None and after.date() > day:
+            day = after.date()
+        one_day = timedelta(days=1)
+        last_day = self._until.date() if self._until is not None else date.max
+        try:
+            while day <= last_day:
+                if self._matches_day(day):
+                    day_start = datetime(day.year, day.month, day.day)
+                    index = max(0, _ceil_div(day_start - base, step))
+                    period = base + step * index
+                    while period < day_start + one_day:
+                        occurrences = self._expand_sub_daily_period(period)
+                        if occurrences:
+                            yield self._apply_setpos(occurrences)
+                        period += step
+                day += one_day
+        except OverflowError:
+            return
+
+    def _expand_sub_daily_period(self, period: datetime) -> list[datetime]:
+        if self._byhour is not None and period.hour not in self._byhour:
+            return []
+        if self._freq == Frequency.HOURLY:
+            return [
+                period.replace(minute=minute, second=second)
+                for minute in self._minutes
+                for second in self._seconds
+            ]
+        if self._byminute is not None and period.minute not in self._byminute:
+            return []
+        if self._freq == Frequency.MINUTELY:
+            return [period.replace(second=second) for second in self._seconds]
+        if self._bysecond is not None and period.second not in self._bysecond:
+            return []
+        return [period]
+
+    def _apply_setpos(self, occurrences: list[datetime]) -> list[datetime]:
+        if self._bysetpos is None or not occurrences:
+            return occurrences
+        occurrences.sort()
+        length = len(occurrences)
+        positions = {
+            position - 1 if position > 0 else length + position
+            for position in self._bysetpos
+        }
+        return [
+            occurrence
+            for index, occurrence in enumerate(occurrences)
+            if index in positions
+        ]
+
+    def _matches_day(self, day: date) -> bool:
+        if self._bymonth is not None and day.month not in self._bymonth:
+            return False
+        if self._bymonthday is not None:
+            month_length = calendar.monthrange(day.year, day.month)[1]
+            if (
+                day.day not in self._bymonthday
+                and day.day - month_length - 1 not in self._bymonthday
+            ):
+                return False
+        if self._byyearday is not None:
+            year_day = day.timetuple().tm_yday
+            year_length = 366 if calendar.isleap(day.year) else 365
+            if (
+                year_day not in self._byyearday
+                and year_day - year_length - 1 not in self._byyearday
+            ):
+                return False
+        if self._byweekno is not None and not self._matches_weekno(day, self._byweekno):
+            return False
+        if self._byweekday is not None or self._bynweekday is not None:
+            weekday = day.weekday()
+            if self._byweekday is not None and weekday in self._byweekday:
+                return True
+            if self._bynweekday is None:
+                return False
+            if self._nth_in_year:
+                position = day.timetuple().tm_yday
+                length = 366 if calendar.isleap(day.year) else 365
+            else:
+                position = day.day
+                length = calendar.monthrange(day.year, day.month)[1]
+            nth = (position - 1) // 7 + 1
+            nth_from_end = -((length - position) // 7 + 1)
+            return (nth, weekday) in self._bynweekday or (
+                nth_from_end,
+                weekday,
+            ) in self._bynweekday
+        return True
+
+    def _get_week_start(self, day: date) -> date:
+        return day - timedelta(days=(day.weekday() - self._wkst) % 7)
+
+    def _get_weekno(self, day: date) -> tuple[int, int]:
+        # Week 1 is the first week with at least 4 days in the year, so a week
+        # belongs to the year of its 4th day
+        fourth_day = self._get_week_start(day) + timedelta(days=3)
+        return fourth_day.year, (fourth_day.timetuple().tm_yday - 1) // 7 + 1
+
+    def _matches_weekno(self, day: date, byweekno: set[int]) -> bool:
+        try:
+            week_year, weekno = self._get_weekno(day)
+            if weekno in byweekno:
+                return True
+            last_year, last_weekno = self._get_weekno(date(week_year, 12, 31))
+            if last_year != week_year:
+                _, last_weekno = self._get_weekno(date(week_year, 12, 24))
+        except OverflowError:
+            # The last week of year 9999 runs past date.max
+            return False
+        return weekno - last_weekno - 1 in byweekno
+
+
+class RecurrenceExpander:
+    """Expands a recurrence set: DTSTART, RRULE and RDATE, minus EXDATE
+
+    RDATE and EXDATE hold dates, so RDATE occurrences take the time of DTSTART and
+    EXDATE removes every occurrence on that date.
+    """
+
+    def __init__(self, recurrence: Recurrence, dtstart: datetime) -> None:
+        self._rrule = RRuleExpander(recurrence.rrule, dtstart)
+        self._dtstart = dtstart
+        self._exdate = frozenset(recurrence.exdate)
+        self._rdate = sorted(
+            {
+                datetime.combine(rdate, dtstart.timetz())
+                for rdate in recurrence.rdate
+                if rdate not in self._exdate
+            }
+        )
+
+    @property
+    def rrule(self) -> RRuleExpander:
+        return self._rrule
+
+    def iter_after(self, after: datetime | None = None) -> Iterator[datetime]:
+        extra = [self._dtstart] if self._dtstart.date() not in self._exdate else []
+        extra = sorted(set(extra) | set(self._rdate))
+        if after is not None:
+            extra = [occurrence for occurrence in extra if occurrence >= after]
+        previous: datetime | None = None
+        for occurrence in heapq.merge(self._rrule.iter_after(after), extra):
+            if occurrence == previous:
+                continue
+            previous = occurrence
+            if self._exdate and occurrence.date() in self._exdate:
+                continue
+            yield occurrence
+
+    def between(self, after: datetime, before: datetime) -> list[datetime]:
+        result = []
+        for occurrence in self.iter_after(after):
+            if occurrence >= before:
+                break
+            result.append(occurrence)
+        return result
+
+    def recent(self, now: datetime, count: int) -> list[datetime]:
+        # The last `count` occurrences at or before `now`, oldest first
+        if count <= 0 or now < self._dtstart:
+            return []
+        step = APPROXIMATE_FREQUENCY_STEPS[self._rrule.freq] * self._rrule.interval
+        span = step * count
+        while True:
+            try:
+                after = max(now - span, self._dtstart)
+            except OverflowError:
+                after = self._dtstart
+            occurrences = []
+            for occurrence in self.iter_after(after):
+                if occurrence > now:
+                    break
+                occurrences.append(occurrence)
+            if len(occurrences) >= count or after == self._dtstart:
+                return occurrences[-count:]
+            span *= 2
+
+    def next(self, after: datetime, count: int) -> list[datetime]:
+        # The first `count` occurrences strictly after `after`
+        return list(
+            islice(
+                (
+                    occurrence
+                    for occurrence in self.iter_after(after)
+                    if occurrence > after
+                ),
+                count,
+            )
+        )
@@ -2,9 +2,31 @@ import uuid6
 
 UUID = uuid6.UUID
 
-
-def generate_uuid() -> UUID:
-    return uuid6.uuid7()
+# The upper 16 bits of rand_b in UUIDv7 hold a marker and the shard ID
+_SHARD_MARKER = 0xA5
+_SHARD_MARKER_SHIFT = 54
+_SHARD_ID_SHIFT = 46
+_SHARD_ID_MASK = 0xFF
+MAX_EMBEDDABLE_SHARD_ID = _SHARD_ID_MASK
+
+
+def generate_uuid(shard_id: int | None = None) -> UUID:
+    u = uuid6.uuid7()
+    if shard_id is None:
+        return u
+    if not 0 <= shard_id <= MAX_EMBEDDABLE_SHARD_ID:
+        raise ValueError(f"Shard ID out of range: {shard_id}")
+    value = u.int & ~(0xFFFF << _SHARD_ID_SHIFT)
+    value |= _SHARD_MARKER << _SHARD_MARKER_SHIFT | shard_id << _SHARD_ID_SHIFT
+    return UUID(int=value)
+
+
+def extract_shard_id(u: UUID) -> int | None:
+    if u.version != 7:
+        return None
+    if (u.int >> _SHARD_MARKER_SHIFT) & 0xFF != _SHARD_MARKER:
+        return None
+    return (u.int >> _SHARD_ID_SHIFT) & _SHARD_ID_MASK
 
 
 def uuid_to_bin(u: UUID) -> bytes:
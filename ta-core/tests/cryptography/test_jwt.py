@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from jose import jwt
+
+from ta_core.cryptography.jwt import JWTCryptography
+from ta_core.features.account import Group
+from ta_core.features.auth import TokenType
+from ta_core.utils.uuid import generate_uuid, uuid_to_str
+
+_JWT_CRYPTOGRAPHY = JWTCryptography(
+    secret_key="secret",
+    algorithm="HS256",
+    access_token_expires=timedelta(minutes=60),
+    refresh_token_expires=timedelta(days=30),
+)
+
+
+def test_get_claims_from_token_with_jti() -> None:
+    subject = generate_uuid()
+    auth_token = _JWT_CRYPTOGRAPHY.create_auth_token(subject, Group.GUEST)
+    claims = _JWT_CRYPTOGRAPHY.get_claims_from_token(
+        auth_token.access_token, TokenType.ACCESS
+    )
+    assert claims is not None
+    assert claims.subject == subject
+    assert claims.jti
+
+
+def test_get_claims_from_token_without_jti() -> None:
+    token = jwt.encode(
+        {
+            "sub": uuid_to_str(generate_uuid()),
+            "group": Group.GUEST,
+            "type": TokenType.ACCESS,
+        },
+        "secret",
+        algorithm="HS256",
+    )
+    claims = _JWT_CRYPTOGRAPHY.get_claims_from_token(token, TokenType.ACCESS)
+    assert claims is not None
+    assert claims.jti is None
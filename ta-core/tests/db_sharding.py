@@ -6,6 +6,13 @@ from sqlalchemy.orm.session import ORMExecuteState
 from sqlalchemy.orm.state import InstanceState
 from sqlalchemy.sql.elements import ClauseElement
 
+from ta_core.infrastructure.db.sharding import (
+    extract_primary_key_values,
+    extract_shard_key_values,
+    resolve_shard_connection_key_by_primary_key,
+    resolve_shard_connection_keys,
+    resolve_shard_connection_keys_by_primary_keys,
+)
 from tests.db_settings import (
     TEST_COMMON_DB_CONNECTION_KEY,
     TEST_CONNECTIONS,
@@ -40,8 +47,21 @@ def identity_chooser(
 ) -> Any:
     if lazy_loaded_from:
         return [lazy_loaded_from.identity_token]
-    else:
+    shard_ids: tuple[str, ...] | None = mapper.local_table.info.get("shard_ids")  # type: ignore[attr-defined]
+    if shard_ids is None:
         return list(TEST_CONNECTIONS.keys())
+    if shard_ids == TEST_SHARD_DB_CONNECTION_KEYS:
+        primary_key_value = (
+            primary_key[0] if isinstance(primary_key, (tuple, list)) else primary_key
+        )
+        connection_key = resolve_shard_connection_key_by_primary_key(
+            primary_key_value, TEST_SHARD_DB_CONNECTION_KEYS
+        )
+        if connection_key is not None:
+            return [connection_key] + [
+                shard_id for shard_id in shard_ids if shard_id != connection_key
+            ]
+    return list(shard_ids)
 
 
 def execute_chooser(context: ORMExecuteState) -> Iterable[Any]:
@@ -52,8 +72,27 @@ def execute_chooser(context: ORMExecuteState) -> Iterable[Any]:
             shard_ids.update(ids)
     if len(shard_ids) == 0:
         return list(TEST_CONNECTIONS.keys())
-    else:
-        return list(shard_ids)
+    if shard_ids == set(TEST_SHARD_DB_CONNECTION_KEYS):
+        shard_key_values = extract_shard_key_values(
+            context.statement, TEST_SHARD_DB_CONNECTION_KEYS
+        )
+        if shard_key_values is not None:
+            return resolve_shard_connection_keys(
+                shard_key_values,
+                TEST_SHARD_DB_CONNECTION_KEYS,
+                test_db_shard_resolver.resolve_shard_id,
+            )
+        if context.is_select:
+            primary_key_values = extract_primary_key_values(
+                context.statement, TEST_SHARD_DB_CONNECTION_KEYS
+            )
+            if primary_key_values is not None:
+                connection_keys = resolve_shard_connection_keys_by_primary_keys(
+                    primary_key_values, TEST_SHARD_DB_CONNECTION_KEYS
+                )
+                if connection_keys is not None:
+                    return connection_keys
+    return list(shard_ids)
 
 
 @dataclass(frozen=True)
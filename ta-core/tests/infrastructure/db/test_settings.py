@@ -0,0 +1,36 @@
+import pytest
+
+from ta_core.infrastructure.db.settings import _get_db_pool_config
+
+
+def test_get_db_pool_config_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in (
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_RECYCLE",
+        "DB_POOL_TIMEOUT",
+        "DB_POOL_PRE_PING",
+        "DB_ECHO",
+    ):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(f"{name}_SHARD0", raising=False)
+    assert _get_db_pool_config("shard0") == {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_recycle": 3600,
+        "pool_timeout": 30.0,
+        "pool_pre_ping": True,
+        "echo": False,
+    }
+
+
+def test_get_db_pool_config_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_SIZE_SHARD0", "30")
+    monkeypatch.setenv("DB_ECHO", "true")
+    monkeypatch.setenv("DB_POOL_PRE_PING_COMMON", "false")
+    assert _get_db_pool_config("shard0")["pool_size"] == 30
+    assert _get_db_pool_config("shard1")["pool_size"] == 20
+    assert _get_db_pool_config("shard1")["echo"] is True
+    assert _get_db_pool_config("common")["pool_pre_ping"] is False
+    assert _get_db_pool_config("sequence")["pool_pre_ping"] is True
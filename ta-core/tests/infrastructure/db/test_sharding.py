@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import delete, or_, select, update
+
+from ta_core.infrastructure.db.settings import SHARD_DB_CONNECTION_KEYS
+from ta_core.infrastructure.db.sharding import (
+    DbShardResolver,
+    extract_primary_key_values,
+    extract_shard_key_values,
+    resolve_shard_connection_key,
+    resolve_shard_connection_keys,
+    resolve_shard_connection_keys_by_primary_keys,
+)
+from ta_core.infrastructure.sqlalchemy.models.shards.event import Event
+from ta_core.utils.uuid import generate_uuid, str_to_uuid, uuid_to_bin
+
+SHARD0_ID = uuid_to_bin(generate_uuid(0))
+SHARD1_ID = uuid_to_bin(generate_uuid(1))
+UNTAGGED_ID = uuid_to_bin(str_to_uuid("01900000-0000-7000-8000-000000000000"))
+
+
+@pytest.mark.parametrize(
+    "statement, expected_shard_key_values",
+    [
+        (select(Event), None),
+        (select(Event).where(Event.user_id == 3), {3}),
+        (select(Event).where(Event.user_id.in_([1, 2, 5])), {1, 2, 5}),
+        (select(Event).where(Event.user_id.in_([])), set()),
+        (
+            select(Event).where(Event.user_id.in_([1, 2, 5]), Event.user_id == 2),
+            {2},
+        ),
+        (select(Event).where(Event.id == b"\x00" * 16, Event.user_id == 4), {4}),
+        (select(Event).where(or_(Event.user_id == 1, Event.user_id == 2)), None),
+        (select(Event).where(Event.user_id > 1), None),
+        (update(Event).where(Event.user_id == 7).values(summary="summary"), {7}),
+        (delete(Event).where(Event.user_id.in_([6, 8])), {6, 8}),
+    ],
+)
+def test_extract_shard_key_values(
+    statement: object, expected_shard_key_values: set[int] | None
+) -> None:
+    assert (
+        extract_shard_key_values(statement, SHARD_DB_CONNECTION_KEYS)
+        == expected_shard_key_values
+    )
+
+
+@pytest.mark.parametrize(
+    "shard_key_values, expected_connection_keys",
+    [
+        ({0, 2, 4}, ["shard0"]),
+        ({1, 3}, ["shard1"]),
+        ({1, 2}, ["shard0", "shard1"]),
+        (set(), ["shard0"]),
+    ],
+)
+def test_resolve_shard_connection_keys(
+    shard_key_values: set[int], expected_connection_keys: list[str]
+) -> None:
+    assert (
+        resolve_shard_connection_keys(
+            shard_key_values,
+            ("shard0", "shard1"),
+            DbShardResolver(shard_count=2).resolve_shard_id,
+        )
+        == expected_connection_keys
+    )
+
+
+@pytest.mark.parametrize(
+    "shard_key_value, expected_connection_key",
+    [(0, "shard0"), (1, "shard1"), (2, "shard0"), (7, "shard1")],
+)
+def test_resolve_shard_connection_key(
+    shard_key_value: int, expected_connection_key: str
+) -> None:
+    assert (
+        resolve_shard_connection_key(
+            shard_key_value,
+            ("shard0", "shard1"),
+            DbShardResolver(shard_count=2).resolve_shard_id,
+        )
+        == expected_connection_key
+    )
+
+
+@pytest.mark.parametrize(
+    "statement, expected_primary_key_values",
+    [
+        (select(Event).where(Event.user_id == 3), None),
+        (select(Event).where(Event.id == SHARD0_ID), {SHARD0_ID}),
+        (
+            select(Event).where(Event.id.in_([SHARD0_ID, SHARD1_ID])),
+            {SHARD0_ID, SHARD1_ID},
+        ),
+    ],
+)
+def test_extract_primary_key_values(
+    statement: object, expected_primary_key_values: set[bytes] | None
+) -> None:
+    assert (
+        extract_primary_key_values(statement, SHARD_DB_CONNECTION_KEYS)
+        == expected_primary_key_values
+    )
+
+
+@pytest.mark.parametrize(
+    "primary_keys, expected_connection_keys",
+    [
+        ({SHARD0_ID}, ["shard0"]),
+        ({SHARD1_ID}, ["shard1"]),
+        ({SHARD0_ID, SHARD1_ID}, ["shard0", "shard1"]),
+        ({SHARD0_ID, UNTAGGED_ID}, None),
+        ({uuid_to_bin(generate_uuid(2))}, None),
+        (set(), ["shard0"]),
+    ],
+)
+def test_resolve_shard_connection_keys_by_primary_keys(
+    primary_keys: set[bytes], expected_connection_keys: list[str] | None
+) -> None:
+    assert (
+        resolve_shard_connection_keys_by_primary_keys(
+            primary_keys, ("shard0", "shard1")
+        )
+        == expected_connection_keys
+    )
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import select
+
+from ta_core.constants.constants import SEQUENCE_ID_BLOCK_SIZE
+from ta_core.infrastructure.sqlalchemy.models.sequences import base as sequence_base
+from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
+from ta_core.infrastructure.sqlalchemy.unit_of_work import SqlalchemyUnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_id_generator_reserves_blocks(test_session: AsyncSession) -> None:
+    sequence_base._id_blocks.clear()
+    uow = SqlalchemyUnitOfWork(session=test_session)
+
+    count = SEQUENCE_ID_BLOCK_SIZE * 2 + 1
+    user_ids = await asyncio.gather(
+        *(SequenceUserId.id_generator(uow) for _ in range(count))
+    )
+    assert sorted(user_ids) == list(range(count))
+
+    # The row holds the last reserved ID and is committed independently of the
+    # caller's transaction
+    await uow.rollback_async()
+    result = await uow.execute_async(select(SequenceUserId.id))
+    assert result.scalar_one() == SEQUENCE_ID_BLOCK_SIZE * 3 - 1
@@ -611,3 +611,44 @@ async def test_read_with_followers_by_id_or_none_async(
     assert followee.followees == []
     assert followee.follower_ids == []
     assert followee.followers == []
+
+
+@pytest.mark.asyncio
+async def test_read_followee_user_ids_by_id_or_none_async(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    user_account_repository = UserAccountRepository(uow)
+
+    entity_ids = [generate_uuid() for _ in range(3)]
+    user_ids = [await SequenceUserId.id_generator(uow) for _ in range(3)]
+    for user_index in range(3):
+        await user_account_repository.create_user_account_async(
+            entity_id=entity_ids[user_index],
+            user_id=user_ids[user_index],
+            username=f"username{user_index}",
+            hashed_password="hashed_password",
+            birth_date=datetime(2000, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC")),
+            gender=Gender.MALE,
+            email=f"user{user_index}@example.com",
+            # ユーザー 2 はユーザー 0 と 1 をフォロー
+            followee_ids=set(entity_ids[:2]) if user_index == 2 else set(),
+            follower_ids=set(),
+        )
+
+    assert await user_account_repository.read_followee_user_ids_by_id_or_none_async(
+        entity_ids[2]
+    ) == (user_ids[2], set(user_ids[:2]))
+    assert await user_account_repository.read_followee_user_ids_by_id_or_none_async(
+        entity_ids[0]
+    ) == (user_ids[0], set())
+    assert (
+        await user_account_repository.read_followee_user_ids_by_id_or_none_async(
+            generate_uuid()
+        )
+        is None
+    )
+
+    assert await user_account_repository.read_usernames_by_user_ids_async(
+        {user_ids[0], user_ids[2]}
+    ) == {user_ids[0]: "username0", user_ids[2]: "username2"}
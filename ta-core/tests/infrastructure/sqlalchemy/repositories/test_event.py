@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -14,6 +14,7 @@ from ta_core.domain.entities.event import (
 )
 from ta_core.domain.entities.event import RecurrenceRule as RecurrenceRuleEntity
 from ta_core.features.event import AttendanceAction, AttendanceState, Frequency, Weekday
+from ta_core.infrastructure.db.sharding import db_shard_resolver
 from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
 from ta_core.infrastructure.sqlalchemy.models.shards.event import (
     EventAttendanceActionLog,
@@ -731,6 +732,54 @@ async def test_create_or_update_event_attendance_async(
     )  # 状態が更新されている
 
 
+@pytest.mark.asyncio
+async def test_bulk_upsert_event_attendances_async(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_attendance_repository = EventAttendanceRepository(uow)
+
+    event_id = generate_uuid()
+    start = datetime(2000, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    user_ids = [await SequenceUserId.id_generator(uow) for _ in range(2)]
+    attendances = [
+        EventAttendanceEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            event_id=event_id,
+            start=start,
+            state=AttendanceState.PRESENT,
+        )
+        for user_id in user_ids
+    ]
+    await event_attendance_repository.bulk_upsert_event_attendances_async(attendances)
+
+    await event_attendance_repository.bulk_upsert_event_attendances_async(
+        [
+            EventAttendanceEntity(
+                entity_id=generate_uuid(),
+                user_id=user_ids[0],
+                event_id=event_id,
+                start=start,
+                state=AttendanceState.EXCUSED_ABSENCE,
+            )
+        ]
+    )
+
+    first = await event_attendance_repository.read_by_user_id_and_event_id_and_start_or_none_async(
+        user_id=user_ids[0], event_id=event_id, start=start
+    )
+    assert first is not None
+    assert first.id == attendances[0].id
+    assert first.state == AttendanceState.EXCUSED_ABSENCE
+
+    second = await event_attendance_repository.read_by_user_id_and_event_id_and_start_or_none_async(
+        user_id=user_ids[1], event_id=event_id, start=start
+    )
+    assert second is not None
+    assert second.state == AttendanceState.PRESENT
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "event_id, start, action, acted_at",
@@ -777,6 +826,43 @@ async def test_create_event_attendance_action_log_async(
 test_event_id = generate_uuid()
 
 
+@pytest.mark.asyncio
+async def test_bulk_insert_stream_async(test_session: AsyncSession) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_attendance_action_log_repository = EventAttendanceActionLogRepository(uow)
+
+    event_id = generate_uuid()
+    start = datetime(2000, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    event_attendance_action_logs = [
+        EventAttendanceActionLogEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            event_id=event_id,
+            start=start,
+            action=AttendanceAction.ATTEND,
+            acted_at=start + timedelta(minutes=minute),
+        )
+        for user_id in range(3)
+        for minute in range(5)
+    ]
+
+    inserted_count = (
+        await event_attendance_action_log_repository.bulk_insert_stream_async(
+            iter(event_attendance_action_logs), chunk_size=4
+        )
+    )
+    assert inserted_count == len(event_attendance_action_logs)
+    # Core inserts must not populate the identity map
+    assert len(test_session.sync_session.identity_map) == 0
+
+    fetched_logs = await event_attendance_action_log_repository.read_all_async(
+        where=(EventAttendanceActionLog.event_id == uuid_to_bin(event_id),)
+    )
+    assert {log.id for log in fetched_logs} == {
+        log.id for log in event_attendance_action_logs
+    }
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "event_attendance_action_logs",
@@ -1491,6 +1577,66 @@ async def test_bulk_delete_insert_event_attendance_forecasts_async(
         assert updated.forecasted_duration == expected.forecasted_duration
 
 
+@pytest.mark.asyncio
+async def test_bulk_upsert_event_attendance_forecasts_async(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_attendance_forecast_repository = EventAttendanceForecastRepository(uow)
+
+    event_id = generate_uuid()
+    kept_start = datetime(2000, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    stale_start = datetime(2000, 1, 2, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    forecasts = [
+        EventAttendanceForecastEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            event_id=event_id,
+            start=start,
+            forecasted_attended_at=start,
+            forecasted_duration=3600,
+        )
+        for user_id in (0, 1)
+        for start in (kept_start, stale_start)
+    ]
+    first_refreshed_at = datetime(2001, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    await event_attendance_forecast_repository.bulk_upsert_event_attendance_forecasts_async(
+        forecasts, first_refreshed_at
+    )
+
+    refreshed_forecasts = [
+        EventAttendanceForecastEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            event_id=event_id,
+            start=kept_start,
+            forecasted_attended_at=kept_start,
+            forecasted_duration=7200,
+        )
+        for user_id in (0, 1)
+    ]
+    second_refreshed_at = datetime(2001, 1, 2, 0, 0, 0, tzinfo=ZoneInfo("UTC"))
+    await event_attendance_forecast_repository.bulk_upsert_event_attendance_forecasts_async(
+        refreshed_forecasts, second_refreshed_at
+    )
+    deleted_count = await event_attendance_forecast_repository.delete_stale_event_attendance_forecasts_async(
+        second_refreshed_at
+    )
+    assert deleted_count == 2
+
+    fetched_forecasts = (
+        await event_attendance_forecast_repository.read_all_by_event_ids_async(
+            {event_id}
+        )
+    )
+    assert len(fetched_forecasts) == 2
+    for fetched in fetched_forecasts:
+        assert fetched.start == kept_start
+        assert fetched.forecasted_duration == 7200
+        # The row inserted first keeps its id when it is updated
+        assert fetched.id in {forecast.id for forecast in forecasts}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "event_forecasts",
@@ -1573,3 +1719,84 @@ async def test_read_all_by_event_ids_async(
         )
     )
     assert len(non_existent_forecasts) == 0
+
+
+@pytest.mark.asyncio
+async def test_read_rows_by_event_ids_async(test_session: AsyncSession) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_attendance_forecast_repository = EventAttendanceForecastRepository(uow)
+
+    event_id = generate_uuid()
+    start = datetime(2000, 1, 1, 0, 0, 0)
+    forecast = EventAttendanceForecastEntity(
+        entity_id=generate_uuid(),
+        user_id=1,
+        event_id=event_id,
+        start=start,
+        forecasted_attended_at=start + timedelta(hours=9),
+        forecasted_duration=3600,
+    )
+    created_forecasts = await event_attendance_forecast_repository.bulk_delete_insert_event_attendance_forecasts_async(
+        [forecast]
+    )
+    assert created_forecasts is not None
+
+    rows = await event_attendance_forecast_repository.read_rows_by_event_ids_async(
+        {event_id}
+    )
+    assert len(rows) == 1
+    assert rows[0].event_id == uuid_to_bin(event_id)
+    assert rows[0].user_id == 1
+    assert rows[0].start == start
+    assert rows[0].forecasted_attended_at == start + timedelta(hours=9)
+    assert rows[0].forecasted_duration == 3600
+
+    assert (
+        await event_attendance_forecast_repository.read_rows_by_event_ids_async(
+            {generate_uuid()}
+        )
+        == ()
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_by_id_async_with_untagged_ids(test_session: AsyncSession) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_repository = EventRepository(uow)
+
+    user_id = await SequenceUserId.id_generator(uow)
+    other_shard_id = (
+        db_shard_resolver.resolve_shard_id(user_id) + 1
+    ) % db_shard_resolver.shard_count
+    # シャード ID を埋め込む前に発行された ID と、別のシャードを指して見える ID
+    event_ids = (generate_uuid(), generate_uuid(other_shard_id))
+    for event_id in event_ids:
+        event = await event_repository.create_event_async(
+            entity_id=event_id,
+            user_id=user_id,
+            summary="summary",
+            location=None,
+            start=datetime(2000, 1, 1, 0, 0, 0),
+            end=datetime(2000, 1, 1, 1, 0, 0),
+            is_all_day=False,
+            recurrence_id=None,
+            timezone="UTC",
+        )
+        assert event is not None
+    await uow.commit_async()
+
+    # 書き込みのない新しい Unit of Work から読み込む
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_repository = EventRepository(uow)
+
+    for event_id in event_ids:
+        fetched = await event_repository.read_by_id_or_none_async(event_id)
+        assert fetched is not None
+        assert fetched.id == event_id
+        assert fetched.user_id == user_id
+        assert fetched.recurrence is None
+
+    fetched_events = await event_repository.read_by_ids_async(set(event_ids))
+    assert {event.id for event in fetched_events} == set(event_ids)
+
+    assert await event_repository.read_by_id_or_none_async(generate_uuid()) is None
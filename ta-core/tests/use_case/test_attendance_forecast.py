@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ta_core.domain.entities.event import (
+    EventAttendanceForecast as EventAttendanceForecastEntity,
+)
+from ta_core.features.account import Gender
+from ta_core.infrastructure.db.sharding import generate_shard_uuid
+from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
+from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
+from ta_core.infrastructure.sqlalchemy.repositories.event import (
+    EventAttendanceForecastRepository,
+    EventRepository,
+)
+from ta_core.infrastructure.sqlalchemy.unit_of_work import SqlalchemyUnitOfWork
+from ta_core.use_case.event import EventUseCase
+from ta_core.utils.uuid import generate_uuid, uuid_to_str
+
+
+@pytest.mark.asyncio
+async def test_get_attendance_time_forecasts_async_skips_missing_accounts(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    user_account_repository = UserAccountRepository(uow)
+    event_repository = EventRepository(uow)
+    event_attendance_forecast_repository = EventAttendanceForecastRepository(uow)
+
+    host = await user_account_repository.create_user_account_async(
+        entity_id=generate_uuid(),
+        user_id=await SequenceUserId.id_generator(uow),
+        username="host",
+        hashed_password="hashed_password",
+        birth_date=datetime(2000, 1, 1, tzinfo=ZoneInfo("UTC")),
+        gender=Gender.MALE,
+        email="host@example.com",
+        followee_ids=set(),
+        follower_ids=set(),
+    )
+    assert host is not None
+
+    start = datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+    event = await event_repository.create_event_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        summary="summary",
+        location=None,
+        start=start,
+        end=start + timedelta(hours=1),
+        is_all_day=False,
+        recurrence_id=None,
+        timezone="UTC",
+    )
+    assert event is not None
+    # Forecasted for the host and for a user without an account
+    missing_user_id = await SequenceUserId.id_generator(uow)
+    await event_attendance_forecast_repository.bulk_upsert_event_attendance_forecasts_async(
+        [
+            EventAttendanceForecastEntity(
+                entity_id=generate_shard_uuid(user_id),
+                user_id=user_id,
+                event_id=event.id,
+                start=start,
+                forecasted_attended_at=start,
+                forecasted_duration=3600,
+            )
+            for user_id in (host.user_id, missing_user_id)
+        ],
+        datetime.now(ZoneInfo("UTC")),
+    )
+    await uow.commit_async()
+
+    response = await EventUseCase(uow=uow).get_attendance_time_forecasts_async(
+        account_id=host.id
+    )
+
+    assert response.error_codes == ()
+    forecasts = response.attendance_time_forecasts_with_username[uuid_to_str(event.id)]
+    assert list(forecasts) == [host.user_id]
+    assert forecasts[host.user_id].username == "host"
@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio.engine import AsyncEngine
+from sqlalchemy.sql import text
+
+from ta_core.domain.entities.account import UserAccount as UserAccountEntity
+from ta_core.dtos.event import BatchAttendance as BatchAttendanceDto
+from ta_core.error.error_code import ErrorCode
+from ta_core.features.account import Gender
+from ta_core.features.event import AttendanceAction, Frequency, Weekday
+from ta_core.infrastructure.db.sharding import (
+    db_shard_resolver,
+    generate_shard_uuid,
+    resolve_shard_connection_key,
+)
+from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
+from ta_core.infrastructure.sqlalchemy.models.shards.event import EventAttendance
+from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
+from ta_core.infrastructure.sqlalchemy.repositories.event import (
+    EventAttendanceRepository,
+    EventRepository,
+    RecurrenceRepository,
+    RecurrenceRuleRepository,
+)
+from ta_core.infrastructure.sqlalchemy.unit_of_work import SqlalchemyUnitOfWork
+from ta_core.use_case.event import EventUseCase
+from ta_core.utils.uuid import generate_uuid
+from tests.db_settings import TEST_SHARD_DB_CONNECTION_KEYS
+
+
+async def _create_user_account_async(
+    uow: SqlalchemyUnitOfWork, username: str
+) -> UserAccountEntity:
+    user_account_repository = UserAccountRepository(uow)
+    user_account = await user_account_repository.create_user_account_async(
+        entity_id=generate_uuid(),
+        user_id=await SequenceUserId.id_generator(uow),
+        username=username,
+        hashed_password="hashed_password",
+        birth_date=datetime(2000, 1, 1, tzinfo=ZoneInfo("UTC")),
+        gender=Gender.MALE,
+        email=f"{username}@example.com",
+        followee_ids=set(),
+        follower_ids=set(),
+    )
+    assert user_account is not None
+    return user_account
+
+
+@pytest.mark.asyncio
+async def test_batch_attend_event_async_reports_failed_shard(
+    test_session: AsyncSession, async_engines: dict[str, AsyncEngine]
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_repository = EventRepository(uow)
+    event_attendance_repository = EventAttendanceRepository(uow)
+
+    host = await _create_user_account_async(uow, "host")
+    # Consecutive user IDs live on different shards
+    guest0 = await _create_user_account_async(uow, "guest0")
+    guest1 = await _create_user_account_async(uow, "guest1")
+
+    start = datetime.now(ZoneInfo("UTC")).replace(microsecond=0) - timedelta(minutes=10)
+    event = await event_repository.create_event_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        summary="summary",
+        location=None,
+        start=start,
+        end=start + timedelta(hours=1),
+        is_all_day=False,
+        recurrence_id=None,
+        timezone="UTC",
+    )
+    assert event is not None
+    await uow.commit_async()
+
+    failing_shard_id = resolve_shard_connection_key(
+        guest1.user_id,
+        TEST_SHARD_DB_CONNECTION_KEYS,
+        db_shard_resolver.resolve_shard_id,
+    )
+    async with async_engines[failing_shard_id].connect() as conn:
+        await conn.execute(
+            text(
+                "RENAME TABLE event_attendance_action_log"
+                " TO event_attendance_action_log_unavailable"
+            )
+        )
+    try:
+        response = await EventUseCase(uow=uow).batch_attend_event_async(
+            host_id=host.id,
+            attendances=[
+                BatchAttendanceDto(
+                    username=guest.username,
+                    event_id=str(event.id),
+                    start=start,
+                    action=AttendanceAction.ATTEND,
+                )
+                for guest in (guest0, guest1)
+            ],
+        )
+    finally:
+        async with async_engines[failing_shard_id].connect() as conn:
+            await conn.execute(
+                text(
+                    "RENAME TABLE event_attendance_action_log_unavailable"
+                    " TO event_attendance_action_log"
+                )
+            )
+
+    assert response.error_codes == ()
+    assert [result.error_codes for result in response.results] == [
+        (),
+        (ErrorCode.EVENT_ATTENDANCE_NOT_RECORDED,),
+    ]
+    rows = await event_attendance_repository.read_columns_async(
+        (EventAttendance.user_id,), where=()
+    )
+    # The failed shard's attendance upsert is rolled back with its logs
+    assert {user_id for user_id, in rows} == {guest0.user_id}
+
+
+@pytest.mark.asyncio
+async def test_attend_event_async_accepts_later_weekly_occurrence(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    recurrence_rule_repository = RecurrenceRuleRepository(uow)
+    recurrence_repository = RecurrenceRepository(uow)
+    event_repository = EventRepository(uow)
+    event_attendance_repository = EventAttendanceRepository(uow)
+
+    host = await _create_user_account_async(uow, "host")
+    guest0 = await _create_user_account_async(uow, "guest0")
+    guest1 = await _create_user_account_async(uow, "guest1")
+
+    recurrence_rule = await recurrence_rule_repository.create_recurrence_rule_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        freq=Frequency.WEEKLY,
+        until=None,
+        count=None,
+        interval=1,
+        bysecond=None,
+        byminute=None,
+        byhour=None,
+        byday=None,
+        bymonthday=None,
+        byyearday=None,
+        byweekno=None,
+        bymonth=None,
+        bysetpos=None,
+        wkst=Weekday.MO,
+    )
+    assert recurrence_rule is not None
+    recurrence = await recurrence_repository.create_recurrence_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        rrule_id=recurrence_rule.id,
+        rrule=recurrence_rule,
+        rdate=[],
+        exdate=[],
+    )
+    assert recurrence is not None
+
+    # The second weekly occurrence is the one in progress
+    second_start = datetime.now(ZoneInfo("UTC")).replace(microsecond=0) - timedelta(
+        minutes=10
+    )
+    first_start = second_start - timedelta(weeks=1)
+    event = await event_repository.create_event_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        summary="summary",
+        location=None,
+        start=first_start,
+        end=first_start + timedelta(hours=1),
+        is_all_day=False,
+        recurrence_id=recurrence.id,
+        timezone="UTC",
+    )
+    assert event is not None
+    await uow.commit_async()
+
+    event_use_case = EventUseCase(uow=uow)
+    response = await event_use_case.attend_event_async(
+        guest_id=guest0.id,
+        event_id_str=str(event.id),
+        start=second_start,
+        action=AttendanceAction.ATTEND,
+    )
+    assert response.error_codes == ()
+
+    response = await event_use_case.attend_event_async(
+        guest_id=guest0.id,
+        event_id_str=str(event.id),
+        start=second_start + timedelta(minutes=1),
+        action=AttendanceAction.ATTEND,
+    )
+    assert response.error_codes == (ErrorCode.EVENT_NOT_ATTENDABLE,)
+
+    batch_response = await event_use_case.batch_attend_event_async(
+        host_id=host.id,
+        attendances=[
+            BatchAttendanceDto(
+                username=guest1.username,
+                event_id=str(event.id),
+                start=second_start,
+                action=AttendanceAction.ATTEND,
+            )
+        ],
+    )
+    assert batch_response.error_codes == ()
+    assert [result.error_codes for result in batch_response.results] == [()]
+
+    rows = await event_attendance_repository.read_columns_async(
+        (EventAttendance.user_id, EventAttendance.start), where=()
+    )
+    assert {tuple(row) for row in rows} == {
+        (guest0.user_id, second_start.replace(tzinfo=None)),
+        (guest1.user_id, second_start.replace(tzinfo=None)),
+    }
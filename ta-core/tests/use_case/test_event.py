@@ -0,0 +1,138 @@
+import os
+import subprocess
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from ta_core.domain.entities.event import Event as EventEntity
+from ta_core.domain.entities.event import Recurrence as RecurrenceEntity
+from ta_core.domain.entities.event import RecurrenceRule as RecurrenceRuleEntity
+from ta_core.features.event import Frequency, Weekday
+from ta_core.use_case.event import (
+    _compiled_recurrence_cache,
+    decode_event_cursor,
+    encode_event_cursor,
+    generate_event_occurrences,
+    serialize_events,
+    split_event_page,
+)
+from ta_core.utils.uuid import generate_uuid
+
+
+def test_event_use_case_does_not_import_forecasting_stack() -> None:
+    code = (
+        "import sys\n"
+        "import ta_core.use_case.event\n"
+        "heavy = ('ta_ml.forecast', 'timesfm', 'torch', 'pandas', 'statsmodels')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.stdout.strip() == ""
+
+
+def _build_weekly_event(exdate: list[str]) -> EventEntity:
+    recurrence_rule = RecurrenceRuleEntity(
+        entity_id=generate_uuid(),
+        user_id=1,
+        freq=Frequency.WEEKLY,
+        until=None,
+        count=None,
+        interval=1,
+        bysecond=None,
+        byminute=None,
+        byhour=None,
+        byday=None,
+        bymonthday=None,
+        byyearday=None,
+        byweekno=None,
+        bymonth=None,
+        bysetpos=None,
+        wkst=Weekday.MO,
+    )
+    recurrence = RecurrenceEntity(
+        entity_id=generate_uuid(),
+        user_id=1,
+        rrule_id=recurrence_rule.id,
+        rrule=recurrence_rule,
+        rdate=[],
+        exdate=exdate,
+    )
+    utc = ZoneInfo("UTC")
+    return EventEntity(
+        entity_id=generate_uuid(),
+        user_id=1,
+        summary="Weekly",
+        location=None,
+        start=datetime(2024, 1, 1, 9, 0, tzinfo=utc),
+        end=datetime(2024, 1, 1, 10, 30, tzinfo=utc),
+        is_all_day=False,
+        recurrence_id=recurrence.id,
+        timezone="UTC",
+        recurrence=recurrence,
+    )
+
+
+def test_generate_event_occurrences() -> None:
+    utc = ZoneInfo("UTC")
+    event = _build_weekly_event(["2024-01-15"])
+
+    occurrences = list(
+        generate_event_occurrences(
+            event,
+            datetime(2024, 1, 2, tzinfo=utc),
+            datetime(2024, 1, 29, 9, 0, tzinfo=utc),
+        )
+    )
+    assert [occurrence.start for occurrence in occurrences] == [
+        datetime(2024, 1, 8, 9, 0, tzinfo=utc),
+        datetime(2024, 1, 22, 9, 0, tzinfo=utc),
+    ]
+    assert all(
+        occurrence.end - occurrence.start == event.end - event.start
+        and occurrence.event_id == event.id
+        and occurrence.user_id == event.user_id
+        for occurrence in occurrences
+    )
+
+
+def test_generate_event_occurrences_excludes_after() -> None:
+    utc = ZoneInfo("UTC")
+    event = _build_weekly_event([])
+
+    occurrences = list(
+        generate_event_occurrences(
+            event,
+            datetime(2024, 1, 8, 9, 0, tzinfo=utc),
+            datetime(2024, 2, 1, tzinfo=utc),
+            limit=2,
+        )
+    )
+    assert [occurrence.start for occurrence in occurrences] == [
+        datetime(2024, 1, 15, 9, 0, tzinfo=utc),
+        datetime(2024, 1, 22, 9, 0, tzinfo=utc),
+    ]
+
+
+def test_serialize_events_reuses_compiled_recurrence() -> None:
+    event = _build_weekly_event([])
+    hits = _compiled_recurrence_cache.hits
+    first, second = serialize_events((event, event))
+    assert first.recurrence_list == ["RRULE:FREQ=WEEKLY;INTERVAL=1;WKST=MO"]
+    assert second.recurrence_list == first.recurrence_list
+    assert _compiled_recurrence_cache.hits == hits + 1
+
+
+def test_split_event_page() -> None:
+    events = tuple(_build_weekly_event([]) for _ in range(3))
+    page, next_cursor = split_event_page(events, 2)
+    assert page == events[:2]
+    assert next_cursor == encode_event_cursor(events[1])
+    assert decode_event_cursor(next_cursor) == (events[1].start, events[1].id)
+    assert split_event_page(events, 3) == (events, None)
+    assert decode_event_cursor("invalid") is None
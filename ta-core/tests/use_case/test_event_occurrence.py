@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ta_core.domain.entities.event import Event as EventEntity
+from ta_core.domain.entities.event import EventOccurrence as EventOccurrenceEntity
+from ta_core.features.event import Frequency, Weekday
+from ta_core.infrastructure.sqlalchemy.models.sequences.sequence import SequenceUserId
+from ta_core.infrastructure.sqlalchemy.models.shards.event import EventOccurrence
+from ta_core.infrastructure.sqlalchemy.repositories.base import STREAM_BATCH_SIZE
+from ta_core.infrastructure.sqlalchemy.repositories.event import (
+    EventOccurrenceRepository,
+    EventRepository,
+    RecurrenceRepository,
+    RecurrenceRuleRepository,
+)
+from ta_core.infrastructure.sqlalchemy.unit_of_work import SqlalchemyUnitOfWork
+from ta_core.use_case.event import EventUseCase
+from ta_core.utils.uuid import UUID, bin_to_uuid, generate_uuid
+
+
+async def _create_weekly_events_async(
+    uow: SqlalchemyUnitOfWork, user_id: int, event_count: int
+) -> set[UUID]:
+    recurrence_rule_repository = RecurrenceRuleRepository(uow)
+    recurrence_repository = RecurrenceRepository(uow)
+    event_repository = EventRepository(uow)
+
+    recurrence_rule = await recurrence_rule_repository.create_recurrence_rule_async(
+        entity_id=generate_uuid(),
+        user_id=user_id,
+        freq=Frequency.WEEKLY,
+        until=None,
+        count=2,
+        interval=1,
+        bysecond=None,
+        byminute=None,
+        byhour=None,
+        byday=None,
+        bymonthday=None,
+        byyearday=None,
+        byweekno=None,
+        bymonth=None,
+        bysetpos=None,
+        wkst=Weekday.MO,
+    )
+    assert recurrence_rule is not None
+    recurrence = await recurrence_repository.create_recurrence_async(
+        entity_id=generate_uuid(),
+        user_id=user_id,
+        rrule_id=recurrence_rule.id,
+        rrule=recurrence_rule,
+        rdate=[],
+        exdate=[],
+    )
+    assert recurrence is not None
+
+    start = datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+    events = [
+        EventEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            summary=f"event {user_id} {index}",
+            location=None,
+            start=start,
+            end=start + timedelta(hours=1),
+            is_all_day=False,
+            recurrence_id=recurrence.id,
+            timezone="UTC",
+        )
+        for index in range(event_count)
+    ]
+    assert await event_repository.bulk_create_async(events) is not None
+    return {event.id for event in events}
+
+
+@pytest.mark.asyncio
+async def test_materialize_event_occurrences_async(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_occurrence_repository = EventOccurrenceRepository(uow)
+
+    # Consecutive user IDs live on different shards, and each shard holds more
+    # events than one stream batch
+    event_ids: set[UUID] = set()
+    for _ in range(2):
+        user_id = await SequenceUserId.id_generator(uow)
+        event_ids |= await _create_weekly_events_async(
+            uow, user_id, STREAM_BATCH_SIZE + 1
+        )
+    await uow.commit_async()
+
+    response = await EventUseCase(uow=uow).materialize_event_occurrences_async()
+
+    assert response.error_codes == ()
+    assert response.occurrence_count == len(event_ids) * 2
+
+    rows = await event_occurrence_repository.read_columns_async(
+        (EventOccurrence.event_id,), where=()
+    )
+    assert len(rows) == len(event_ids) * 2
+    assert {bin_to_uuid(event_id) for event_id, in rows} == event_ids
+
+    # The latest materialized occurrence is not written again
+    response = await EventUseCase(uow=uow).materialize_event_occurrences_async()
+
+    assert response.error_codes == ()
+    assert response.occurrence_count == 0
+
+
+@pytest.mark.asyncio
+async def test_read_by_user_ids_and_start_range_async_pages_by_start_and_id(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_occurrence_repository = EventOccurrenceRepository(uow)
+
+    user_ids = {
+        await SequenceUserId.id_generator(uow),
+        await SequenceUserId.id_generator(uow),
+    }
+    start = datetime(2024, 1, 1, 9, 0)
+    # Occurrences on both shards share starts, so ties are broken by ID
+    occurrences = [
+        EventOccurrenceEntity(
+            entity_id=generate_uuid(),
+            user_id=user_id,
+            event_id=generate_uuid(),
+            start=start + timedelta(days=day),
+            end=start + timedelta(days=day, hours=1),
+        )
+        for user_id in user_ids
+        for day in range(3)
+        for _ in range(2)
+    ]
+    await event_occurrence_repository.bulk_upsert_event_occurrences_async(occurrences)
+    await uow.commit_async()
+
+    pages = []
+    after = None
+    while True:
+        page = await event_occurrence_repository.read_by_user_ids_and_start_range_async(
+            user_ids, start, start + timedelta(days=2), after, 3
+        )
+        if not page:
+            break
+        pages.append(page)
+        after = (page[-1].start, page[-1].id)
+
+    expected = sorted(
+        (
+            (occurrence.start, occurrence.id)
+            for occurrence in occurrences
+            if occurrence.start < start + timedelta(days=2)
+        ),
+    )
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert [
+        (occurrence.start, occurrence.id) for page in pages for occurrence in page
+    ] == expected
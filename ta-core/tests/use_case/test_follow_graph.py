@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import delete
+
+from ta_core.domain.entities.account import UserAccount as UserAccountEntity
+from ta_core.domain.entities.event import (
+    EventAttendanceForecast as EventAttendanceForecastEntity,
+)
+from ta_core.features.account import Gender
+from ta_core.infrastructure.db.sharding import generate_shard_uuid
+from ta_core.infrastructure.sqlalchemy.models.commons.account import (
+    FollowAssociation,
+)
+from ta_core.infrastructure.sqlalchemy.repositories.account import UserAccountRepository
+from ta_core.infrastructure.sqlalchemy.repositories.event import (
+    EventAttendanceForecastRepository,
+    EventRepository,
+)
+from ta_core.infrastructure.sqlalchemy.unit_of_work import SqlalchemyUnitOfWork
+from ta_core.use_case.account import AccountUseCase
+from ta_core.use_case.event import EventUseCase
+from ta_core.use_case.follow_graph import FollowGraph
+from ta_core.utils.uuid import generate_uuid, uuid_to_bin, uuid_to_str
+
+
+async def _create_user_account_async(
+    uow: SqlalchemyUnitOfWork, username: str, followee_usernames: set[str]
+) -> UserAccountEntity:
+    response = await AccountUseCase(uow=uow).create_user_account_async(
+        username=username,
+        password="password",
+        nickname=username,
+        birth_date=datetime(2000, 1, 1, tzinfo=ZoneInfo("UTC")),
+        gender=Gender.MALE,
+        email=f"{username}@example.com",
+        followee_usernames=followee_usernames,
+    )
+    assert response.error_codes == ()
+    user_account = await UserAccountRepository(uow).read_by_username_or_none_async(
+        username
+    )
+    assert user_account is not None
+    return user_account
+
+
+@pytest.mark.asyncio
+async def test_read_followee_user_ids_or_none_async(
+    test_session: AsyncSession,
+) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    follow_graph = FollowGraph(uow)
+
+    host = await _create_user_account_async(uow, "host", set())
+    guest = await _create_user_account_async(uow, "guest", {"host"})
+
+    # Loaded from the database on a miss
+    assert await follow_graph.read_followee_user_ids_or_none_async(guest.id) == (
+        guest.user_id,
+        frozenset({host.user_id}),
+    )
+    assert await follow_graph.read_followee_user_ids_or_none_async(host.id) == (
+        host.user_id,
+        frozenset(),
+    )
+    assert (
+        await follow_graph.read_followee_user_ids_or_none_async(generate_uuid()) is None
+    )
+
+    await uow.execute_async(
+        delete(FollowAssociation).where(
+            FollowAssociation.follower_id == uuid_to_bin(guest.id)
+        )
+    )
+    await uow.commit_async()
+
+    # Served from the cache until the follower is invalidated
+    assert await follow_graph.read_followee_user_ids_or_none_async(guest.id) == (
+        guest.user_id,
+        frozenset({host.user_id}),
+    )
+    FollowGraph.invalidate([guest.id])
+    assert await follow_graph.read_followee_user_ids_or_none_async(guest.id) == (
+        guest.user_id,
+        frozenset(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_reads_through_follow_graph(test_session: AsyncSession) -> None:
+    uow = SqlalchemyUnitOfWork(session=test_session)
+    event_repository = EventRepository(uow)
+    event_attendance_forecast_repository = EventAttendanceForecastRepository(uow)
+    use_case = EventUseCase(uow=uow)
+
+    host = await _create_user_account_async(uow, "host", set())
+    guest = await _create_user_account_async(uow, "guest", {"host"})
+
+    start = datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+    event = await event_repository.create_event_async(
+        entity_id=generate_shard_uuid(host.user_id),
+        user_id=host.user_id,
+        summary="summary",
+        location=None,
+        start=start,
+        end=start + timedelta(hours=1),
+        is_all_day=False,
+        recurrence_id=None,
+        timezone="UTC",
+    )
+    assert event is not None
+    await event_attendance_forecast_repository.bulk_upsert_event_attendance_forecasts_async(
+        [
+            EventAttendanceForecastEntity(
+                entity_id=generate_shard_uuid(guest.user_id),
+                user_id=guest.user_id,
+                event_id=event.id,
+                start=start,
+                forecasted_attended_at=start,
+                forecasted_duration=3600,
+            )
+        ],
+        datetime.now(ZoneInfo("UTC")),
+    )
+    await uow.commit_async()
+    FollowGraph.invalidate([guest.id])
+
+    # The first reads load the follow graph and the second ones hit the cache
+    following_events = [
+        await use_case.get_following_events_async(follower_id=guest.id)
+        for _ in range(2)
+    ]
+    forecasts = [
+        await use_case.get_attendance_time_forecasts_async(account_id=guest.id)
+        for _ in range(2)
+    ]
+
+    assert following_events[0] == following_events[1]
+    assert [event_dto.id for event_dto in following_events[0].events] == [
+        uuid_to_str(event.id)
+    ]
+    assert forecasts[0] == forecasts[1]
+    assert list(forecasts[0].attendance_time_forecasts_with_username) == [
+        uuid_to_str(event.id)
+    ]
+    assert (
+        forecasts[0]
+        .attendance_time_forecasts_with_username[uuid_to_str(event.id)][guest.user_id]
+        .username
+        == "guest"
+    )
@@ -0,0 +1,77 @@
+import pytest
+
+from ta_core.utils.cache import LRUCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    assert cache.get("b") == 2
+    clock.now = 5
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_caps_ttl_at_default() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock)
+    cache.set("a", 1, ttl=100)
+    clock.now = 10
+    assert cache.get("a") is None
+    cache.set("b", 2, ttl=0)
+    assert cache.get("b") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_pop_where() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10)
+    for i, key in enumerate("abcd"):
+        cache.set(key, i)
+    assert cache.pop_where(lambda value: value % 2 == 0) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 1
+    assert cache.pop("b") == 1
+    assert cache.pop("b") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        TTLCache(max_size=0, ttl=10)
+
+
+def test_lru_cache_counts_hits_and_misses() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    assert cache.get_or_set("a", lambda: 1) == 1
+    assert cache.get_or_set("a", lambda: 2) == 1
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
@@ -0,0 +1,168 @@
+from datetime import date, datetime
+from itertools import islice
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ta_core.features.event import Recurrence
+from ta_core.utils.rfc5545 import parse_rrule
+from ta_core.utils.rrule import RecurrenceExpander, RRuleExpander
+
+
+@pytest.mark.parametrize(
+    "rrule_str, dtstart, expected_occurrences",
+    [
+        (
+            "FREQ=DAILY;INTERVAL=3;COUNT=4",
+            datetime(2024, 1, 30, 9, 0),
+            [
+                datetime(2024, 1, 30, 9, 0),
+                datetime(2024, 2, 2, 9, 0),
+                datetime(2024, 2, 5, 9, 0),
+                datetime(2024, 2, 8, 9, 0),
+            ],
+        ),
+        (
+            "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;COUNT=5",
+            datetime(2024, 1, 2, 9, 0),
+            [
+                datetime(2024, 1, 2, 9, 0),
+                datetime(2024, 1, 4, 9, 0),
+                datetime(2024, 1, 16, 9, 0),
+                datetime(2024, 1, 18, 9, 0),
+                datetime(2024, 1, 30, 9, 0),
+            ],
+        ),
+        (
+            "FREQ=MONTHLY;BYDAY=2MO,-1FR;COUNT=4",
+            datetime(2024, 1, 1, 9, 0),
+            [
+                datetime(2024, 1, 8, 9, 0),
+                datetime(2024, 1, 26, 9, 0),
+                datetime(2024, 2, 12, 9, 0),
+                datetime(2024, 2, 23, 9, 0),
+            ],
+        ),
+        (
+            "FREQ=MONTHLY;BYMONTHDAY=-1;COUNT=3",
+            datetime(2024, 1, 31, 9, 0),
+            [
+                datetime(2024, 1, 31, 9, 0),
+                datetime(2024, 2, 29, 9, 0),
+                datetime(2024, 3, 31, 9, 0),
+            ],
+        ),
+        (
+            # Months without the 31st are skipped
+            "FREQ=MONTHLY;COUNT=3",
+            datetime(2024, 1, 31, 9, 0),
+            [
+                datetime(2024, 1, 31, 9, 0),
+                datetime(2024, 3, 31, 9, 0),
+                datetime(2024, 5, 31, 9, 0),
+            ],
+        ),
+        (
+            "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3",
+            datetime(2024, 1, 1, 9, 0),
+            [
+                datetime(2024, 1, 31, 9, 0),
+                datetime(2024, 2, 29, 9, 0),
+                datetime(2024, 3, 29, 9, 0),
+            ],
+        ),
+        (
+            "FREQ=YEARLY;BYMONTH=11;BYDAY=4TH;COUNT=2",
+            datetime(2024, 1, 1, 9, 0),
+            [datetime(2024, 11, 28, 9, 0), datetime(2025, 11, 27, 9, 0)],
+        ),
+        (
+            "FREQ=HOURLY;INTERVAL=4;BYHOUR=9,13,17;UNTIL=20240102T130000",
+            datetime(2024, 1, 1, 9, 0),
+            [
+                datetime(2024, 1, 1, 9, 0),
+                datetime(2024, 1, 1, 13, 0),
+                datetime(2024, 1, 1, 17, 0),
+                datetime(2024, 1, 2, 9, 0),
+                datetime(2024, 1, 2, 13, 0),
+            ],
+        ),
+    ],
+)
+def test_rrule_expander(
+    rrule_str: str, dtstart: datetime, expected_occurrences: list[datetime]
+) -> None:
+    expander = RRuleExpander(parse_rrule(rrule_str, False), dtstart)
+    assert list(expander.iter_after()) == expected_occurrences
+
+
+@pytest.mark.parametrize(
+    "rrule_str",
+    [
+        "FREQ=DAILY;INTERVAL=3",
+        "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+        "FREQ=MONTHLY;BYDAY=1SU,-1SA",
+        "FREQ=YEARLY;BYWEEKNO=1,-1;BYDAY=MO",
+        "FREQ=HOURLY;INTERVAL=7;BYDAY=SA",
+    ],
+)
+def test_rrule_expander_jumps_to_window(rrule_str: str) -> None:
+    dtstart = datetime(2000, 1, 3, 9, 0)
+    after = datetime(2030, 6, 15, 12, 0)
+    rrule = parse_rrule(rrule_str, False)
+    # Walk every occurrence from DTSTART for the reference
+    expected = []
+    for occurrence in RRuleExpander(rrule, dtstart).iter_after():
+        if occurrence >= after:
+            expected.append(occurrence)
+            if len(expected) == 10:
+                break
+    assert list(islice(RRuleExpander(rrule, dtstart).iter_after(after), 10)) == (
+        expected
+    )
+
+
+def test_rrule_expander_keeps_local_time_across_dst() -> None:
+    zone = ZoneInfo("America/New_York")
+    expander = RRuleExpander(
+        parse_rrule("FREQ=WEEKLY;COUNT=3", False),
+        datetime(2024, 3, 3, 9, 0, tzinfo=zone),
+    )
+    occurrences = list(expander.iter_after())
+    utc_hours = [
+        occurrence.astimezone(ZoneInfo("UTC")).hour for occurrence in occurrences
+    ]
+    assert [occurrence.hour for occurrence in occurrences] == [9, 9, 9]
+    assert utc_hours == [14, 13, 13]
+
+
+def test_rrule_expander_stops_on_impossible_rule() -> None:
+    # A week never has a second Wednesday
+    expander = RRuleExpander(
+        parse_rrule("FREQ=WEEKLY;BYDAY=WE;BYSETPOS=2", False), datetime(2024, 1, 1)
+    )
+    assert list(expander.iter_after()) == []
+
+
+def test_recurrence_expander() -> None:
+    recurrence = Recurrence(
+        rrule=parse_rrule("FREQ=WEEKLY;BYDAY=MO", False),
+        rdate=(date(2024, 1, 10),),
+        exdate=(date(2024, 1, 15),),
+    )
+    expander = RecurrenceExpander(recurrence, datetime(2024, 1, 3, 9, 0))
+    assert expander.between(datetime(2024, 1, 1), datetime(2024, 1, 30)) == [
+        datetime(2024, 1, 3, 9, 0),
+        datetime(2024, 1, 8, 9, 0),
+        datetime(2024, 1, 10, 9, 0),
+        datetime(2024, 1, 22, 9, 0),
+        datetime(2024, 1, 29, 9, 0),
+    ]
+    assert expander.recent(datetime(2024, 1, 22, 9, 0), 2) == [
+        datetime(2024, 1, 10, 9, 0),
+        datetime(2024, 1, 22, 9, 0),
+    ]
+    assert expander.next(datetime(2024, 1, 22, 9, 0), 2) == [
+        datetime(2024, 1, 29, 9, 0),
+        datetime(2024, 2, 5, 9, 0),
+    ]
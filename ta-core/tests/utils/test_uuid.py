@@ -0,0 +1,28 @@
+import pytest
+
+from ta_core.utils.uuid import (
+    MAX_EMBEDDABLE_SHARD_ID,
+    bin_to_uuid,
+    extract_shard_id,
+    generate_uuid,
+    uuid_to_bin,
+)
+
+
+@pytest.mark.parametrize("shard_id", [0, 1, 7, MAX_EMBEDDABLE_SHARD_ID])
+def test_generate_uuid_with_shard_id(shard_id: int) -> None:
+    u = generate_uuid(shard_id)
+    assert u.version == 7
+    assert extract_shard_id(u) == shard_id
+    assert extract_shard_id(bin_to_uuid(uuid_to_bin(u))) == shard_id
+
+
+def test_generate_uuid_keeps_time_order() -> None:
+    uuids = [generate_uuid(i % 2) for i in range(100)]
+    assert [u.time for u in uuids] == sorted(u.time for u in uuids)
+
+
+@pytest.mark.parametrize("shard_id", [-1, MAX_EMBEDDABLE_SHARD_ID + 1])
+def test_generate_uuid_with_invalid_shard_id(shard_id: int) -> None:
+    with pytest.raises(ValueError):
+        generate_uuid(shard_id)
@@ -0,0 +1,155 @@
+import random
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from ta_core.domain.entities.account import UserAccount as UserAccountEntity
+from ta_core.domain.entities.event import Event as EventEntity
+from ta_core.domain.entities.event import (
+    EventAttendanceActionLog as EventAttendanceActionLogEntity,
+)
+from ta_core.domain.entities.event import Recurrence as RecurrenceEntity
+from ta_core.domain.entities.event import RecurrenceRule as RecurrenceRuleEntity
+from ta_core.features.account import Gender
+from ta_core.features.event import AttendanceAction, Frequency, Weekday
+from ta_core.utils.uuid import generate_uuid
+
+from ta_ml.formatters.attendance import get_formatted_attendance_data
+
+USER_COUNTS = (100, 1_000, 10_000)
+EVENT_COUNT = 100
+EVENTS_PER_USER = 2
+HISTORY_DAYS = 45
+ATTEND_RATE = 0.7
+
+
+def _build_events(today: datetime) -> list[EventEntity]:
+    events = []
+    for _ in range(EVENT_COUNT):
+        start = today - timedelta(days=HISTORY_DAYS) + timedelta(hours=9)
+        rrule = RecurrenceRuleEntity(
+            entity_id=generate_uuid(),
+            user_id=0,
+            freq=Frequency.DAILY,
+            until=None,
+            count=None,
+            interval=1,
+            bysecond=None,
+            byminute=None,
+            byhour=None,
+            byday=None,
+            bymonthday=None,
+            byyearday=None,
+            byweekno=None,
+            bymonth=None,
+            bysetpos=None,
+            wkst=Weekday.MO,
+        )
+        recurrence = RecurrenceEntity(
+            entity_id=generate_uuid(),
+            user_id=0,
+            rrule_id=rrule.id,
+            rrule=rrule,
+            rdate=[],
+            exdate=[],
+        )
+        events.append(
+            EventEntity(
+                entity_id=generate_uuid(),
+                user_id=0,
+                summary="summary",
+                location=None,
+                start=start,
+                end=start + timedelta(hours=8),
+                is_all_day=False,
+                recurrence_id=recurrence.id,
+                timezone="UTC",
+                recurrence=recurrence,
+            )
+        )
+    return events
+
+
+def _build_data(user_count: int, events: list[EventEntity]) -> tuple[
+    tuple[EventAttendanceActionLogEntity, ...],
+    tuple[EventAttendanceActionLogEntity, ...],
+    tuple[UserAccountEntity, ...],
+]:
+    users = []
+    earliest_attends = []
+    latest_leaves = []
+    for user_id in range(1, user_count + 1):
+        users.append(
+            UserAccountEntity(
+                entity_id=generate_uuid(),
+                user_id=user_id,
+                username=f"username{user_id}",
+                hashed_password="hashed_password",
+                refresh_token=None,
+                nickname=None,
+                birth_date=datetime(1990, 1, 1, tzinfo=ZoneInfo("UTC")),
+                gender=Gender.MALE,
+                email=f"email{user_id}@example.com",
+                email_verified=True,
+                followee_ids=[],
+                followees=[],
+                follower_ids=[],
+                followers=[],
+            )
+        )
+        for event in random.sample(events, EVENTS_PER_USER):
+            for i in range(HISTORY_DAYS):
+                if random.random() > ATTEND_RATE:
+                    continue
+                start = event.start + timedelta(days=i)
+                attended_at = start + timedelta(minutes=random.uniform(0, 60))
+                earliest_attends.append(
+                    EventAttendanceActionLogEntity(
+                        entity_id=generate_uuid(),
+                        user_id=user_id,
+                        event_id=event.id,
+                        start=start,
+                        action=AttendanceAction.ATTEND,
+                        acted_at=attended_at,
+                    )
+                )
+                latest_leaves.append(
+                    EventAttendanceActionLogEntity(
+                        entity_id=generate_uuid(),
+                        user_id=user_id,
+                        event_id=event.id,
+                        start=start,
+                        action=AttendanceAction.LEAVE,
+                        acted_at=attended_at + timedelta(hours=random.uniform(1, 7)),
+                    )
+                )
+    return tuple(earliest_attends), tuple(latest_leaves), tuple(users)
+
+
+def main() -> None:
+    random.seed(0)
+    today = datetime.now(ZoneInfo("UTC")).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    events = _build_events(today)
+    print(
+        f"events={EVENT_COUNT} events/user={EVENTS_PER_USER} "
+        f"history={HISTORY_DAYS}days attend_rate={ATTEND_RATE}"
+    )
+    print(f"{'users':>6} {'series':>7} {'logs':>8} {'format[s]':>10}")
+    for user_count in USER_COUNTS:
+        earliest_attends, latest_leaves, users = _build_data(user_count, events)
+        started_at = time.perf_counter()
+        data = get_formatted_attendance_data(
+            earliest_attends, latest_leaves, tuple(events), users
+        )
+        elapsed = time.perf_counter() - started_at
+        series_count = data.series_count
+        print(
+            f"{user_count:>6} {series_count:>7} {len(earliest_attends):>8} "
+            f"{elapsed:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
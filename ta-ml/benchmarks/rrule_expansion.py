@@ -0,0 +1,101 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from dateutil import rrule as dateutil_rrule
+from ta_core.features.event import Frequency, RecurrenceRule, Weekday
+from ta_core.utils.rrule import RRuleExpander
+
+from ta_ml.utils.rrule import expand_simple_rrule
+
+YEARS = 10
+REPEATS = 20
+WINDOW_COUNT = 8
+
+DTSTART = datetime(2020, 1, 1, 9, 0)
+# 開催時刻と重ならないので、dateutil の inc=True と [DTSTART, END) が一致する
+END = datetime(2020 + YEARS, 1, 1)
+
+
+def _build_rule(byday: tuple[tuple[int, Weekday], ...] | None) -> RecurrenceRule:
+    return RecurrenceRule(
+        freq=Frequency.DAILY,
+        until=None,
+        count=None,
+        interval=1,
+        bysecond=None,
+        byminute=None,
+        byhour=None,
+        byday=byday,
+        bymonthday=None,
+        byyearday=None,
+        byweekno=None,
+        bymonth=None,
+        bysetpos=None,
+        wkst=Weekday.MO,
+    )
+
+
+def _measure(func: Callable[[], object]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - started_at) / REPEATS * 1000
+
+
+def main() -> None:
+    weekdays = (Weekday.MO, Weekday.WE, Weekday.FR)
+    cases = (
+        ("daily", _build_rule(None), None),
+        (
+            "daily MO,WE,FR",
+            _build_rule(tuple((0, weekday) for weekday in weekdays)),
+            (dateutil_rrule.MO, dateutil_rrule.WE, dateutil_rrule.FR),
+        ),
+    )
+    print(f"dtstart={DTSTART} years={YEARS} repeats={REPEATS} tail={WINDOW_COUNT}days")
+    print(
+        f"{'rule':>15} {'occurrences':>11} {'dateutil[ms]':>12} "
+        f"{'expander[ms]':>12} {'numpy[ms]':>10} "
+        f"{'dateutil tail[ms]':>18} {'expander tail[ms]':>18}"
+    )
+    for name, rule, byweekday in cases:
+        expected = dateutil_rrule.rrule(
+            dateutil_rrule.DAILY, dtstart=DTSTART, byweekday=byweekday
+        )
+        expander = RRuleExpander(rule, DTSTART)
+        occurrences = expander.between(DTSTART, END)
+        assert occurrences == expected.between(DTSTART, END, inc=True)
+
+        dateutil_elapsed = _measure(
+            lambda: dateutil_rrule.rrule(
+                dateutil_rrule.DAILY, dtstart=DTSTART, byweekday=byweekday
+            ).between(DTSTART, END, inc=True)
+        )
+        expander_elapsed = _measure(
+            lambda: RRuleExpander(rule, DTSTART).between(DTSTART, END)
+        )
+        numpy_elapsed = (
+            _measure(lambda: expand_simple_rrule(expander, DTSTART, END))
+            if expander.is_simple
+            else float("nan")
+        )
+        # 10 年後の数回分だけを求める場合、dateutil は DTSTART から数え上げる
+        window_start = END - timedelta(days=WINDOW_COUNT)
+        dateutil_window_elapsed = _measure(
+            lambda: dateutil_rrule.rrule(
+                dateutil_rrule.DAILY, dtstart=DTSTART, byweekday=byweekday
+            ).between(window_start, END, inc=True)
+        )
+        expander_window_elapsed = _measure(
+            lambda: RRuleExpander(rule, DTSTART).between(window_start, END)
+        )
+        print(
+            f"{name:>15} {len(occurrences):>11} {dateutil_elapsed:>12.2f} "
+            f"{expander_elapsed:>12.2f} {numpy_elapsed:>10.2f} "
+            f"{dateutil_window_elapsed:>18.2f} {expander_window_elapsed:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
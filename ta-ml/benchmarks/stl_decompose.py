@@ -0,0 +1,49 @@
+import time
+
+import numpy as np
+
+from ta_ml.constants import timesfm
+from ta_ml.utils.stl import (
+    shutdown_stl_executor,
+    stl_decompose,
+    stl_decompose_batch,
+)
+
+SERIES_COUNTS = (1_000, 10_000, 50_000)
+PERIODS = (4, 7, 12, 24)
+
+
+def _build_data(
+    series_count: int, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    values = rng.normal(size=(series_count, timesfm.CONTEXT_LEN))
+    offsets = rng.integers(0, timesfm.CONTEXT_LEN // 2, size=series_count)
+    for i, offset in enumerate(offsets):
+        values[i, :offset] = np.nan
+    periods = rng.choice(PERIODS, size=series_count)
+    return values, offsets, periods
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    # プロセスプールの起動時間を計測に含めない
+    stl_decompose_batch(*_build_data(1_000, rng))
+    print(f"{'series':>7} {'serial[s]':>10} {'batch[s]':>10}")
+    for series_count in SERIES_COUNTS:
+        values, offsets, periods = _build_data(series_count, rng)
+
+        started_at = time.perf_counter()
+        for i in range(series_count):
+            stl_decompose(values[i, offsets[i] :], period=int(periods[i]))
+        serial_elapsed = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        stl_decompose_batch(values, offsets, periods)
+        batch_elapsed = time.perf_counter() - started_at
+
+        print(f"{series_count:>7} {serial_elapsed:>10.2f} {batch_elapsed:>10.2f}")
+    shutdown_stl_executor()
+
+
+if __name__ == "__main__":
+    main()
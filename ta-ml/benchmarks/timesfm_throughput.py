@@ -0,0 +1,75 @@
+import time
+
+import numpy as np
+
+from ta_ml.api.timesfm import timesfm_registry
+from ta_ml.constants import timesfm as timesfm_constants
+
+SERIES_COUNTS = (1, 8, 32, 128, 512)
+REPEAT = 3
+
+
+def _build_inputs(
+    series_count: int, rng: np.random.Generator
+) -> tuple[list[np.ndarray], dict[str, list[list[int]]]]:
+    context_len = timesfm_constants.CONTEXT_LEN
+    total_len = context_len + timesfm_constants.HORIZON_LEN
+    inputs = [rng.normal(0.0, 1.0, context_len) for _ in range(series_count)]
+    day_of_week = [
+        [(offset + i) % 7 for i in range(total_len)]
+        for offset in rng.integers(0, 7, series_count)
+    ]
+    dynamic_numerical_covariates = {
+        "day_of_week": day_of_week,
+        "is_weekend": [[1 if d >= 5 else 0 for d in days] for days in day_of_week],
+    }
+    return inputs, dynamic_numerical_covariates
+
+
+def main() -> None:
+    started_at = time.perf_counter()
+    tfm = timesfm_registry.get()
+    print(
+        f"backend={timesfm_constants.BACKEND} "
+        f"intra_op_threads={timesfm_constants.INTRA_OP_THREADS} "
+        f"inter_op_threads={timesfm_constants.INTER_OP_THREADS} "
+        f"per_core_batch_size={timesfm_constants.PER_CORE_BATCH_SIZE} "
+        f"context_len={timesfm_constants.CONTEXT_LEN} "
+        f"horizon_len={timesfm_constants.HORIZON_LEN}"
+    )
+    print(f"model load: {time.perf_counter() - started_at:.2f}s")
+
+    rng = np.random.default_rng(0)
+    print(f"{'series':>6} {'forecast[series/s]':>19} {'with covariates[series/s]':>26}")
+    for series_count in SERIES_COUNTS:
+        inputs, dynamic_numerical_covariates = _build_inputs(series_count, rng)
+        # 1 回目は JIT などの初期化を含むため計測から除外する
+        tfm.forecast(inputs, freq=[0] * series_count)
+
+        started_at = time.perf_counter()
+        for _ in range(REPEAT):
+            tfm.forecast(inputs, freq=[0] * series_count)
+        forecast_elapsed = (time.perf_counter() - started_at) / REPEAT
+
+        started_at = time.perf_counter()
+        for _ in range(REPEAT):
+            tfm.forecast_with_covariates(
+                inputs=inputs,
+                dynamic_numerical_covariates=dynamic_numerical_covariates,
+                dynamic_categorical_covariates={},
+                static_numerical_covariates={},
+                static_categorical_covariates={},
+                xreg_mode="xreg + timesfm",
+                normalize_xreg_target_per_input=False,
+                force_on_cpu=timesfm_constants.BACKEND == "cpu",
+            )
+        covariates_elapsed = (time.perf_counter() - started_at) / REPEAT
+
+        print(
+            f"{series_count:>6} {series_count / forecast_elapsed:>19.1f} "
+            f"{series_count / covariates_elapsed:>26.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,45 @@
+import threading
+
 import timesfm
+import torch
 from ta_core.constants.constants import CHECKPOINT_PATH
 
 from ta_ml.constants import timesfm as timesfm_constants
 
+TimesFmKey = tuple[str, int, int]
+
+_inter_op_threads_configured = False
+
+
+def configure_cpu_threads(
+    intra_op_threads: int = timesfm_constants.INTRA_OP_THREADS,
+    inter_op_threads: int = timesfm_constants.INTER_OP_THREADS,
+) -> None:
+    global _inter_op_threads_configured
+    if intra_op_threads > 0:
+        torch.set_num_threads(intra_op_threads)
+    # inter-op のスレッド数は並列処理が始まる前に 1 度しか設定できない
+    if inter_op_threads > 0 and not _inter_op_threads_configured:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError:
+            pass
+        _inter_op_threads_configured = True
 
-def initialize_timesfm() -> timesfm.TimesFm:
+
+def initialize_timesfm(
+    backend: str = timesfm_constants.BACKEND,
+    context_len: int = timesfm_constants.CONTEXT_LEN,
+    horizon_len: int = timesfm_constants.HORIZON_LEN,
+) -> timesfm.TimesFm:
+    if backend == "cpu":
+        configure_cpu_threads()
     return timesfm.TimesFm(
         hparams=timesfm.TimesFmHparams(
-            backend=timesfm_constants.BACKEND,
-            context_len=timesfm_constants.CONTEXT_LEN,
-            horizon_len=timesfm_constants.HORIZON_LEN,
+            backend=backend,
+            per_core_batch_size=timesfm_constants.PER_CORE_BATCH_SIZE,
+            context_len=context_len,
+            horizon_len=horizon_len,
             num_layers=50,  # Usage に書いてあった値をそのまま使っているだけで特に意味はない
         ),
         checkpoint=timesfm.TimesFmCheckpoint(
@@ -17,3 +47,54 @@ def initialize_timesfm() -> timesfm.TimesFm:
             huggingface_repo_id=timesfm_constants.CHECKPOINT_REPO_ID,
         ),
     )
+
+
+class TimesFmRegistry:
+    """プロセス内で TimesFM のモデルを hparams ごとに 1 度だけ読み込んで使い回す"""
+
+    def __init__(self) -> None:
+        self._models: dict[TimesFmKey, timesfm.TimesFm] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        backend: str = timesfm_constants.BACKEND,
+        context_len: int = timesfm_constants.CONTEXT_LEN,
+        horizon_len: int = timesfm_constants.HORIZON_LEN,
+    ) -> timesfm.TimesFm:
+        key = (backend, context_len, horizon_len)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            # 待っている間に他のスレッドが読み込んでいる可能性がある
+            model = self._models.get(key)
+            if model is None:
+                model = initialize_timesfm(backend, context_len, horizon_len)
+                self._models[key] = model
+            return model
+
+    def unload(self, key: TimesFmKey | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._models.clear()
+            else:
+                self._models.pop(key, None)
+
+    def reload(
+        self,
+        backend: str = timesfm_constants.BACKEND,
+        context_len: int = timesfm_constants.CONTEXT_LEN,
+        horizon_len: int = timesfm_constants.HORIZON_LEN,
+    ) -> timesfm.TimesFm:
+        # チェックポイントを差し替えた後に呼び出す
+        model = initialize_timesfm(backend, context_len, horizon_len)
+        with self._lock:
+            self._models[(backend, context_len, horizon_len)] = model
+        return model
+
+    def loaded_keys(self) -> tuple[TimesFmKey, ...]:
+        return tuple(self._models.keys())
+
+
+timesfm_registry = TimesFmRegistry()
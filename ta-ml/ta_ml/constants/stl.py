@@ -0,0 +1,12 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 0 の場合は CPU のコア数だけワーカーを立てる、1 の場合はプロセスプールを使わない
+MAX_WORKERS = int(os.getenv("STL_MAX_WORKERS", "0"))
+# 1 つのワーカーにまとめて渡す系列の数
+CHUNK_SIZE = int(os.getenv("STL_CHUNK_SIZE", "256"))
+# これより系列が少ない場合はプロセス間通信のほうが高くつくのでその場で分解する
+PARALLEL_THRESHOLD = int(os.getenv("STL_PARALLEL_THRESHOLD", "512"))
@@ -1,5 +1,15 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
 CHECKPOINT_REPO_ID = "google/timesfm-2.0-500m-pytorch"
-BACKEND = "gpu"
+BACKEND = os.getenv("TIMESFM_BACKEND", "gpu")
+# 0 の場合は torch の既定値を使う
+INTRA_OP_THREADS = int(os.getenv("TIMESFM_INTRA_OP_THREADS", "0"))
+INTER_OP_THREADS = int(os.getenv("TIMESFM_INTER_OP_THREADS", "0"))
+PER_CORE_BATCH_SIZE = int(os.getenv("TIMESFM_PER_CORE_BATCH_SIZE", "32"))
 CONTEXT_LEN = 32
 HORIZON_LEN = 8
 FORECASTABLE_THRESHOLD = 1
@@ -1,7 +1,8 @@
 import time
 from collections import defaultdict
-from datetime import datetime
+from typing import Iterable
 
+import numpy as np
 from ta_core.domain.entities.account import UserAccount as UserAccountEntity
 from ta_core.domain.entities.event import Event as EventEntity
 from ta_core.domain.entities.event import (
@@ -9,89 +10,76 @@ from ta_core.domain.entities.event import (
 )
 from ta_core.dtos.event import AttendanceTimeForecast as AttendanceTimeForecastDto
 from ta_core.dtos.event import ForecastAttendanceTimeResponse
-from ta_core.features.event import Frequency
 from ta_core.utils.uuid import uuid_to_str
 
-from ta_ml.api.timesfm import initialize_timesfm
+from ta_ml.api.timesfm import timesfm_registry
+from ta_ml.constants import timesfm as timesfm_constants
 from ta_ml.formatters.attendance import (
+    FormattedAttendanceData,
     denormalize_acted_at,
     denormalize_duration,
     get_formatted_attendance_data,
-    get_next_event_start,
+    get_future_event_starts,
 )
-from ta_ml.utils.stl import stl_decompose
-
-
-def generate_future_event_starts(
-    current: datetime, freq: Frequency, count: int
-) -> list[datetime]:
-    future_event_starts = []
-    for _ in range(count):
-        current = get_next_event_start(current, freq)
-        future_event_starts.append(current)
-    return future_event_starts
+from ta_ml.utils.stl import stl_decompose_batch
 
 
 def forecast_attendance_time(
-    earliest_attend_data: tuple[EventAttendanceActionLogEntity, ...],
-    latest_leave_data: tuple[EventAttendanceActionLogEntity, ...],
+    earliest_attend_data: Iterable[EventAttendanceActionLogEntity],
+    latest_leave_data: Iterable[EventAttendanceActionLogEntity],
     event_data: tuple[EventEntity, ...],
-    user_data: tuple[UserAccountEntity, ...],
+    user_data: Iterable[UserAccountEntity],
 ) -> ForecastAttendanceTimeResponse:
-    tfm = initialize_timesfm()
-
-    df, date_features_dict = get_formatted_attendance_data(
+    data = get_formatted_attendance_data(
         earliest_attend_data, latest_leave_data, event_data, user_data
     )
+    return forecast_formatted_attendance_time(data, event_data)
+
+
+def forecast_formatted_attendance_time(
+    data: FormattedAttendanceData, event_data: tuple[EventEntity, ...]
+) -> ForecastAttendanceTimeResponse:
+    if data.series_count == 0:
+        return ForecastAttendanceTimeResponse(
+            attendance_time_forecasts={}, error_codes=()
+        )
+
+    tfm = timesfm_registry.get()
+
+    start_time = time.time()
 
-    acted_at_trend = []
-    acted_at_seasonal = []
-    acted_at_residual = []
-    duration_trend = []
-    duration_seasonal = []
-    duration_residual = []
-    age = []
-    gender = []
+    # 到着時刻と滞在時間をまとめて分解し、残差を除いた値を入力にする
+    series_count = data.series_count
+    trend, seasonal, _ = stl_decompose_batch(
+        np.concatenate([data.acted_at, data.duration]),
+        np.tile(data.context_offsets, 2),
+        np.tile(data.stl_periods, 2),
+    )
+    inputs = trend + seasonal
+    acted_at_inputs = []
+    duration_inputs = []
     day_of_week = []
+    is_weekend = []
     year = []
     month = []
     day = []
-    user_ids = []
-    event_ids = []
-
-    start_time = time.time()
-
-    for (user_id, event_id), group in df.groupby(["user_id", "event_id"]):
-        acted_at_t, acted_at_s, acted_at_r = stl_decompose(
-            group["acted_at"], period=group["stl_period"].iat[0]
-        )
-        acted_at_trend.append(acted_at_t.values)
-        acted_at_seasonal.append(acted_at_s.values)
-        acted_at_residual.append(acted_at_r.values)
-        duration_t, duration_s, duration_r = stl_decompose(
-            group["duration"], period=group["stl_period"].iat[0]
-        )
-        duration_trend.append(duration_t.values)
-        duration_seasonal.append(duration_s.values)
-        duration_residual.append(duration_r.values)
-        age.append(group["age"].iat[0])
-        gender.append(group["gender"].iat[0])
-        date_features = date_features_dict[(user_id, event_id)]
-        day_of_week.append(date_features["day_of_week"].values)
-        year.append(date_features["year"].values)
-        month.append(date_features["month"].values)
-        day.append(date_features["day"].values)
-        user_ids.append(user_id)
-        event_ids.append(event_id)
-    acted_at_inputs = [t + s for t, s in zip(acted_at_trend, acted_at_seasonal)]
-    duration_inputs = [t + s for t, s in zip(duration_trend, duration_seasonal)]
+    for i in range(series_count):
+        offset = data.context_offset(i)
+        acted_at_inputs.append(inputs[i, offset:])
+        duration_inputs.append(inputs[series_count + i, offset:])
+        day_of_week.append(data.day_of_week[i, offset:])
+        is_weekend.append((data.day_of_week[i, offset:] >= 5).astype(np.int64))
+        year.append(data.year[i, offset:])
+        month.append(data.month[i, offset:])
+        day.append(data.day[i, offset:])
+    user_ids = data.user_ids.tolist()
+    event_ids = list(data.event_ids)
+    age = data.ages.tolist()
+    gender = data.genders.tolist()
 
     dynamic_numerical_covariates = {
         "day_of_week": day_of_week,
-        "is_weekend": [
-            [1 if day >= 5 else 0 for day in day_of_week_series]
-            for day_of_week_series in day_of_week
-        ],
+        "is_weekend": is_weekend,
         "year": year,
         "month": month,
         "day": day,
@@ -111,6 +99,7 @@ def forecast_attendance_time(
         },
         xreg_mode="xreg + timesfm",
         normalize_xreg_target_per_input=False,
+        force_on_cpu=timesfm_constants.BACKEND == "cpu",
     )
 
     duration_forecast, _ = tfm.forecast_with_covariates(
@@ -127,22 +116,25 @@ def forecast_attendance_time(
         },
         xreg_mode="xreg + timesfm",
         normalize_xreg_target_per_input=False,
+        force_on_cpu=timesfm_constants.BACKEND == "cpu",
     )
 
     print(f"Finished forecasting in {time.time() - start_time} seconds")
 
-    latest_starts = {}
-    for (user_id, event_id), group in df.groupby(["user_id", "event_id"]):
-        latest_starts[(user_id, event_id)] = group["start"].max()
-
     event_dict = {
         event.id: {
-            "start": event.start,
-            "end": event.end,
+            "event": event,
             "duration": event.end - event.start,
-            "freq": event.recurrence.rrule.freq,
         }
         for event in event_data
+        if event.recurrence is not None
+    }
+    # 系列の最後の開催回はイベントごとに同じなので、予測する開催回もイベントごとに一度だけ求める
+    future_starts_dict = {
+        event_id: get_future_event_starts(
+            event_dict[event_id]["event"], latest_start, timesfm_constants.HORIZON_LEN
+        )
+        for event_id, latest_start in zip(data.event_ids, data.latest_starts)
     }
 
     attendance_time_forecasts: defaultdict[
@@ -150,11 +142,9 @@ def forecast_attendance_time(
     ] = defaultdict(lambda: defaultdict(list))
     for i, user_id in enumerate(user_ids):
         event_id = event_ids[i]
-        latest_start = latest_starts[(user_id, event_id)]
         event_info = event_dict[event_id]
-        future_starts = generate_future_event_starts(
-            latest_start, event_info["freq"], len(acted_at_forecast[i])
-        )
+        # 繰り返しが終わる場合は開催回の数だけ予測を使う
+        future_starts = future_starts_dict[event_id][: len(acted_at_forecast[i])]
         forecasts = [
             AttendanceTimeForecastDto(
                 start=start,
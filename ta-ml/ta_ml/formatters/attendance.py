@@ -1,45 +1,82 @@
-from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Iterable
 from zoneinfo import ZoneInfo
 
 import numpy as np
-import pandas as pd
+import numpy.typing as npt
 from ta_core.domain.entities.account import UserAccount as UserAccountEntity
 from ta_core.domain.entities.event import Event as EventEntity
 from ta_core.domain.entities.event import (
     EventAttendanceActionLog as EventAttendanceActionLogEntity,
 )
 from ta_core.features.account import Gender
-from ta_core.features.event import AttendanceAction, Frequency
-from ta_core.utils.datetime import apply_timezone
-from ta_core.utils.uuid import UUID, generate_uuid
+from ta_core.features.event import Frequency
+from ta_core.utils.datetime import apply_timezone, to_utc
+from ta_core.utils.rrule import APPROXIMATE_FREQUENCY_STEPS
+from ta_core.utils.uuid import UUID
 
 from ta_ml.constants import timesfm
+from ta_ml.utils.rrule import get_simple_event_starts
 
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
-def get_next_event_start(current: datetime, freq: Frequency) -> datetime:
-    if freq == Frequency.SECONDLY:
-        return current + timedelta(seconds=1)
-    elif freq == Frequency.MINUTELY:
-        return current + timedelta(minutes=1)
-    elif freq == Frequency.HOURLY:
-        return current + timedelta(hours=1)
-    elif freq == Frequency.DAILY:
-        return current + timedelta(days=1)
-    elif freq == Frequency.WEEKLY:
-        return current + timedelta(weeks=1)
-    elif freq == Frequency.MONTHLY:
-        year = current.year
-        month = current.month + 1
-        if month > 12:
-            year += 1
-            month = 1
-        return current.replace(year=year, month=month)
-    elif freq == Frequency.YEARLY:
-        return current.replace(year=current.year + 1)
-    else:
-        raise ValueError(f"Unsupported frequency: {freq}")
+
+def get_recent_event_starts(
+    event: EventEntity, now: datetime, count: int
+) -> list[datetime]:
+    """now までに開催されたイベントの開始時刻のうち、直近 count 件を返す
+
+    繰り返しが単純な場合は NumPy でまとめて求め、それ以外は繰り返しルールを展開する
+
+    Args:
+        event: イベント（start にタイムゾーンがない場合は UTC とみなす）
+        now: 現在時刻
+        count: 返す開始時刻の最大件数
+
+    Returns:
+        古い順に並んだ開始時刻のリスト
+    """
+    if count <= 0:
+        return []
+    if event.recurrence is not None:
+        rrule = event.recurrence.rrule
+        after = now - APPROXIMATE_FREQUENCY_STEPS[rrule.freq] * rrule.interval * count
+        event_starts = get_simple_event_starts(event, after, now + _ONE_MICROSECOND)
+        # 存在しない日を飛ばして count 件に満たない場合は遡り直す
+        if event_starts is not None and (
+            len(event_starts) >= count or to_utc(event.start) >= to_utc(after)
+        ):
+            return event_starts[-count:]
+    return event.get_recent_starts(now, count)
+
+
+def get_future_event_starts(
+    event: EventEntity, after: datetime, count: int
+) -> list[datetime]:
+    """after より後に開催されるイベントの開始時刻を count 件返す
+
+    繰り返しが終わる場合は count 件より少なくなる
+
+    Args:
+        event: イベント（start にタイムゾーンがない場合は UTC とみなす）
+        after: この時刻より後の開始時刻を返す
+        count: 返す開始時刻の最大件数
+
+    Returns:
+        古い順に並んだ開始時刻のリスト
+    """
+    if count <= 0:
+        return []
+    if event.recurrence is not None:
+        rrule = event.recurrence.rrule
+        before = after + APPROXIMATE_FREQUENCY_STEPS[rrule.freq] * rrule.interval * (
+            count + 1
+        )
+        event_starts = get_simple_event_starts(event, after + _ONE_MICROSECOND, before)
+        if event_starts is not None and len(event_starts) >= count:
+            return event_starts[:count]
+    return event.get_next_starts(after, count)
 
 
 def freq_to_stl_period(freq: Frequency) -> int:
@@ -70,172 +107,242 @@ def normalize_acted_at(
     )
 
 
-def get_formatted_attendance_data(
-    earliest_attend_data: tuple[EventAttendanceActionLogEntity, ...],
-    latest_leave_data: tuple[EventAttendanceActionLogEntity, ...],
-    event_data: tuple[EventEntity, ...],
-    user_data: tuple[UserAccountEntity, ...],
-) -> tuple[pd.DataFrame, dict[tuple[int, UUID], pd.DataFrame]]:
-    user_event_pairs = {
-        (attend.user_id, attend.event_id) for attend in earliest_attend_data
-    }
-    event_dict = {}
-    for event in event_data:
-        event_dict[event.id] = {
-            "start": event.start,
-            "end": event.end,
-            "duration": event.end - event.start,
-            "freq": event.recurrence.rrule.freq,
-            "stl_period": freq_to_stl_period(event.recurrence.rrule.freq),
-        }
-    user_dict = {
-        user.user_id: {
-            "age": (
-                datetime.now(ZoneInfo("UTC")) - apply_timezone(user.birth_date, "UTC")
-            ).days
-            // 365,
-            "gender": 0 if user.gender == Gender.MALE else 1,
-        }
-        for user in user_data
-    }
-    latest_leave_dict = {
-        (leave.user_id, leave.event_id, leave.start): leave
-        for leave in latest_leave_data
-    }
-    earliest_event_starts = {}
-    for attend in earliest_attend_data:
-        key = (attend.user_id, attend.event_id)
-        if key not in earliest_event_starts:
-            earliest_event_starts[key] = attend.start
-        else:
-            earliest_event_starts[key] = min(earliest_event_starts[key], attend.start)
-    now = datetime.now(ZoneInfo("UTC"))
-    earliest_attend_data_considering_absence = []
-    for user_id, event_id in user_event_pairs:
-        current = earliest_event_starts[(user_id, event_id)]
-        freq = event_dict[event_id]["freq"]
-        while current.replace(tzinfo=ZoneInfo("UTC")) <= now:
-            existing_attend = next(
-                (
-                    attend
-                    for attend in earliest_attend_data
-                    if attend.user_id == user_id
-                    and attend.event_id == event_id
-                    and attend.start == current
-                ),
-                None,
+@dataclass(frozen=True)
+class FormattedAttendanceData:
+    """(user_id, event_id) ごとの系列を 1 行とする行列形式の特徴量
+
+    系列の長さは系列ごとに異なるため右詰めで格納し、左側の余りは acted_at / duration は
+    NaN、日付特徴量は 0 で埋める。行 i の有効な部分は lengths[i] から求められる
+    """
+
+    user_ids: npt.NDArray[np.int64]
+    event_ids: tuple[UUID, ...]
+    stl_periods: npt.NDArray[np.int64]
+    ages: npt.NDArray[np.int64]
+    genders: npt.NDArray[np.int64]
+    lengths: npt.NDArray[np.int64]
+    latest_starts: tuple[datetime, ...]
+    # (n_series, CONTEXT_LEN)
+    acted_at: npt.NDArray[np.float64]
+    duration: npt.NDArray[np.float64]
+    # (n_series, CONTEXT_LEN + HORIZON_LEN)
+    day_of_week: npt.NDArray[np.int64]
+    year: npt.NDArray[np.int64]
+    month: npt.NDArray[np.int64]
+    day: npt.NDArray[np.int64]
+
+    @property
+    def series_count(self) -> int:
+        return len(self.event_ids)
+
+    @property
+    def context_offsets(self) -> npt.NDArray[np.int64]:
+        return timesfm.CONTEXT_LEN - self.lengths
+
+    def context_offset(self, i: int) -> int:
+        return timesfm.CONTEXT_LEN - int(self.lengths[i])
+
+
+class AttendanceLogAccumulator:
+    """出席・退出ログをバッチ単位で受け取り、予測に必要な分だけを保持する
+
+    ログ全体をメモリに載せずに済むよう、イベントごとに直近 CONTEXT_LEN 回より前の開催回の
+    acted_at は保持せず、(user_id, event_id) ごとの最初の開始時刻だけを残す。
+    繰り返しのないイベントとそのログは予測の対象にしない
+
+    Args:
+        event_data: 予測対象のイベント（繰り返しルールを含む）
+        now: 現在時刻（省略時は UTC の現在時刻）
+    """
+
+    def __init__(
+        self, event_data: Iterable[EventEntity], now: datetime | None = None
+    ) -> None:
+        self._now = now if now is not None else datetime.now(ZoneInfo("UTC"))
+        self._event_dict = {}
+        # 開催回はユーザーによらないので、直近 CONTEXT_LEN 回と続く HORIZON_LEN 回を
+        # イベントごとに一度だけ求めておく
+        self._recent_starts: dict[UUID, list[datetime]] = {}
+        self._future_starts: dict[UUID, list[datetime]] = {}
+        for event in event_data:
+            if event.recurrence is None:
+                continue
+            freq = event.recurrence.rrule.freq
+            self._event_dict[event.id] = {
+                "duration": event.end - event.start,
+                "freq": freq,
+                "stl_period": freq_to_stl_period(freq),
+            }
+            event_starts = get_recent_event_starts(
+                event, self._now, timesfm.CONTEXT_LEN
             )
-            if existing_attend:
-                earliest_attend_data_considering_absence.append(existing_attend)
+            self._recent_starts[event.id] = event_starts
+            self._future_starts[event.id] = (
+                get_future_event_starts(event, event_starts[-1], timesfm.HORIZON_LEN)
+                if event_starts
+                else []
+            )
+        self._attended_at_dict: dict[tuple[int, UUID, datetime], datetime] = {}
+        self._left_at_dict: dict[tuple[int, UUID, datetime], datetime] = {}
+        self._earliest_event_starts: dict[tuple[int, UUID], datetime] = {}
+
+    def _is_in_context(self, log: EventAttendanceActionLogEntity) -> bool:
+        event_starts = self._recent_starts.get(log.event_id)
+        if not event_starts:
+            return False
+        return log.start >= event_starts[0]
+
+    def add_earliest_attends(
+        self, earliest_attend_data: Iterable[EventAttendanceActionLogEntity]
+    ) -> None:
+        for attend in earliest_attend_data:
+            if attend.event_id not in self._event_dict:
+                continue
+            key = (attend.user_id, attend.event_id)
+            if key not in self._earliest_event_starts:
+                self._earliest_event_starts[key] = attend.start
             else:
-                earliest_attend_data_considering_absence.append(
-                    EventAttendanceActionLogEntity(
-                        entity_id=generate_uuid(),
-                        user_id=user_id,
-                        event_id=event_id,
-                        start=current,
-                        action=AttendanceAction.ATTEND,
-                        acted_at=current
-                        + event_dict[event_id][
-                            "duration"
-                        ],  # 欠席の場合は終了時刻を使用
-                    )
+                self._earliest_event_starts[key] = min(
+                    self._earliest_event_starts[key], attend.start
+                )
+            if self._is_in_context(attend):
+                self._attended_at_dict.setdefault(
+                    (attend.user_id, attend.event_id, attend.start), attend.acted_at
                 )
-            current = get_next_event_start(current, freq)
-
-    data_by_group: defaultdict[tuple[int, UUID], dict[str, list[Any]]] = defaultdict(
-        lambda: {
-            "user_id": [],
-            "age": [],
-            "gender": [],
-            "event_id": [],
-            "stl_period": [],
-            "start": [],
-            "acted_at": [],
-            "duration": [],
+
+    def add_latest_leaves(
+        self, latest_leave_data: Iterable[EventAttendanceActionLogEntity]
+    ) -> None:
+        for leave in latest_leave_data:
+            if self._is_in_context(leave):
+                self._left_at_dict[(leave.user_id, leave.event_id, leave.start)] = (
+                    leave.acted_at
+                )
+
+    def format(self, user_data: Iterable[UserAccountEntity]) -> FormattedAttendanceData:
+        context_len = timesfm.CONTEXT_LEN
+        total_len = timesfm.CONTEXT_LEN + timesfm.HORIZON_LEN
+
+        now = self._now
+        event_dict = self._event_dict
+        attended_at_dict = self._attended_at_dict
+        left_at_dict = self._left_at_dict
+        earliest_event_starts = self._earliest_event_starts
+        user_dict = {
+            user.user_id: {
+                "age": (now - apply_timezone(user.birth_date, "UTC")).days // 365,
+                "gender": 0 if user.gender == Gender.MALE else 1,
+            }
+            for user in user_data
         }
-    )
-    date_features_by_group = defaultdict(list)
-
-    for attend in earliest_attend_data_considering_absence:
-        key = (attend.user_id, attend.event_id)
-        group_data = data_by_group[key]
-        group_data["user_id"].append(attend.user_id)
-        group_data["age"].append(user_dict[attend.user_id]["age"])
-        group_data["gender"].append(user_dict[attend.user_id]["gender"])
-        group_data["event_id"].append(attend.event_id)
-        group_data["stl_period"].append(event_dict[attend.event_id]["stl_period"])
-        group_data["start"].append(attend.start)
-        group_data["acted_at"].append(
-            normalize_acted_at(
-                attend.acted_at, attend.start, event_dict[attend.event_id]["duration"]
-            )
-        )
-        leave = latest_leave_dict.get(
-            (attend.user_id, attend.event_id, attend.start),
-            EventAttendanceActionLogEntity(
-                entity_id=generate_uuid(),
-                user_id=attend.user_id,
-                event_id=attend.event_id,
-                start=attend.start,
-                action=AttendanceAction.LEAVE,
-                acted_at=attend.start
-                + event_dict[attend.event_id][
-                    "duration"
-                ],  # 退出ログがない場合は、イベント終了時刻に退出したものとする
-            ),
-        )
-        # 欠席の場合は duration を 0 に設定
-        if attend.acted_at >= attend.start + event_dict[attend.event_id]["duration"]:
-            group_data["duration"].append(0)
-        else:
-            group_data["duration"].append(
-                (leave.acted_at - attend.acted_at)
-                / event_dict[attend.event_id]["duration"]  # 正規化
-            )
-        date_features_by_group[key].append(
-            [
-                attend.start.weekday(),
-                attend.start.year,
-                attend.start.month,
-                attend.start.day,
+
+        series = []
+        for user_id, event_id in sorted(earliest_event_starts.keys()):
+            # 繰り返しが終わっていれば予測する開催回がない
+            if not self._future_starts[event_id]:
+                continue
+            # 予測に使うのは直近 CONTEXT_LEN 回のうち、最初に出席した回以降だけ
+            earliest_start = earliest_event_starts[(user_id, event_id)]
+            event_starts = [
+                start
+                for start in self._recent_starts[event_id]
+                if start >= earliest_start
             ]
-        )
+            if len(event_starts) < max(timesfm.FORECASTABLE_THRESHOLD, 1):
+                continue
+            series.append((user_id, event_id, event_starts))
+
+        series_count = len(series)
+        acted_at = np.full((series_count, context_len), np.nan)
+        duration = np.full((series_count, context_len), np.nan)
+        date_features = np.zeros((4, series_count, total_len), dtype=np.int64)
+        lengths = np.zeros(series_count, dtype=np.int64)
+
+        for i, (user_id, event_id, event_starts) in enumerate(series):
+            event_duration = event_dict[event_id]["duration"]
+            length = len(event_starts)
+            lengths[i] = length
 
-    filtered_groups = []
-    date_features_dict = {}
-
-    for (user_id, event_id), group_data in data_by_group.items():
-        if len(group_data["acted_at"]) < timesfm.FORECASTABLE_THRESHOLD:
-            continue
-        df_group = pd.DataFrame(group_data).tail(timesfm.CONTEXT_LEN)
-        filtered_groups.append(df_group)
-        current_dates = np.array(date_features_by_group[(user_id, event_id)])[
-            -timesfm.CONTEXT_LEN :
-        ]
-        future_dates = []
-        current = group_data["start"][-1]
-        freq = event_dict[event_id]["freq"]
-        for _ in range(timesfm.HORIZON_LEN):
-            current = get_next_event_start(current, freq)
-            future_dates.append(
+            # 欠席の場合は終了時刻に出席したものとし、退出ログがない場合は終了時刻に退出したものとする
+            attended_offsets = np.array(
                 [
-                    current.weekday(),
-                    current.year,
-                    current.month,
-                    current.day,
+                    (
+                        attended_at_dict.get(
+                            (user_id, event_id, start), start + event_duration
+                        )
+                        - start
+                    ).total_seconds()
+                    for start in event_starts
                 ]
             )
-        all_dates = np.vstack([current_dates, future_dates])
-        date_features_dict[(user_id, event_id)] = pd.DataFrame(
-            all_dates, columns=["day_of_week", "year", "month", "day"]
+            left_offsets = np.array(
+                [
+                    (
+                        left_at_dict.get(
+                            (user_id, event_id, start), start + event_duration
+                        )
+                        - start
+                    ).total_seconds()
+                    for start in event_starts
+                ]
+            )
+            # normalize_acted_at と同じく開始時刻を -1、終了時刻を 1 として正規化
+            half_duration = event_duration.total_seconds() / 2
+            acted_at[i, context_len - length :] = (
+                attended_offsets - half_duration
+            ) / half_duration
+            # 欠席の場合は duration を 0 に設定
+            duration[i, context_len - length :] = np.where(
+                attended_offsets >= event_duration.total_seconds(),
+                0.0,
+                (left_offsets - attended_offsets) / event_duration.total_seconds(),
+            )
+
+            # 繰り返しが HORIZON_LEN 回より前に終わる場合、残りの日付特徴量は 0 のままにする
+            future_starts = self._future_starts[event_id]
+            feature_end = context_len + len(future_starts)
+            date_features[:, i, context_len - length : feature_end] = np.array(
+                [
+                    [start.weekday(), start.year, start.month, start.day]
+                    for start in event_starts + future_starts
+                ]
+            ).T
+
+        return FormattedAttendanceData(
+            user_ids=np.array([user_id for user_id, _, _ in series], dtype=np.int64),
+            event_ids=tuple(event_id for _, event_id, _ in series),
+            stl_periods=np.array(
+                [event_dict[event_id]["stl_period"] for _, event_id, _ in series],
+                dtype=np.int64,
+            ),
+            ages=np.array(
+                [user_dict[user_id]["age"] for user_id, _, _ in series], dtype=np.int64
+            ),
+            genders=np.array(
+                [user_dict[user_id]["gender"] for user_id, _, _ in series],
+                dtype=np.int64,
+            ),
+            lengths=lengths,
+            latest_starts=tuple(event_starts[-1] for _, _, event_starts in series),
+            acted_at=acted_at,
+            duration=duration,
+            day_of_week=date_features[0],
+            year=date_features[1],
+            month=date_features[2],
+            day=date_features[3],
         )
 
-    if not filtered_groups:
-        return pd.DataFrame(), {}
 
-    df = pd.concat(filtered_groups, axis=0, ignore_index=True)
-    return df, date_features_dict
+def get_formatted_attendance_data(
+    earliest_attend_data: Iterable[EventAttendanceActionLogEntity],
+    latest_leave_data: Iterable[EventAttendanceActionLogEntity],
+    event_data: Iterable[EventEntity],
+    user_data: Iterable[UserAccountEntity],
+) -> FormattedAttendanceData:
+    accumulator = AttendanceLogAccumulator(event_data)
+    accumulator.add_earliest_attends(earliest_attend_data)
+    accumulator.add_latest_leaves(latest_leave_data)
+    return accumulator.format(user_data)
 
 
 def denormalize_acted_at(
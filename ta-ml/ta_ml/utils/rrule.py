@@ -0,0 +1,146 @@
+from datetime import datetime, time, timedelta, tzinfo
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import numpy.typing as npt
+from ta_core.domain.entities.event import Event as EventEntity
+from ta_core.utils.datetime import to_utc
+from ta_core.utils.rrule import (
+    FIXED_FREQUENCY_STEPS,
+    MONTHLY_FREQUENCY_STEPS,
+    RRuleExpander,
+)
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_datetime64(value: datetime) -> np.datetime64:
+    return np.datetime64(value.replace(tzinfo=None), "us")
+
+
+def _to_timedelta64(value: timedelta) -> np.timedelta64:
+    return np.timedelta64(value // _ONE_MICROSECOND, "us")
+
+
+def expand_simple_rrule(
+    expander: RRuleExpander, after: datetime, before: datetime
+) -> npt.NDArray[np.datetime64]:
+    """BYxxx を含まない RRULE の開催時刻のうち [after, before) に含まれるものをまとめて求める
+
+    各周期の候補は DTSTART から決まる 1 つだけなので、周期の番号から開催時刻を配列で計算する。
+    MONTHLY / YEARLY で該当する日が存在しない月（31 日や 2 月 29 日）は飛ばす。
+
+    Args:
+        expander: BYxxx を含まない RRULE の展開器
+        after: 範囲の始まり（展開器の壁時計上の naive な datetime）
+        before: 範囲の終わり（展開器の壁時計上の naive な datetime）
+
+    Returns:
+        壁時計上の開催時刻を昇順に並べた datetime64[us] の配列
+    """
+    if not expander.is_simple:
+        raise ValueError("RRULE with BYxxx rule parts cannot be expanded in bulk")
+    start = _to_datetime64(expander.dtstart)
+    lower = _to_datetime64(max(after, expander.dtstart))
+    upper = _to_datetime64(before)
+    if expander.until is not None:
+        upper = min(upper, _to_datetime64(expander.until) + np.timedelta64(1, "us"))
+    count = expander.count
+    if upper <= lower:
+        return np.array([], dtype="datetime64[us]")
+
+    step = FIXED_FREQUENCY_STEPS.get(expander.freq)
+    if step is not None:
+        step64 = _to_timedelta64(step * expander.interval)
+        first = int(-((start - lower) // step64))
+        last = int(-((start - upper) // step64))
+        if count is not None:
+            last = min(last, count)
+        return start + np.arange(first, max(first, last)) * step64
+
+    months_per_period = MONTHLY_FREQUENCY_STEPS[expander.freq] * expander.interval
+    start_month = start.astype("datetime64[M]")
+    last = int((upper.astype("datetime64[M]") - start_month).astype(np.int64))
+    last = last // months_per_period + 1
+    # COUNT は存在しない日を除いて最初の周期から数える
+    first = 0
+    if count is None:
+        first = int((lower.astype("datetime64[M]") - start_month).astype(np.int64))
+        first = first // months_per_period
+    months = start_month + np.arange(first, last) * months_per_period
+    month_starts = months.astype("datetime64[D]")
+    month_lengths = ((months + 1).astype("datetime64[D]") - month_starts).astype(
+        np.int64
+    )
+    dtstart = expander.dtstart
+    time_of_day = _to_timedelta64(dtstart - datetime.combine(dtstart, time()))
+    starts = (
+        month_starts[dtstart.day <= month_lengths]
+        + np.timedelta64(dtstart.day - 1, "D")
+    ).astype("datetime64[us]") + time_of_day
+    if count is not None:
+        starts = starts[:count]
+    return starts[(starts >= lower) & (starts < upper)]
+
+
+def _get_constant_utc_offset(
+    zone: tzinfo, after: datetime, before: datetime
+) -> timedelta | None:
+    # tzdata の UTC オフセットの切り替えは 1 週間以上の間隔で起こるので、週ごとに確かめれば足りる。
+    # 展開は壁時計上で行うので、壁時計の時刻から戻したオフセットも一致する必要がある
+    offset = after.astimezone(zone).utcoffset()
+    if offset is None:
+        return None
+    current = after
+    while True:
+        wall_clock = (current + offset).replace(tzinfo=zone)
+        if (
+            current.astimezone(zone).utcoffset() != offset
+            or wall_clock.utcoffset() != offset
+        ):
+            return None
+        if current >= before:
+            return offset
+        current = min(current + timedelta(weeks=1), before)
+
+
+def get_simple_event_starts(
+    event: EventEntity, after: datetime, before: datetime
+) -> list[datetime] | None:
+    """繰り返しが単純なイベントの開始時刻のうち [after, before) に含まれるものを NumPy で求める
+
+    RRULE が BYxxx を含む場合、RDATE / EXDATE がある場合、期間中に UTC オフセットが
+    変わる場合は求められないので None を返し、呼び出し側で Event のメソッドにフォールバックする
+
+    Args:
+        event: 繰り返しルールを含むイベント
+        after: 範囲の始まり（タイムゾーンがない場合は UTC とみなす）
+        before: 範囲の終わり（タイムゾーンがない場合は UTC とみなす）
+
+    Returns:
+        UTC の開始時刻のリスト（event.start にタイムゾーンがない場合は naive）
+    """
+    recurrence = event.recurrence
+    if recurrence is None or recurrence.rdate or recurrence.exdate:
+        return None
+    recurrence_expander = event.get_recurrence_expander()
+    if recurrence_expander is None or not recurrence_expander.rrule.is_simple:
+        return None
+    expander = recurrence_expander.rrule
+    after = to_utc(after)
+    before = to_utc(before)
+    if before <= after:
+        return []
+    zone = expander.tzinfo or ZoneInfo("UTC")
+    offset = _get_constant_utc_offset(zone, after, before)
+    if offset is None:
+        return None
+    local_starts = expand_simple_rrule(
+        expander,
+        (after + offset).replace(tzinfo=None),
+        (before + offset).replace(tzinfo=None),
+    )
+    starts: list[datetime] = (local_starts - _to_timedelta64(offset)).tolist()
+    if event.start.tzinfo is not None:
+        return [start.replace(tzinfo=ZoneInfo("UTC")) for start in starts]
+    return starts
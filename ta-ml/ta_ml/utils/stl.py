@@ -1,7 +1,18 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 from statsmodels.tsa.seasonal import STL
 
+from ta_ml.constants import stl as stl_constants
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
 
 def stl_decompose(data: Any, period: Any, **kwargs: Any) -> tuple[Any, Any, Any]:
     stl = STL(data, period=period, **kwargs)
@@ -10,3 +21,100 @@ def stl_decompose(data: Any, period: Any, **kwargs: Any) -> tuple[Any, Any, Any]
     seasonal = result.seasonal
     residual = result.resid
     return trend, seasonal, residual
+
+
+def _get_max_workers() -> int:
+    return stl_constants.MAX_WORKERS or os.cpu_count() or 1
+
+
+def _get_executor() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # torch などのスレッドを抱えたまま fork するとデッドロックしうるので spawn を使う
+            _executor = ProcessPoolExecutor(
+                max_workers=_get_max_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def shutdown_stl_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def _decompose_chunk(
+    series: list[npt.NDArray[np.float64]], period: int
+) -> list[tuple[npt.NDArray[np.float64], ...]]:
+    results: list[tuple[npt.NDArray[np.float64], ...]] = []
+    for data in series:
+        trend, seasonal, residual = stl_decompose(data, period=period)
+        results.append((np.asarray(trend), np.asarray(seasonal), np.asarray(residual)))
+    return results
+
+
+def stl_decompose_batch(
+    values: npt.NDArray[np.float64],
+    offsets: npt.NDArray[np.int64],
+    periods: npt.NDArray[np.int64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """右詰め（先頭を NaN 埋め）された複数の系列を周期ごとにまとめて STL 分解する
+
+    系列が多い場合は周期ごとにチャンクに分けてプロセスプールで並列に分解する。
+    周期が 2 未満、または 2 周期分に満たない系列は分解できないので、
+    トレンドを元の値、季節成分と残差を 0 とする。
+
+    Args:
+        values: (系列数, 長さ) の行列
+        offsets: 各系列の値が始まる列の位置
+        periods: 各系列の STL の周期
+
+    Returns:
+        values と同じ形のトレンド、季節成分、残差の行列（値がない部分は NaN）
+    """
+    trend = np.full(values.shape, np.nan)
+    seasonal = np.full(values.shape, np.nan)
+    residual = np.full(values.shape, np.nan)
+
+    lengths = values.shape[1] - offsets
+    decomposable = (periods >= 2) & (lengths >= 2 * periods)
+    for i in np.flatnonzero(~decomposable):
+        trend[i, offsets[i] :] = values[i, offsets[i] :]
+        seasonal[i, offsets[i] :] = 0.0
+        residual[i, offsets[i] :] = 0.0
+
+    chunks = []
+    for period in np.unique(periods[decomposable]):
+        indices = np.flatnonzero(decomposable & (periods == period))
+        for start in range(0, len(indices), stl_constants.CHUNK_SIZE):
+            chunks.append(
+                (int(period), indices[start : start + stl_constants.CHUNK_SIZE])
+            )
+
+    if _get_max_workers() == 1 or np.count_nonzero(decomposable) < (
+        stl_constants.PARALLEL_THRESHOLD
+    ):
+        results = [
+            _decompose_chunk([values[i, offsets[i] :] for i in chunk], period)
+            for period, chunk in chunks
+        ]
+    else:
+        executor = _get_executor()
+        futures = [
+            executor.submit(
+                _decompose_chunk, [values[i, offsets[i] :] for i in chunk], period
+            )
+            for period, chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+
+    for (_, chunk), chunk_results in zip(chunks, results):
+        for i, (t, s, r) in zip(chunk, chunk_results):
+            trend[i, offsets[i] :] = t
+            seasonal[i, offsets[i] :] = s
+            residual[i, offsets[i] :] = r
+    return trend, seasonal, residual